@@ -0,0 +1,91 @@
+"""
+Compares two benchmark results saved by benchmarks.run, stage by stage and extractor by extractor.
+
+Usage: python -m benchmarks.compare base.json new.json [--threshold 10]
+"""
+import argparse
+import json
+import sys
+
+
+def get_change(base: float | None, new: float | None) -> float | None:
+    """
+    Gets the relative change between two values
+
+    :param base: base value
+    :param new: new value
+
+    :return: the change, in percent of the base value, None if a value is missing
+    """
+    if not base or new is None:
+        return None
+    return (new - base) / base * 100
+
+def format_change(change: float | None) -> str:
+    """
+    Formats a relative change
+
+    :param change: the change, in percent
+
+    :return: the signed change, or n/a
+    """
+    return "n/a" if change is None else f"{change:+.1f}%"
+
+def compare_results(base: dict, new: dict, threshold: float) -> list[str]:
+    """
+    Prints the throughput, p50 latency and peak memory changes of every stage, then the p50 latency change of every extractor
+
+    :param base: base benchmark results
+    :param new: new benchmark results
+    :param threshold: throughput loss or latency gain, in percent, above which a change is a regression
+
+    :return: the regressions found
+    """
+    regressions = []
+    print(f"base: {base["metadata"].get("commit")} ({base["metadata"].get("date")}), "
+          f"new: {new["metadata"].get("commit")} ({new["metadata"].get("date")})")
+    print(f"{"stage":<32}{"throughput":>12}{"p50":>10}{"peak memory":>14}")
+    for stage, new_stage in new["stages"].items():
+        base_stage = base["stages"].get(stage)
+        if base_stage is None:
+            print(f"{stage:<32}{"new stage":>12}")
+            continue
+        throughput_key = f"{new_stage["unit"]}_per_second"
+        throughput_change = get_change(base_stage.get(throughput_key), new_stage.get(throughput_key))
+        latency_change = get_change(base_stage["latency_ms"].get("p50"), new_stage["latency_ms"].get("p50"))
+        memory_change = get_change(base_stage.get("peak_memory_kib"), new_stage.get("peak_memory_kib"))
+        print(f"{stage:<32}{format_change(throughput_change):>12}{format_change(latency_change):>10}"
+              f"{format_change(memory_change):>14}")
+        if throughput_change is not None and throughput_change < -threshold:
+            regressions.append(f"{stage} throughput {format_change(throughput_change)}")
+
+        for extractor, new_latency in new_stage.get("extractors", {}).items():
+            base_latency = base_stage.get("extractors", {}).get(extractor, {})
+            extractor_change = get_change(base_latency.get("p50"), new_latency.get("p50"))
+            print(f"  {extractor:<42}{format_change(extractor_change):>10}")
+            if extractor_change is not None and extractor_change > threshold:
+                regressions.append(f"{stage} {extractor} p50 latency {format_change(extractor_change)}")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compares two benchmark results.")
+    parser.add_argument("base", help="base results JSON file")
+    parser.add_argument("new", help="new results JSON file")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="throughput loss or extractor latency gain, in percent, reported as a regression (default 10)")
+    arguments = parser.parse_args()
+
+    with open(arguments.base, "r") as file:
+        base = json.load(file)
+    with open(arguments.new, "r") as file:
+        new = json.load(file)
+    regressions = compare_results(base, new, arguments.threshold)
+    if regressions:
+        print(f"{len(regressions)} regressions above {arguments.threshold}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
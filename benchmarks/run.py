@@ -0,0 +1,372 @@
+"""
+Offline benchmark of the scraper stages, run against the frozen wiki pages of benchmarks/corpus.
+Every stage reports its throughput, its latency percentiles and its peak memory, item stages also report
+the latency percentiles of every extractor. Results are saved as JSON, to be compared with benchmarks.compare.
+
+Usage: python -m benchmarks.run [--iterations 20] [--warmup 1] [--output benchmarks/results/<commit>.json]
+"""
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+from urllib.parse import urlparse, unquote
+
+BENCHMARKS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+CORPUS_FOLDER = os.path.join(BENCHMARKS_FOLDER, "corpus")
+RESULTS_FOLDER = os.path.join(BENCHMARKS_FOLDER, "results")
+PERCENTILES = (50, 90, 95, 99)
+LOAD_DATA_ROWS = 1000
+
+
+def get_corpus_page(page_url: str) -> str | None:
+    """
+    Gets the corpus file of a wiki page
+
+    :param page_url: url of the wiki page
+
+    :return: path of the corpus file, None if the page is not in the corpus
+    """
+    if not page_url:
+        return None
+    corpus_page = os.path.join(CORPUS_FOLDER, unquote(urlparse(page_url).path).removeprefix("/wiki/") + ".html")
+    return corpus_page if os.path.exists(corpus_page) else None
+
+def get_percentiles(latencies: list[float]) -> dict:
+    """
+    Gets the latency percentiles (nearest rank), mean and max of a list of durations
+
+    :param latencies: durations, in seconds
+
+    :return: the latency statistics, in milliseconds
+    """
+    if not latencies:
+        return {}
+    latencies = sorted(latencies)
+    statistics = {f"p{percentile}": latencies[max(0, -(-len(latencies) * percentile // 100) - 1)] * 1000
+                  for percentile in PERCENTILES}
+    statistics["mean"] = sum(latencies) / len(latencies) * 1000
+    statistics["max"] = latencies[-1] * 1000
+    statistics["count"] = len(latencies)
+    return statistics
+
+def get_timed(function: Callable, latencies: list) -> Callable:
+    """
+    Wraps a function to record the duration of every call
+
+    :param function: function to time
+    :param latencies: list in which every call duration is appended, in seconds
+
+    :return: the timed function
+    """
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+    return timed
+
+@contextlib.contextmanager
+def timed_extractors(item_class: type):
+    """
+    Times every extractor of an item class (its get_* classmethods and its infobox walk) and the soup and table index
+    construction of its module while the block runs
+
+    :param item_class: ScrapedItem subclass to time
+
+    :return: the durations of every extractor call, by extractor name
+    """
+    module = sys.modules[item_class.__module__]
+    patched = []
+    extractors_latencies = {}
+    for name, attribute in vars(item_class).items():
+        if isinstance(attribute, classmethod) and name.startswith("get_"):
+            extractors_latencies[name] = []
+            patched.append((item_class, name, attribute))
+            setattr(item_class, name, classmethod(get_timed(attribute.__func__, extractors_latencies[name])))
+    for name in ("get_soup", "TableIndex"):
+        if hasattr(module, name):
+            extractors_latencies[name] = []
+            patched.append((module, name, getattr(module, name)))
+            setattr(module, name, get_timed(getattr(module, name), extractors_latencies[name]))
+    infobox = item_class.infobox
+    extractors_latencies["infobox"] = []
+    infobox.extract = get_timed(infobox.extract, extractors_latencies["infobox"])
+    try:
+        yield extractors_latencies
+    finally:
+        for owner, name, attribute in patched:
+            setattr(owner, name, attribute)
+        del infobox.extract
+
+def run_stage(unit: str, calls: list[Callable[[], int]], iterations: int, warmup: int,
+              extractors_latencies: dict | None = None) -> dict:
+    """
+    Runs the calls of a stage: once per warmup iteration, then timed for every iteration,
+    then once more under tracemalloc to measure the peak memory
+
+    :param unit: what the calls process (pages or rows)
+    :param calls: calls of the stage, each returning how many units it processed
+    :param iterations: how many timed iterations to run
+    :param warmup: how many untimed iterations to run first
+    :param extractors_latencies: durations recorded by timed extractors, if any
+
+    :return: the stage results
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            for call in calls:
+                call()
+        for latencies in (extractors_latencies or {}).values():
+            latencies.clear()
+
+        latencies = []
+        units = 0
+        for _ in range(iterations):
+            for call in calls:
+                start = time.perf_counter()
+                units += call()
+                latencies.append(time.perf_counter() - start)
+        extractors = {name: get_percentiles(extractor_latencies)
+                      for name, extractor_latencies in (extractors_latencies or {}).items()}
+
+        tracemalloc.start()
+        for call in calls:
+            call()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    results = {
+        "unit": unit,
+        "units": units,
+        "seconds": sum(latencies),
+        f"{unit}_per_second": units / sum(latencies) if sum(latencies) else None,
+        "latency_ms": get_percentiles(latencies),
+        "peak_memory_kib": peak_memory / 1024
+    }
+    if extractors:
+        results["extractors"] = extractors
+    return results
+
+def get_git_commit() -> str | None:
+    """
+    Gets the current git commit of the repository, suffixed with -dirty if the tree has uncommitted changes
+
+    :return: the short commit hash, None if git is not available
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARKS_FOLDER,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BENCHMARKS_FOLDER,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if status else commit
+
+def run_benchmarks(iterations: int, warmup: int, work_folder: str) -> dict:
+    """
+    Loads the corpus in a fresh page store and runs every stage against it
+
+    :param iterations: how many timed iterations to run per stage
+    :param warmup: how many untimed iterations to run first per stage
+    :param work_folder: folder in which the page store, cache and outputs are created
+
+    :return: the benchmark results
+    """
+    """Settings are read on import: point them to the work folder before importing the scraper"""
+    os.environ.update({
+        "SCRAPED_FOLDER": f"{work_folder}/scraped",
+        "OUTPUT_FOLDER": f"{work_folder}/output",
+        "CACHE_DATABASE": f"{work_folder}/scraped/cache.sqlite",
+        "LOG_LEVEL": "error",
+        "GENERATE_EXCEL_READY_CSV": "False",
+        "PARSING_PROCESSES": "1"
+    })
+    for name, value in (("GLOBAL_CACHE_EXPIRATION_IN_HOURS", "24"), ("VEHICLES_CACHE_EXPIRATION_IN_HOURS", "168"),
+                        ("APARTMENTS_CACHE_EXPIRATION_IN_HOURS", "168")):
+        os.environ.setdefault(name, value)
+    os.makedirs(f"{work_folder}/output", exist_ok=True)
+    os.chdir(work_folder)
+
+    import requests
+    from requests.adapters import BaseAdapter
+
+    from src.classes.apartments.apartment import Apartment
+    from src.classes.apartments.apartments_list import ApartmentsList
+    from src.classes.shared.cache import Cache
+    from src.classes.shared.page_store import PageStore
+    from src.classes.vehicles.vehicle import Vehicle
+    from src.classes.vehicles.vehicles_list import VehiclesList
+    from src.functions.extract import HTML_PARSER, get_http_session, get_soup
+    from src.functions.load import SINKS
+    from src.functions.logs import configure_logging
+    from src.settings import VEHICLES_PAGE_URL, VEHICLES_PAGE_OUTPUT, VEHICLES_FIELDNAMES, VEHICLES_SCHEMA, \
+        APARTMENTS_PAGE_URL, APARTMENTS_PAGE_OUTPUT, APARTMENTS_FIELDNAMES, APARTMENTS_SCHEMA, OUTPUT_FOLDER
+
+    class OfflineAdapter(BaseAdapter):
+        """Fails every request: the benchmarks only read the corpus."""
+        def send(self, request, *args, **kwargs):
+            raise requests.ConnectionError(f"The benchmarks run offline, {request.url} was requested")
+
+        def close(self):
+            pass
+
+    configure_logging()
+    get_http_session().mount("http://", OfflineAdapter())
+    get_http_session().mount("https://", OfflineAdapter())
+
+    """Load the list pages in the page store, then the pages of the listed items that are in the corpus"""
+    def store_page(corpus_page: str, page_name: str) -> None:
+        with open(corpus_page, "rb") as file:
+            PageStore.write_page(page_name, [file.read()], {})
+
+    def keep_corpus_entries(scraped_list, list_name: str) -> None:
+        """Keep the entries whose page is in the corpus, and the first entry without a page of every category"""
+        pageless_categories = set()
+        entries = []
+        for entry in scraped_list.list[list_name]:
+            if not entry["page url"] and entry.get("category") not in pageless_categories:
+                pageless_categories.add(entry.get("category"))
+                entries.append(entry)
+            elif get_corpus_page(entry["page url"]):
+                entries.append(entry)
+        scraped_list.list[list_name] = entries
+        scraped_list.items_to_scrape = set()
+
+    store_page(get_corpus_page(VEHICLES_PAGE_URL), VEHICLES_PAGE_OUTPUT)
+    store_page(get_corpus_page(APARTMENTS_PAGE_URL), APARTMENTS_PAGE_OUTPUT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles_list = VehiclesList(VEHICLES_PAGE_URL, VEHICLES_PAGE_OUTPUT)
+        vehicles_list.extract_list()
+        apartments_list = ApartmentsList(APARTMENTS_PAGE_URL, APARTMENTS_PAGE_OUTPUT)
+        apartments_list.extract_list()
+    vehicles = [vehicle for vehicle in vehicles_list.get_items() if get_corpus_page(vehicle.page_url)]
+    apartments = [apartment for apartment in apartments_list.get_items() if get_corpus_page(apartment.page_url)]
+    for item in vehicles + apartments:
+        store_page(get_corpus_page(item.page_url), item.get_scraped_page_filename())
+
+    soup_pages = [(VEHICLES_PAGE_OUTPUT, VehiclesList.parse_profile), (APARTMENTS_PAGE_OUTPUT, ApartmentsList.parse_profile)]
+    soup_pages += list({item.get_scraped_page_filename(): (item.get_scraped_page_filename(), item.parse_profile)
+                        for item in vehicles + apartments}.values())
+
+    def get_soup_call(page_name, parse_profile, use_profile: bool) -> Callable[[], int]:
+        return lambda: get_soup(page_name, parse_profile if use_profile else None) and 1
+
+    def get_extract_list_call(scraped_list) -> Callable[[], int]:
+        return lambda: scraped_list.extract_list() or scraped_list.list["items"]
+
+    def get_item_data_call(item) -> Callable[[], int]:
+        return lambda: copy.copy(item).get_item_data() or 1
+
+    stages = {}
+    stages["get_soup"] = run_stage("pages", [get_soup_call(*page, True) for page in soup_pages], iterations, warmup)
+    stages["get_soup (whole page)"] = run_stage("pages", [get_soup_call(*page, False) for page in soup_pages], iterations, warmup)
+    stages["VehiclesList.extract_list"] = run_stage("rows", [get_extract_list_call(vehicles_list)], iterations, warmup)
+    stages["ApartmentsList.extract_list"] = run_stage("rows", [get_extract_list_call(apartments_list)], iterations, warmup)
+    with timed_extractors(Vehicle) as extractors_latencies:
+        stages["Vehicle.get_item_data"] = run_stage(
+            "pages", [get_item_data_call(vehicle) for vehicle in vehicles], iterations, warmup, extractors_latencies)
+    with timed_extractors(Apartment) as extractors_latencies:
+        stages["Apartment.get_item_data"] = run_stage(
+            "pages", [get_item_data_call(apartment) for apartment in apartments], iterations, warmup, extractors_latencies)
+
+    """
+    Write LOAD_DATA_ROWS records per list with every available sink, the records being built by the lists
+    from the corpus items, which are all stored and up to date
+    """
+    keep_corpus_entries(vehicles_list, "vehicles")
+    keep_corpus_entries(apartments_list, "apartments")
+    Cache.set_checked_timestamp("vehicles_check_timestamp")
+    Cache.set_checked_timestamp("apartments_check_timestamp")
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles_records = list(vehicles_list.iter_records())
+        apartments_records = list(apartments_list.iter_records())
+    outputs = (("vehicles", vehicles_records, VEHICLES_FIELDNAMES, VEHICLES_SCHEMA),
+               ("apartments", apartments_records, APARTMENTS_FIELDNAMES, APARTMENTS_SCHEMA))
+    for output_format, sink_class in SINKS.items():
+        if not sink_class.is_available():
+            continue
+
+        def get_load_data_call(output_name, records, fieldnames, schema) -> Callable[[], int]:
+            rows = [records[index % len(records)] for index in range(LOAD_DATA_ROWS)]
+            def call():
+                with sink_class(f"{OUTPUT_FOLDER}/{output_name}.{sink_class.extension}", fieldnames, schema) as sink:
+                    for row in rows:
+                        sink.write(row)
+                return len(rows)
+            return call
+
+        stages[f"load_data ({output_format})"] = run_stage(
+            "rows", [get_load_data_call(*output) for output in outputs], iterations, warmup)
+
+    return {
+        "metadata": {
+            "commit": get_git_commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "html_parser": HTML_PARSER,
+            "iterations": iterations,
+            "warmup": warmup,
+            "corpus_pages": len(os.listdir(CORPUS_FOLDER)),
+            "vehicles_pages": len(vehicles),
+            "apartments_pages": len(apartments)
+        },
+        "stages": stages
+    }
+
+def print_results(results: dict) -> None:
+    """
+    Prints a summary of the benchmark results
+
+    :param results: the benchmark results
+    """
+    print(f"{"stage":<32}{"throughput":>20}{"p50 ms":>10}{"p90 ms":>10}{"p99 ms":>10}{"peak KiB":>12}")
+    for stage, stage_results in results["stages"].items():
+        throughput = f"{stage_results[f"{stage_results["unit"]}_per_second"]:.1f} {stage_results["unit"]}/s"
+        latency = stage_results["latency_ms"]
+        print(f"{stage:<32}{throughput:>20}{latency["p50"]:>10.3f}{latency["p90"]:>10.3f}{latency["p99"]:>10.3f}"
+              f"{stage_results["peak_memory_kib"]:>12.1f}")
+        for extractor, extractor_latency in stage_results.get("extractors", {}).items():
+            if extractor_latency:
+                print(f"  {extractor:<50}{extractor_latency["p50"]:>10.3f}{extractor_latency["p90"]:>10.3f}"
+                      f"{extractor_latency["p99"]:>10.3f}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Runs the scraper benchmarks offline, against the frozen corpus.")
+    parser.add_argument("--iterations", type=int, default=20, help="timed iterations per stage (default 20)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed iterations per stage (default 1)")
+    parser.add_argument("--output", help="results JSON file (default benchmarks/results/<commit>.json)")
+    arguments = parser.parse_args()
+
+    """Resolve the output path before moving to the work folder"""
+    output = os.path.abspath(arguments.output) if arguments.output else None
+    sys.path.insert(0, os.path.dirname(BENCHMARKS_FOLDER))
+    with tempfile.TemporaryDirectory(prefix="gta-wiki-scraper-benchmarks-") as work_folder:
+        current_folder = os.getcwd()
+        try:
+            results = run_benchmarks(arguments.iterations, arguments.warmup, work_folder)
+        finally:
+            os.chdir(current_folder)
+
+    print_results(results)
+    if output is None:
+        output = os.path.join(RESULTS_FOLDER, f"{results["metadata"]["commit"] or datetime.now().strftime("%Y%m%d-%H%M%S")}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Benchmark results saved : {output}")
+
+
+if __name__ == "__main__":
+    main()
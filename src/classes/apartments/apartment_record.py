@@ -0,0 +1,54 @@
+import sys
+
+from src.classes.shared.record import Record
+
+
+class ApartmentRecord(Record):
+    """
+    A class to represent the typed data of an apartment.
+
+    Attributes
+    ----------
+    category: str
+        Category of the apartment, from the apartments list.
+    style: str
+        The apartment's style.
+    garage_capacity: int
+        The number of vehicles the apartment's garage can contain.
+    price: int
+        The price of the apartment, from the apartments list.
+    notes: str
+        The notes of the apartments list about the apartment.
+    """
+    __slots__ = ("category", "style", "garage_capacity", "price", "notes")
+    columns = {
+        **Record.columns,
+        "category": "category",
+        "style": "style",
+        "garage capacity": "garage_capacity",
+        "price": "price",
+        "notes": "notes"
+    }
+    interned_fields = ("category", "style")
+
+    def __init__(self, name: str, page_url: str | None, category: str, price: int, notes: str) -> None:
+        """
+        Constructs all the necessary attributes for the ApartmentRecord object, from the apartments list.
+
+        :param name: str
+            Name of the apartment.
+        :param page_url: str
+            Url of the apartment's page, None if it has none.
+        :param category: str
+            Category of the apartment.
+        :param price: int
+            The price of the apartment.
+        :param notes: str
+            The notes of the apartments list about the apartment.
+        """
+        super().__init__(name, page_url)
+        self.category: str | None = sys.intern(category) if category else None
+        self.style: str | None = None
+        self.garage_capacity: int | None = None
+        self.price: int | None = price
+        self.notes: str | None = notes or None
@@ -1,11 +1,19 @@
+import logging
 import re
+from typing import Iterator
+
+from bs4 import SoupStrainer
 
 from src.functions.extract import get_soup
+from src.functions.pipeline import iter_extracted_items
 from src.classes.apartments.apartment import Apartment
+from src.classes.apartments.apartment_record import ApartmentRecord
 from src.classes.shared.cache import Cache
 from src.classes.shared.scraped_list import ScrapedList
-from src.settings import LOG_LEVEL, GENERATE_EXCEL_READY_CSV, EXCEL_HYPERLINK_FORMAT, \
-    APARTMENTS_PAGE_OUTPUT, APARTMENTS_CACHE_EXPIRATION_IN_HOURS
+from src.settings import APARTMENTS_PAGE_URL, APARTMENTS_PAGE_OUTPUT, APARTMENTS_OUTPUT, APARTMENTS_FIELDNAMES, APARTMENTS_SCHEMA, \
+    APARTMENTS_CACHE_EXPIRATION_IN_HOURS
+
+logger = logging.getLogger(__name__)
 
 
 class ApartmentsList(ScrapedList):
@@ -25,12 +33,25 @@ class ApartmentsList(ScrapedList):
     -------
     extract_list()
         Extracts the list of items from the url.
-    extract_data()
-        Extracts individual data for every item in the list.
+    get_items()
+        Creates an apartment for every entry of the list.
+    iter_records()
+        Extracts individual data for every item in the list, yielding every finished record.
     get_normalized_price()
         Returns a normalized int price from a string
     """
 
+    """Classes are matched as a whole string while parsing: match wikitable among the other table classes"""
+    parse_profile = SoupStrainer("table", class_=re.compile(r"\bwikitable\b"))
+    list_name = "apartments"
+    list_page_url = APARTMENTS_PAGE_URL
+    list_page_output = APARTMENTS_PAGE_OUTPUT
+    output_name = APARTMENTS_OUTPUT
+    fieldnames = APARTMENTS_FIELDNAMES
+    schema = APARTMENTS_SCHEMA
+    check_timestamp_name = "apartments_check_timestamp"
+    cache_expiration_in_hours = APARTMENTS_CACHE_EXPIRATION_IN_HOURS
+
     def __init__(self, page_url: str, output_file: str):
         """
         Constructs all the necessary attributes for the ApartmentsList object.
@@ -50,27 +71,27 @@ class ApartmentsList(ScrapedList):
         }
 
         """Extract every list from the soup"""
-        soup = get_soup(APARTMENTS_PAGE_OUTPUT)
+        soup = get_soup(self.output_file, self.parse_profile)
         extracted_lists = soup.find_all("table", class_="wikitable")
 
         """For each list, extract the apartment category from the header"""
         items = 0
         for extracted_list in extracted_lists:
             apartment_header = extracted_list.find(string=re.compile(r"apartment", re.I))
-            apartment_category = apartment_header.replace("List of ", "").replace("\\n", "")
+            apartment_category = apartment_header.replace("List of ", "").strip()
             apartments_rows = extracted_list.find_all("tr")
 
             """For each apartment, extract the data"""
             i = 2
             while i < len(apartments_rows):
                 apartment_cells = apartments_rows[i].find_all("td")
-                apartment_address = apartment_cells[0].get_text().replace("\\n", "")
+                apartment_address = apartment_cells[0].get_text().strip()
                 apartment_page = ""
                 if apartment_cells[0].find("a"):
                     apartment_page = "https://gta.fandom.com" + apartment_cells[0].find("a").get("href")
-                apartment_price = apartment_cells[1].get_text().replace("\\n", "")
+                apartment_price = apartment_cells[1].get_text().strip()
                 apartment_price = self.get_normalized_price(apartment_price)
-                apartment_notes = apartment_cells[2].get_text().replace("\\n", "")
+                apartment_notes = apartment_cells[2].get_text().strip()
                 apartments["apartments"].append({
                     "name": apartment_address,
                     "page url": apartment_page,
@@ -83,65 +104,55 @@ class ApartmentsList(ScrapedList):
 
         """
         Store the number of items and the extracted data in the list
-        Check if the previous number of items was different, in which case force rescraping the items pages
+        Check which items are new or modified since the previous list, in which case their pages need scraping
         Store the new number of items in the cache
         """
         apartments["items"] = items
         self.list = apartments
-        if LOG_LEVEL == "debug": print(f"extracted list: {apartments}")
-        Cache.check_for_differences("apartments", self.list['items'])
+        logger.debug("Extracted list: %s", apartments)
+        self.entries = {apartment["name"]: apartment["page url"] for apartment in self.list["apartments"]}
+        self.items_to_scrape = Cache.check_for_differences("apartments", self.entries)
         Cache.set_list_items("apartments", self.list['items'])
 
-    def extract_data(self) -> None:
-        """Extracts individual data for every item in the list."""
-        if Cache.is_refresh_needed("apartments_check_timestamp", APARTMENTS_CACHE_EXPIRATION_IN_HOURS):
-            print("Apartments cache is outdated, let's go scraping...")
+    def get_items(self) -> Iterator[Apartment]:
+        """Creates an apartment for every entry of the list, one at a time."""
+        return (Apartment(item["name"], item["page url"], item["category"], item["price"], item["notes"])
+                for item in self.list["apartments"])
+
+    def iter_records(self) -> Iterator[ApartmentRecord]:
+        """Extracts individual data for every item in the list, yielding every record as soon as it is finished."""
+        if Cache.is_refresh_needed(self.check_timestamp_name, self.cache_expiration_in_hours):
+            logger.info("Apartments cache is outdated, let's go scraping...")
             refresh = True
         else:
-            print("Apartments cache is still up to date, working with it...")
+            logger.info("Apartments cache is still up to date, working with it...")
             refresh = False
 
+        """Check which apartment pages need scraping"""
+        pages = self.get_pages_to_scrape(self.get_items(), refresh)
+
         """
-        For each apartment in the list, if it has a page, extract and store the full data
-        If it doesn't, use the previous apartment of the same category garage capacity as an extrapolation
+        For each apartment in the list, if it has a page, extract the full data batch by batch
+        If it doesn't, or if its garage capacity is unknown, use the previous apartment of the same category
+        garage capacity as an extrapolation, if there is one
         """
-        apartments_list = []
         apartments_garage_capacity = {}
-        for item in self.list["apartments"]:
-            print(f"Processing {item["name"]}...")
-            if LOG_LEVEL == "info": print(f"Page: {item["link"]}")
-
-            apartment = Apartment(item["name"], item["page url"], item["price"])
-
-            if item["page url"]:
-                apartment.get_item_data(refresh)
-            if (not item["page url"] and apartments_garage_capacity.get(item["category"])) or apartment.garage_capacity is None:
-                apartment.garage_capacity = apartments_garage_capacity[item["category"]]
-            apartments_garage_capacity[item["category"]] = apartment.garage_capacity
-
-            """If asked to generate an excel-compatible csv, modify the links"""
-            if GENERATE_EXCEL_READY_CSV:
-                page_url = "=[BATCH_DELETE_THIS]" + EXCEL_HYPERLINK_FORMAT + "(\"" + apartment.page_url + "\";\"" + apartment.name + "\")"
-                image_url = "=[BATCH_DELETE_THIS]" + EXCEL_HYPERLINK_FORMAT + "(\"" + apartment.image_url + "\";\"" + apartment.name + "\")"
-            else:
-                page_url = apartment.page_url
-                image_url = apartment.image_url
-
-            apartments_list.append({
-                "name": item["name"],
-                "page url": page_url,
-                "image url": image_url,
-                "category": item["category"],
-                "style": apartment.style,
-                "garage capacity": apartment.garage_capacity,
-                "price": item["price"],
-                "notes": item["notes"]
-            })
-
-        """Store the data and update the cache timestamp"""
-        self.list["apartments"] = apartments_list
-        print("All apartments data extracted!")
-        Cache.set_checked_timestamp("apartments_check_timestamp")
+        for apartment in iter_extracted_items(self.get_items(), pages, self.revisions_ids, self.failed_items):
+            record = apartment.record
+            logger.info("Processing %s...", record.name)
+            logger.debug("Page: %s", record.page_url)
+            previous_garage_capacity = apartments_garage_capacity.get(record.category)
+            if (not record.page_url or record.garage_capacity is None) and previous_garage_capacity is not None:
+                record.garage_capacity = previous_garage_capacity
+            apartments_garage_capacity[record.category] = record.garage_capacity
+
+            logger.debug("Record: %s", record)
+            yield record
+
+        """Update the cache timestamp once every apartment is extracted"""
+        logger.info("All apartments data extracted!")
+        self.save_entries()
+        Cache.set_checked_timestamp(self.check_timestamp_name)
 
     @classmethod
     def get_normalized_price(cls, price: str) -> int:
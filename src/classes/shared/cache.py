@@ -1,14 +1,167 @@
+import dbm
+import json
+import logging
+import os
 import shelve
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Iterator
 
-from src.settings import LOG_LEVEL
+from src.settings import CACHE_DATABASE, LEGACY_CACHE_FILE, PAGE_STORE_FOLDER
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS timestamps (
+        name TEXT PRIMARY KEY,
+        checked_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS lists (
+        name TEXT PRIMARY KEY,
+        items INTEGER NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS list_entries (
+        list_name TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        page_url TEXT NOT NULL,
+        PRIMARY KEY (list_name, item_name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS pages (
+        name TEXT PRIMARY KEY,
+        hash TEXT,
+        etag TEXT,
+        last_modified TEXT,
+        revision_id INTEGER
+    )""",
+    "CREATE INDEX IF NOT EXISTS pages_hash ON pages (hash)",
+    """CREATE TABLE IF NOT EXISTS records (
+        list_name TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        page_url TEXT NOT NULL,
+        record TEXT NOT NULL,
+        PRIMARY KEY (list_name, item_name, page_url)
+    )""",
+)
 
 
 class Cache:
-    """Contains all the cache methods."""
+    """
+    Contains all the cache methods.
+    The cache is a SQLite database (WAL mode, so several processes can use it at the same time) opened once per process.
+    """
+    connection: sqlite3.Connection | None = None
+    connection_pid: int | None = None
+    lock = threading.RLock()
+    transaction_depth: int = 0
+
     def __init__(self):
         pass
 
+    @classmethod
+    def get_connection(cls) -> sqlite3.Connection:
+        """
+        Gets the connection to the cache database of the current process, opening it and creating or migrating
+        the database the first time.
+
+        :returns: The cache database connection
+        """
+        with cls.lock:
+            if cls.connection is None or cls.connection_pid != os.getpid():
+                os.makedirs(os.path.dirname(CACHE_DATABASE) or ".", exist_ok=True)
+                connection = sqlite3.connect(CACHE_DATABASE, timeout=30, isolation_level=None, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                cls.connection = connection
+                cls.connection_pid = os.getpid()
+                cls.transaction_depth = 0
+                cls.create_database()
+            return cls.connection
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the statements of a block in a single transaction, committed at the end of the block
+        or rolled back if the block raises.
+        A transaction opened inside another one is part of it.
+
+        :returns: The cache database connection
+        """
+        with cls.lock:
+            connection = cls.get_connection()
+            if cls.transaction_depth:
+                cls.transaction_depth += 1
+                try:
+                    yield connection
+                finally:
+                    cls.transaction_depth -= 1
+                return
+            connection.execute("BEGIN IMMEDIATE")
+            cls.transaction_depth = 1
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            else:
+                connection.execute("COMMIT")
+            finally:
+                cls.transaction_depth = 0
+
+    @classmethod
+    def create_database(cls) -> None:
+        """Creates the cache tables if needed, then migrates the data of the previous cache versions once."""
+        connection = cls.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in SCHEMA:
+                connection.execute(statement)
+            if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                cls.migrate_legacy_cache(connection)
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @classmethod
+    def migrate_legacy_cache(cls, connection: sqlite3.Connection) -> None:
+        """
+        Imports the previous cache versions: the shelve cache file and the page store JSON index.
+
+        :param connection: sqlite3.Connection
+            The cache database connection, in a transaction.
+        """
+        if dbm.whichdb(LEGACY_CACHE_FILE):
+            logger.info("Migrating the legacy cache %s", LEGACY_CACHE_FILE)
+            with shelve.open(LEGACY_CACHE_FILE, flag='r') as legacy_cache:
+                for key in legacy_cache:
+                    value = legacy_cache[key]
+                    if key.endswith("_timestamp"):
+                        connection.execute("INSERT OR REPLACE INTO timestamps VALUES (?, ?)", (key, float(value)))
+                    elif key.endswith("_entries"):
+                        connection.executemany("INSERT OR REPLACE INTO list_entries VALUES (?, ?, ?)",
+                                               [(key.removesuffix("_entries"), name, page_url) for name, page_url in value.items()])
+                    elif isinstance(value, int):
+                        connection.execute("INSERT OR REPLACE INTO lists VALUES (?, ?)", (key, value))
+
+        legacy_index = f"{PAGE_STORE_FOLDER}/index.json"
+        if os.path.exists(legacy_index):
+            logger.info("Migrating the legacy page store index %s", legacy_index)
+            with open(legacy_index, "r") as file:
+                index = json.load(file)
+            connection.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)", [(
+                name,
+                entry.get("hash"),
+                entry.get("metadata", {}).get("etag"),
+                entry.get("metadata", {}).get("last_modified"),
+                entry.get("metadata", {}).get("revision_id")
+            ) for name, entry in index.items()])
+            os.remove(legacy_index)
+
     @classmethod
     def set_checked_timestamp(cls, timestamp_name: str, force_refresh: bool = False) -> None:
         """
@@ -18,11 +171,28 @@ class Cache:
         :param force_refresh: bool
             Force reinitialization of the timestamp
         """
-        with shelve.open("cache", flag='c', protocol=None, writeback=False) as cache:
-            if force_refresh:
-                cache[timestamp_name] = 0
-            else:
-                cache[timestamp_name] = str(datetime.now().timestamp())
+        with cls.transaction() as connection:
+            connection.execute("INSERT OR REPLACE INTO timestamps VALUES (?, ?)",
+                               (timestamp_name, 0 if force_refresh else datetime.now().timestamp()))
+
+    @classmethod
+    def get_next_refresh_time(cls, timestamp_name: str, cache_expiration: int) -> float:
+        """
+        Gets when a rescraping will be needed
+
+        :param timestamp_name: str
+            The cache timestamp to check
+        :param cache_expiration: int
+            The cache duration to check against
+
+        :returns: The POSIX timestamp after which a rescraping is needed, 0 if it was never checked
+        """
+        with cls.lock:
+            row = cls.get_connection().execute(
+                "SELECT checked_at FROM timestamps WHERE name = ?", (timestamp_name,)).fetchone()
+        if row is None:
+            return 0
+        return row[0] + cache_expiration * 3600
 
     @classmethod
     def is_refresh_needed(cls, timestamp_name: str, cache_expiration: int) -> bool:
@@ -34,15 +204,8 @@ class Cache:
         :param cache_expiration: int
             The cache duration to check against
         """
-        with shelve.open("cache") as cache:
-            try:
-                if (float(cache[timestamp_name]) + cache_expiration * 3600) < datetime.now().timestamp():
-                    return True
-                else:
-                    return False
-            except KeyError:
-                cache[timestamp_name] = 0
-                return True
+        next_refresh_time = cls.get_next_refresh_time(timestamp_name, cache_expiration)
+        return next_refresh_time == 0 or next_refresh_time < datetime.now().timestamp()
 
     @classmethod
     def reset_timestamps(cls) -> None:
@@ -61,8 +224,8 @@ class Cache:
         :param items: int
             The number of items to set in cache
         """
-        with shelve.open("cache", flag='c', protocol=None, writeback=False) as cache:
-            cache[list_name] = items
+        with cls.transaction() as connection:
+            connection.execute("INSERT OR REPLACE INTO lists VALUES (?, ?)", (list_name, items))
 
     @classmethod
     def get_list_items(cls, list_name:str) -> int:
@@ -72,24 +235,143 @@ class Cache:
         :param list_name: str
             The list for which to get the items count
         """
-        with shelve.open("cache", flag='c', protocol=None, writeback=False) as cache:
-            try:
-                return cache[list_name]
-            except KeyError:
-                cache[list_name] = 0
-                return 0
+        with cls.lock:
+            row = cls.get_connection().execute("SELECT items FROM lists WHERE name = ?", (list_name,)).fetchone()
+        return row[0] if row else 0
+
+    @classmethod
+    def set_list_entries(cls, list_name: str, entries: dict) -> None:
+        """
+        Sets the entries (name and page url) of a list in the cache
+
+        :param list_name: str
+            The list for which to set the entries
+        :param entries: dict
+            The page url of every item of the list, by item name
+        """
+        with cls.transaction() as connection:
+            connection.execute("DELETE FROM list_entries WHERE list_name = ?", (list_name,))
+            connection.executemany("INSERT INTO list_entries VALUES (?, ?, ?)",
+                                   [(list_name, name, page_url) for name, page_url in entries.items()])
 
     @classmethod
-    def check_for_differences(cls, checked_item: str, items_count: int) -> None:
+    def get_list_entries(cls, list_name: str) -> dict:
         """
-        check if the newly extracted list has the same number of items than the one stored in cache.
-        If not, overrides the refresh timer to trigger a full scraping again.
+        Gets the entries (name and page url) of a list in the cache
 
-        :param checked_item: str
-            The item count to go check in the cache.
-        :param items_count: int
-            The item count to compare it with.
+        :param list_name: str
+            The list for which to get the entries
+        """
+        with cls.lock:
+            return dict(cls.get_connection().execute(
+                "SELECT item_name, page_url FROM list_entries WHERE list_name = ?", (list_name,)).fetchall())
+
+    @classmethod
+    def check_for_differences(cls, list_name: str, entries: dict) -> set:
+        """
+        Compares the newly extracted list with the one stored in cache.
+        The new list is not stored here: the list stores it once the pages of its items are fetched (set_list_entries),
+        so that the items of an interrupted run are still seen as new or modified by the next one.
+
+        :param list_name: str
+            The list to go check in the cache.
+        :param entries: dict
+            The page url of every item of the newly extracted list, by item name.
+
+        :returns: The names of the items that were added or whose page url changed, which need to be scraped
+        """
+        cached_entries = cls.get_list_entries(list_name)
+        changed_items = {name for name, page_url in entries.items() if cached_entries.get(name) != page_url}
+        logger.debug("List %s changes: %s new or modified, %s removed",
+                     list_name, len(changed_items), len(cached_entries.keys() - entries.keys()))
+        return changed_items
+
+    @classmethod
+    def get_page(cls, page_name: str) -> dict | None:
+        """
+        Gets the metadata of a page of the page store
+
+        :param page_name: str
+            The index key of the page.
+
+        :returns: The page content hash and validators, None if the page is unknown
+        """
+        with cls.lock:
+            row = cls.get_connection().execute(
+                "SELECT hash, etag, last_modified, revision_id FROM pages WHERE name = ?", (page_name,)).fetchone()
+        if row is None:
+            return None
+        return {"hash": row[0], "etag": row[1], "last_modified": row[2], "revision_id": row[3]}
+
+    @classmethod
+    def set_page(cls, page_name: str, page_hash: str | None, metadata: dict) -> str | None:
+        """
+        Sets the metadata of a page of the page store
+
+        :param page_name: str
+            The index key of the page.
+        :param page_hash: str
+            The page content hash.
+        :param metadata: dict
+            The page validators (etag and last_modified) and wiki revision id.
+
+        :returns: The previous content hash of the page
+        """
+        with cls.transaction() as connection:
+            row = connection.execute("SELECT hash FROM pages WHERE name = ?", (page_name,)).fetchone()
+            connection.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)", (
+                page_name, page_hash, metadata.get("etag"), metadata.get("last_modified"), metadata.get("revision_id")))
+        return row[0] if row else None
+
+    @classmethod
+    def is_page_hash_used(cls, page_hash: str) -> bool:
+        """
+        Checks if a page content is used by a page of the page store
+
+        :param page_hash: str
+            The page content hash.
+        """
+        with cls.lock:
+            return cls.get_connection().execute(
+                "SELECT 1 FROM pages WHERE hash = ? LIMIT 1", (page_hash,)).fetchone() is not None
+
+    @classmethod
+    def get_pages_hashes(cls) -> dict:
+        """
+        Gets the content hash of every page of the page store
+
+        :returns: The content hashes, by page name
+        """
+        with cls.lock:
+            return dict(cls.get_connection().execute("SELECT name, hash FROM pages ORDER BY name").fetchall())
+
+    @classmethod
+    def get_records(cls, list_name: str) -> dict:
+        """
+        Gets the records of a list written by the previous run
+
+        :param list_name: str
+            The list for which to get the records
+
+        :returns: The records, by (item name, page url)
+        """
+        with cls.lock:
+            rows = cls.get_connection().execute(
+                "SELECT item_name, page_url, record FROM records WHERE list_name = ?", (list_name,)).fetchall()
+        return {(name, page_url): json.loads(record) for name, page_url, record in rows}
+
+    @classmethod
+    def set_records(cls, list_name: str, records: dict) -> None:
+        """
+        Replaces the records of a list by the ones written by the current run
+
+        :param list_name: str
+            The list for which to set the records
+        :param records: dict
+            The records, by (item name, page url)
         """
-        if cls.get_list_items(checked_item) != items_count:
-            if LOG_LEVEL == "debug": print(f"List is different than the cached one, refresh it")
-            Cache.set_checked_timestamp("apartments_check_timestamp", force_refresh=True)
\ No newline at end of file
+        with cls.transaction() as connection:
+            connection.execute("DELETE FROM records WHERE list_name = ?", (list_name,))
+            connection.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                                   [(list_name, name, page_url, json.dumps(record))
+                                    for (name, page_url), record in records.items()])
@@ -0,0 +1,143 @@
+import logging
+import time
+from datetime import datetime
+
+from src.classes.shared.cache import Cache
+from src.classes.shared.fingerprint import Fingerprint
+from src.classes.shared.metrics import Metrics
+from src.classes.shared.page_store import PageStore
+from src.classes.shared.scraped_list import ScrapedList
+from src.classes.sinks.change_feed_sink import ChangeFeedSink
+from src.functions.load import load_data
+from src.functions.orchestrate import refresh_list_pages, run_each_list
+from src.settings import GLOBAL_CACHE_EXPIRATION_IN_HOURS, DAEMON_MAX_SLEEP_IN_MINUTES, \
+    METRICS_JSON_OUTPUT, METRICS_PROMETHEUS_OUTPUT, OUTPUT_FORMATS
+
+logger = logging.getLogger(__name__)
+
+
+class Daemon:
+    """
+    A class to represent a long-running scraper, refreshing every list when its cache expires.
+    The extracted lists and their last records are kept in memory between runs: a list page is only parsed again
+    when its content changed, and the outputs of a list are only rewritten when its records changed
+    (its change feed is then written again, empty).
+
+    Attributes
+    ----------
+    scraped_lists: tuple
+        ScrapedList subclasses of the lists to refresh.
+    lists: dict
+        The extracted lists, by ScrapedList subclass.
+    lists_pages_hashes: dict
+        The content hash of the page every list was extracted from, by ScrapedList subclass.
+    records: dict
+        The records last written for every list, by ScrapedList subclass.
+
+    Methods
+    -------
+    run_forever()
+        Runs every due list, then sleeps until the next one is due, until interrupted.
+    run_once()
+        Refreshes the list pages if needed, then runs every due list at the same time.
+    is_list_due(scraped_list_class)
+        Checks if a list needs to run.
+    run_list(scraped_list_class)
+        Runs a list, writing its outputs only if its records changed.
+    get_next_run_time()
+        Gets when the next list is due.
+    """
+    def __init__(self, scraped_lists: tuple[type[ScrapedList], ...]) -> None:
+        """
+        Constructs all the necessary attributes for the Daemon object.
+
+        :param scraped_lists: tuple
+            ScrapedList subclasses of the lists to refresh.
+        """
+        self.scraped_lists: tuple[type[ScrapedList], ...] = scraped_lists
+        self.lists: dict = {}
+        self.lists_pages_hashes: dict = {}
+        self.records: dict = {}
+
+    def run_forever(self) -> None:
+        """Runs every due list, writes the metrics, then sleeps until the next list is due, until interrupted."""
+        while True:
+            try:
+                with Metrics.timer("run"):
+                    self.run_once()
+            except Exception as error:
+                logger.warning("Run failed (%s), retrying at the next check", error)
+            Metrics.write(METRICS_JSON_OUTPUT, METRICS_PROMETHEUS_OUTPUT)
+
+            """
+            Wake up when the next list is due, and at least every DAEMON_MAX_SLEEP_IN_MINUTES
+            A list still due after its run failed is retried after a minute
+            """
+            now = datetime.now().timestamp()
+            next_run_time = min(max(self.get_next_run_time(), now + 60), now + DAEMON_MAX_SLEEP_IN_MINUTES * 60)
+            logger.info("Next check at %s", datetime.fromtimestamp(next_run_time).isoformat(timespec="seconds"))
+            time.sleep(next_run_time - now)
+
+    def run_once(self) -> None:
+        """Refreshes the list pages if the global cache is outdated, then runs every due list at the same time."""
+        refresh_list_pages(self.scraped_lists)
+        due_lists = tuple(scraped_list_class for scraped_list_class in self.scraped_lists if self.is_list_due(scraped_list_class))
+        if not due_lists:
+            logger.info("Every list is still up to date")
+            return
+        Fingerprint.clear()
+        run_each_list(self.run_list, due_lists)
+        Fingerprint.save(self.scraped_lists)
+
+    def is_list_due(self, scraped_list_class: type[ScrapedList]) -> bool:
+        """
+        Checks if a list needs to run: if it never ran, if its page changed or if its items cache is outdated.
+
+        :param scraped_list_class: type[ScrapedList]
+            ScrapedList subclass of the list.
+        """
+        return (scraped_list_class not in self.records
+                or PageStore.get_page_hash(scraped_list_class.list_page_output) != self.lists_pages_hashes.get(scraped_list_class)
+                or Cache.is_refresh_needed(scraped_list_class.check_timestamp_name, scraped_list_class.cache_expiration_in_hours))
+
+    def run_list(self, scraped_list_class: type[ScrapedList]) -> None:
+        """
+        Runs a list: extracts it again if its page changed, then extracts the data of its items
+        and writes it in every output format if it differs from the last written one,
+        otherwise only the change feed is written again, empty.
+
+        :param scraped_list_class: type[ScrapedList]
+            ScrapedList subclass of the list.
+        """
+        with Metrics.timer("list_run", list=scraped_list_class.list_name):
+            page_hash = PageStore.get_page_hash(scraped_list_class.list_page_output)
+            scraped_list = self.lists.get(scraped_list_class)
+            if scraped_list is None or page_hash != self.lists_pages_hashes.get(scraped_list_class):
+                scraped_list = scraped_list_class(scraped_list_class.list_page_url, scraped_list_class.list_page_output)
+                scraped_list.extract_list()
+                self.lists[scraped_list_class] = scraped_list
+                self.lists_pages_hashes[scraped_list_class] = page_hash
+
+            records = list(scraped_list.iter_records())
+            """The modified items were scraped, the next runs only need the revised ones"""
+            scraped_list.items_to_scrape = set()
+            if records == self.records.get(scraped_list_class):
+                Metrics.increment("unchanged_outputs", list=scraped_list_class.list_name)
+                logger.info("No change in the %s list, its outputs are kept", scraped_list_class.list_name)
+                """The change feed holds the differences with the previous run: none, this time"""
+                if ChangeFeedSink.output_format in OUTPUT_FORMATS:
+                    load_data(records, scraped_list_class.output_name, scraped_list_class.fieldnames,
+                              scraped_list_class.schema, (ChangeFeedSink.output_format,))
+                return
+            load_data(records, scraped_list_class.output_name, scraped_list_class.fieldnames, scraped_list_class.schema)
+            self.records[scraped_list_class] = records
+
+    def get_next_run_time(self) -> float:
+        """
+        Gets when the next list is due, or the list pages need to be downloaded again.
+
+        :returns: The POSIX timestamp of the next run
+        """
+        return min([Cache.get_next_refresh_time("global_check_timestamp", GLOBAL_CACHE_EXPIRATION_IN_HOURS)]
+                   + [Cache.get_next_refresh_time(scraped_list_class.check_timestamp_name, scraped_list_class.cache_expiration_in_hours)
+                      for scraped_list_class in self.scraped_lists])
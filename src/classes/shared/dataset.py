@@ -0,0 +1,142 @@
+import bisect
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Dataset:
+    """
+    A class to represent the typed records of a list, held in memory with secondary indexes to answer queries
+    without scanning every record.
+
+    Attributes
+    ----------
+    records: list
+        The typed records, in the list order.
+    equality_indexes: dict
+        For every equality-indexed field, the positions of the records by lowercased value.
+    range_indexes: dict
+        For every range-indexed field, the (value, position) of the records that have a value, sorted by value.
+
+    Methods
+    -------
+    load(input_file, equality_fields, range_fields)
+        Loads a dataset from a JSON Lines output file.
+    query(equals, ranges, search, sort, limit, offset)
+        Gets the records matching filters, sorted and paginated.
+    get_sorted_positions(positions, sort)
+        Sorts positions of records by a field.
+    """
+    def __init__(self, records: list[dict], equality_fields: tuple, range_fields: tuple) -> None:
+        """
+        Constructs all the necessary attributes for the Dataset object and builds its indexes.
+
+        :param records: list[dict]
+            The typed records.
+        :param equality_fields: tuple
+            The fields queried by value.
+        :param range_fields: tuple
+            The numeric fields queried by range.
+        """
+        self.records: list[dict] = records
+        self.equality_indexes: dict = {field: {} for field in equality_fields}
+        self.range_indexes: dict = {field: [] for field in range_fields}
+        for position, record in enumerate(records):
+            for field, index in self.equality_indexes.items():
+                if record.get(field) is not None:
+                    index.setdefault(str(record[field]).lower(), []).append(position)
+            for field, index in self.range_indexes.items():
+                if isinstance(record.get(field), (int, float)):
+                    index.append((record[field], position))
+        for index in self.range_indexes.values():
+            index.sort()
+
+    @classmethod
+    def load(cls, input_file: str, equality_fields: tuple, range_fields: tuple) -> "Dataset":
+        """
+        Loads a dataset from a JSON Lines output file.
+
+        :param input_file: str
+            Path to the JSON Lines file.
+        :param equality_fields: tuple
+            The fields queried by value.
+        :param range_fields: tuple
+            The numeric fields queried by range.
+
+        :returns: The indexed dataset, empty if the file does not exist
+        """
+        try:
+            with open(input_file, "r", encoding="utf-8") as file:
+                records = [json.loads(line) for line in file if line.strip()]
+        except FileNotFoundError:
+            logger.warning("%s does not exist, add jsonl to OUTPUT_FORMATS to query it", input_file)
+            records = []
+        return cls(records, equality_fields, range_fields)
+
+    def query(self, equals: dict, ranges: dict, search: str | None = None, sort: str | None = None,
+              limit: int | None = None, offset: int = 0) -> tuple[int, list[dict]]:
+        """
+        Gets the records matching every filter, sorted and paginated.
+
+        :param equals: dict
+            The accepted values (case insensitive) of equality-indexed fields, by field.
+        :param ranges: dict
+            The (minimum, maximum) of range-indexed fields, by field, either bound being None if open.
+        :param search: str
+            A text the record names must contain (case insensitive).
+        :param sort: str
+            The field to sort the records by, prefixed with - to sort in descending order (the list order if None).
+        :param limit: int
+            How many records to return at most (every one if None).
+        :param offset: int
+            How many matching records to skip.
+
+        :returns: The number of matching records, and the requested page of them
+        """
+        candidates = None
+        for field, values in equals.items():
+            index = self.equality_indexes[field]
+            positions = {position for value in values for position in index.get(str(value).lower(), [])}
+            candidates = positions if candidates is None else candidates & positions
+        for field, (minimum, maximum) in ranges.items():
+            index = self.range_indexes[field]
+            start = 0 if minimum is None else bisect.bisect_left(index, (minimum, -1))
+            stop = len(index) if maximum is None else bisect.bisect_right(index, (maximum, len(self.records)))
+            positions = {position for _, position in index[start:stop]}
+            candidates = positions if candidates is None else candidates & positions
+        if candidates is None:
+            candidates = set(range(len(self.records)))
+        if search:
+            search = search.lower()
+            candidates = {position for position in candidates if search in str(self.records[position].get("name", "")).lower()}
+
+        positions = self.get_sorted_positions(candidates, sort)
+        page = positions[offset:] if limit is None else positions[offset:offset + limit]
+        return len(positions), [self.records[position] for position in page]
+
+    def get_sorted_positions(self, positions: set, sort: str | None) -> list[int]:
+        """
+        Sorts positions of records by a field, the records missing it coming last.
+        A range-indexed field is read in its index order instead of being sorted again.
+
+        :param positions: set
+            The positions of the records to sort.
+        :param sort: str
+            The field to sort by, prefixed with - to sort in descending order (the list order if None).
+
+        :returns: The sorted positions
+        """
+        if not sort:
+            return sorted(positions)
+        descending = sort.startswith("-")
+        field = sort.removeprefix("-")
+        if field in self.range_indexes:
+            index = self.range_indexes[field]
+            sorted_positions = [position for _, position in (reversed(index) if descending else index) if position in positions]
+            indexed_positions = set(sorted_positions)
+            return sorted_positions + sorted(position for position in positions if position not in indexed_positions)
+        with_value = [position for position in positions if self.records[position].get(field) is not None]
+        without_value = sorted(position for position in positions if self.records[position].get(field) is None)
+        with_value.sort(key=lambda position: (self.records[position][field], position), reverse=descending)
+        return with_value + without_value
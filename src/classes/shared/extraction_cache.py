@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import threading
+
+from src.settings import EXTRACTION_CACHE_FOLDER
+
+
+class ExtractionCache:
+    """
+    Contains all the extraction cache methods.
+    The data extracted from a page is stored by item type, under the content hash of the page,
+    with the version of the item type extractors: a new version invalidates every record of its item type.
+    """
+    caches: dict = {}
+    lock = threading.RLock()
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def load(cls, item_class: type) -> dict:
+        """
+        Loads the records of an item type from the disk the first time they are needed.
+        Records extracted by another version of the item type extractors are dropped.
+
+        :param item_class: type
+            The ScrapedItem subclass of the records.
+
+        :returns: The records of the item type, by page hash
+        """
+        with cls.lock:
+            if item_class.scraped_subfolder not in cls.caches:
+                try:
+                    with open(f"{EXTRACTION_CACHE_FOLDER}/{item_class.scraped_subfolder}.json", "r") as file:
+                        cache = json.load(file)
+                except (FileNotFoundError, json.JSONDecodeError):
+                    cache = {}
+                if cache.get("version") != item_class.extractor_version:
+                    cache = {"version": item_class.extractor_version, "records": {}}
+                cls.caches[item_class.scraped_subfolder] = cache
+            return cls.caches[item_class.scraped_subfolder]["records"]
+
+    @classmethod
+    def get_record(cls, item_class: type, page_hash: str | None) -> dict | None:
+        """
+        Gets the data extracted from a page.
+
+        :param item_class: type
+            The ScrapedItem subclass of the page.
+        :param page_hash: str
+            The content hash of the page.
+
+        :returns: The extracted data, None if the page was not extracted yet with the current extractors
+        """
+        if page_hash is None:
+            return None
+        return cls.load(item_class).get(page_hash)
+
+    @classmethod
+    def set_record(cls, item_class: type, page_hash: str | None, record: dict) -> None:
+        """
+        Sets the data extracted from a page.
+
+        :param item_class: type
+            The ScrapedItem subclass of the page.
+        :param page_hash: str
+            The content hash of the page.
+        :param record: dict
+            The extracted data.
+        """
+        if page_hash is not None:
+            cls.load(item_class)[page_hash] = record
+
+    @classmethod
+    def save(cls, item_class: type, pages_hashes: set | None = None) -> None:
+        """
+        Saves the records of an item type on the disk, keeping only the ones of the given pages if any are given.
+
+        :param item_class: type
+            The ScrapedItem subclass of the records.
+        :param pages_hashes: set
+            The content hashes of the pages whose records are kept (every record is kept if None).
+        """
+        with cls.lock:
+            records = cls.load(item_class)
+            if pages_hashes is not None:
+                for page_hash in records.keys() - pages_hashes:
+                    del records[page_hash]
+            os.makedirs(EXTRACTION_CACHE_FOLDER, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=EXTRACTION_CACHE_FOLDER, suffix=".tmp", delete=False) as file:
+                json.dump(cls.caches[item_class.scraped_subfolder], file)
+            os.replace(file.name, f"{EXTRACTION_CACHE_FOLDER}/{item_class.scraped_subfolder}.json")
@@ -0,0 +1,121 @@
+import glob
+import json
+import os
+import tempfile
+
+from src.classes.shared.cache import Cache
+from src.settings import FINGERPRINT_FILE, DATASET_DATABASE, OUTPUT_FORMATS, GENERATE_EXCEL_READY_CSV, EXCEL_HYPERLINK_FORMAT, \
+    GLOBAL_CACHE_EXPIRATION_IN_HOURS, VEHICLES_CACHE_EXPIRATION_IN_HOURS, APARTMENTS_CACHE_EXPIRATION_IN_HOURS, \
+    VEHICLES_EXTRACTOR_VERSION, VEHICLES_FIELDNAMES, VEHICLES_SCHEMA, \
+    VEHICLES_MODIFICATIONS_LIST, VEHICLES_ITERATION_START, VEHICLES_ITERATION_STOP, \
+    APARTMENTS_EXTRACTOR_VERSION, APARTMENTS_FIELDNAMES, APARTMENTS_SCHEMA
+
+
+class Fingerprint:
+    """
+    Contains all the fingerprint methods.
+    The fingerprint records the inputs of the outputs written by a run: the content hash of every stored page,
+    the extractor versions, the settings they depend on, the check timestamps they were fresh under and the outputs themselves.
+    It only needs the cache database, so that a run can check it before loading the scraping modules.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def get_settings(cls) -> dict:
+        """
+        Gets the settings the outputs depend on, extractor versions included.
+
+        :returns: The settings, as JSON data
+        """
+        return json.loads(json.dumps({
+            "extractor versions": {"vehicles": VEHICLES_EXTRACTOR_VERSION, "apartments": APARTMENTS_EXTRACTOR_VERSION},
+            "output formats": OUTPUT_FORMATS,
+            "excel ready csv": GENERATE_EXCEL_READY_CSV,
+            "excel hyperlink format": EXCEL_HYPERLINK_FORMAT,
+            "cache expirations": [GLOBAL_CACHE_EXPIRATION_IN_HOURS, VEHICLES_CACHE_EXPIRATION_IN_HOURS,
+                                  APARTMENTS_CACHE_EXPIRATION_IN_HOURS],
+            "vehicles fieldnames": VEHICLES_FIELDNAMES,
+            "vehicles schema": {column: column_type.__name__ for column, column_type in VEHICLES_SCHEMA.items()},
+            "vehicles modifications": VEHICLES_MODIFICATIONS_LIST,
+            "vehicles iteration": [VEHICLES_ITERATION_START, VEHICLES_ITERATION_STOP],
+            "apartments fieldnames": APARTMENTS_FIELDNAMES,
+            "apartments schema": {column: column_type.__name__ for column, column_type in APARTMENTS_SCHEMA.items()}
+        }))
+
+    @classmethod
+    def get_outputs(cls, outputs_names: list[str]) -> dict:
+        """
+        Gets the size and modification time of every output file, the SQLite dataset included.
+
+        :param outputs_names: list[str]
+            Paths of the outputs of every list, without their extension.
+
+        :returns: The size and modification time (in ns) of every output file, by path
+        """
+        outputs = {}
+        for output_name in outputs_names:
+            for output_file in sorted(glob.glob(f"{glob.escape(output_name)}.*")):
+                output_stat = os.stat(output_file)
+                outputs[output_file] = [output_stat.st_size, output_stat.st_mtime_ns]
+        if "sqlite" in OUTPUT_FORMATS and os.path.exists(DATASET_DATABASE):
+            output_stat = os.stat(DATASET_DATABASE)
+            outputs[DATASET_DATABASE] = [output_stat.st_size, output_stat.st_mtime_ns]
+        return outputs
+
+    @classmethod
+    def save(cls, scraped_lists: tuple) -> None:
+        """
+        Records the fingerprint of the outputs that were just written.
+
+        :param scraped_lists: tuple
+            ScrapedList subclasses of the lists that were run.
+        """
+        fingerprint = {
+            "settings": cls.get_settings(),
+            "timestamps": {"global_check_timestamp": GLOBAL_CACHE_EXPIRATION_IN_HOURS}
+                          | {scraped_list.check_timestamp_name: scraped_list.cache_expiration_in_hours for scraped_list in scraped_lists},
+            "pages": Cache.get_pages_hashes(),
+            "outputs": cls.get_outputs([scraped_list.output_name for scraped_list in scraped_lists])
+        }
+        output_folder = os.path.dirname(FINGERPRINT_FILE) or "."
+        os.makedirs(output_folder, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=output_folder, suffix=".tmp", delete=False) as file:
+            json.dump(fingerprint, file)
+        os.replace(file.name, FINGERPRINT_FILE)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Removes the fingerprint, before outputs are written again."""
+        try:
+            os.remove(FINGERPRINT_FILE)
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def is_current(cls) -> bool:
+        """
+        Checks if the outputs are up to date: no check timestamp expired, and the settings, the stored pages
+        and the outputs are the ones recorded with them.
+
+        :returns: True if a run would write the same outputs
+        """
+        try:
+            with open(FINGERPRINT_FILE, "r") as file:
+                fingerprint = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if fingerprint.get("settings") != cls.get_settings():
+            return False
+        if any(Cache.is_refresh_needed(timestamp_name, cache_expiration)
+               for timestamp_name, cache_expiration in fingerprint.get("timestamps", {}).items()):
+            return False
+        outputs = fingerprint.get("outputs", {})
+        try:
+            if any(os.stat(output_file).st_size != size or os.stat(output_file).st_mtime_ns != mtime
+                   for output_file, (size, mtime) in outputs.items()):
+                return False
+        except FileNotFoundError:
+            return False
+        return bool(outputs) and fingerprint.get("pages") == Cache.get_pages_hashes()
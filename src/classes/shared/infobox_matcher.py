@@ -0,0 +1,169 @@
+import logging
+import re
+from typing import Callable
+
+import bs4
+
+from src.classes.shared.record import Record
+
+logger = logging.getLogger(__name__)
+
+
+class InfoboxField:
+    """
+    A class to represent the declaration of a field of a portable infobox: the infobox item holding it,
+    the element of that item holding its value, how that value is converted and the field value if it is missing.
+
+    Attributes
+    ----------
+    name: str
+        The record attribute of the field.
+    source: re.Pattern
+        The pattern of the data-source of the infobox item holding the field, None if it is found by its label.
+    label: re.Pattern
+        The pattern of the label (h3) of the infobox item holding the field, None if it is found by its data-source.
+    element: str
+        The tag name of the infobox item holding the field.
+    selectors: tuple
+        The (tag name, class) of the elements of the item that can hold the value, the first one found holding it.
+    value_attribute: str
+        The html attribute holding the value, the element text if None.
+    transform: Callable
+        Converts the value text, if needed.
+    default:
+        The value of the field when its item or value is missing.
+
+    Methods
+    -------
+    match(element, data_source, label)
+        Gets the infobox item of the field, if an element is or labels it.
+    get_value(item)
+        Gets the value of the field from its infobox item.
+    """
+    def __init__(self, name: str, source: str | None = None, label: str | None = None, element: str = "div",
+                 selectors: tuple = (("div", "pi-data-value"),), value_attribute: str | None = None,
+                 transform: Callable | None = None, default=None) -> None:
+        """
+        Constructs all the necessary attributes for the InfoboxField object, compiling its patterns.
+
+        :param name: str
+            The record attribute of the field.
+        :param source: str
+            The regular expression to search for in the data-source of the infobox items (case insensitive).
+        :param label: str
+            The regular expression to search for in the label of the infobox items (case insensitive).
+        :param element: str
+            The tag name of the infobox item holding the field.
+        :param selectors: tuple
+            The (tag name, class or None) of the elements of the item that can hold the value, by priority.
+        :param value_attribute: str
+            The html attribute holding the value, the element text if None.
+        :param transform: Callable
+            Converts the value text.
+        :param default:
+            The value of the field when its item or value is missing.
+        """
+        self.name: str = name
+        self.source: re.Pattern | None = re.compile(source, re.I) if source is not None else None
+        self.label: re.Pattern | None = re.compile(label, re.I) if label is not None else None
+        self.element: str = element
+        self.selectors: tuple = selectors
+        self.value_attribute: str | None = value_attribute
+        self.transform: Callable | None = transform
+        self.default = default
+
+    def match(self, element: bs4.element.Tag, data_source: str | None, label: str | None) -> bs4.element.Tag | None:
+        """
+        Gets the infobox item of the field, if an element is that item or its label.
+
+        :param element: bs4.element.Tag
+            An element of the infobox.
+        :param data_source: str
+            The data-source of the element, if any.
+        :param label: str
+            The text of the element, if it is a label.
+
+        :returns: The infobox item of the field, None if the element does not match
+        """
+        if self.source is not None and data_source is not None and element.name == self.element \
+                and self.source.search(data_source):
+            return element
+        if self.label is not None and label is not None and self.label.search(label):
+            return element.parent
+        return None
+
+    def get_value(self, item: bs4.element.Tag):
+        """
+        Gets the value of the field from its infobox item.
+
+        :param item: bs4.element.Tag
+            The infobox item of the field.
+
+        :returns: The converted value, the field default if the item holds none
+        """
+        for tag_name, class_name in self.selectors:
+            value_element = item.find(tag_name, class_=class_name) if class_name else item.find(tag_name)
+            if value_element is not None:
+                break
+        else:
+            return self.default
+        value = value_element.get(self.value_attribute) if self.value_attribute else value_element.getText()
+        if value is None:
+            return self.default
+        return self.transform(value) if self.transform is not None else value
+
+
+class InfoboxMatcher:
+    """
+    A class to represent the fields of an item type infobox, declared once per item class
+    to be extracted in a single walk of a portable infobox.
+
+    Attributes
+    ----------
+    fields: tuple
+        The InfoboxField of every field.
+
+    Methods
+    -------
+    extract(data_wrapper, record)
+        Sets every field of a record from a portable infobox, in a single walk of the infobox.
+    """
+    def __init__(self, fields: tuple[InfoboxField, ...]) -> None:
+        """
+        Constructs all the necessary attributes for the InfoboxMatcher object.
+
+        :param fields: tuple
+            The InfoboxField of every field.
+        """
+        self.fields: tuple[InfoboxField, ...] = fields
+
+    def extract(self, data_wrapper: bs4.element.Tag | None, record: Record) -> None:
+        """
+        Sets every field of a record from a portable infobox, in a single walk of the infobox.
+        Every field is read from the first item matching it, in the page order, as a search would find it.
+
+        :param data_wrapper: bs4.element.Tag
+            The portable infobox, None if the page has none.
+        :param record: Record
+            The record to set the fields of, every field missing from the infobox getting its default.
+        """
+        remaining_fields = list(self.fields)
+        if data_wrapper is not None:
+            for element in data_wrapper.descendants:
+                if not remaining_fields:
+                    break
+                if not isinstance(element, bs4.element.Tag):
+                    continue
+                data_source = element.get("data-source")
+                label = element.string if element.name == "h3" else None
+                if data_source is None and label is None:
+                    continue
+                for field in list(remaining_fields):
+                    item = field.match(element, data_source, label)
+                    if item is not None:
+                        remaining_fields.remove(field)
+                        value = field.get_value(item)
+                        logger.debug("%s is %s", field.name, value)
+                        setattr(record, field.name, value)
+        for field in remaining_fields:
+            setattr(record, field.name, field.default)
@@ -0,0 +1,37 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+"""Attributes of every log record, the other ones are the extra fields given to the log call"""
+LOG_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    A class to represent a log formatter writing every log record as a single line JSON object,
+    with its time, level, logger, message and extra fields.
+
+    Methods
+    -------
+    format(record)
+        Formats a log record as a JSON object.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a log record as a JSON object.
+
+        :param record: logging.LogRecord
+            The log record to format.
+
+        :returns: The JSON line
+        """
+        log = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        log.update({attribute: value for attribute, value in vars(record).items() if attribute not in LOG_RECORD_ATTRIBUTES})
+        if record.exc_info:
+            log["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log, ensure_ascii=False, default=str)
@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+METRICS_PREFIX = "gta_wiki_scraper"
+
+
+class Metrics:
+    """
+    Contains all the metrics methods.
+    Metrics are named counters and timers, optionally labelled, kept in memory during a run
+    then written at its end as JSON and in the Prometheus textfile format.
+    """
+    counters: dict = {}
+    timers: dict = {}
+    lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def get_key(cls, name: str, labels: dict) -> tuple:
+        """
+        Gets the key of a metric.
+
+        :param name: str
+            The metric name.
+        :param labels: dict
+            The metric labels.
+
+        :returns: The metric name and its sorted labels
+        """
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    @classmethod
+    def increment(cls, name: str, value: float = 1, **labels) -> None:
+        """
+        Increments a counter.
+
+        :param name: str
+            The counter name.
+        :param value: float
+            How much to add to the counter.
+        :param labels:
+            The counter labels.
+        """
+        key = cls.get_key(name, labels)
+        with cls.lock:
+            cls.counters[key] = cls.counters.get(key, 0) + value
+
+    @classmethod
+    def observe(cls, name: str, seconds: float, **labels) -> None:
+        """
+        Adds a duration to a timer.
+
+        :param name: str
+            The timer name.
+        :param seconds: float
+            The duration to add, in seconds.
+        :param labels:
+            The timer labels.
+        """
+        key = cls.get_key(name, labels)
+        with cls.lock:
+            timer = cls.timers.setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+            timer["count"] += 1
+            timer["sum"] += seconds
+            timer["max"] = max(timer["max"], seconds)
+
+    @classmethod
+    @contextmanager
+    def timer(cls, name: str, **labels) -> Iterator[None]:
+        """
+        Times a block and adds its duration to a timer, even if the block raises.
+
+        :param name: str
+            The timer name.
+        :param labels:
+            The timer labels.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.observe(name, time.perf_counter() - start, **labels)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Resets every metric."""
+        with cls.lock:
+            cls.counters = {}
+            cls.timers = {}
+
+    @classmethod
+    def to_dict(cls) -> dict:
+        """
+        Gets every metric, as JSON-serializable data.
+
+        :returns: The counters and timers, each with its name, labels and values
+        """
+        with cls.lock:
+            return {
+                "counters": [{"name": name, "labels": dict(labels), "value": value}
+                             for (name, labels), value in sorted(cls.counters.items())],
+                "timers": [{"name": name, "labels": dict(labels), **timer}
+                           for (name, labels), timer in sorted(cls.timers.items())]
+            }
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        """
+        Gets every metric in the Prometheus text format: counters as <name>_total,
+        timers as <name>_seconds summaries (count and sum) with a <name>_seconds_max gauge.
+
+        :returns: The metrics text
+        """
+        def get_labels(labels: tuple) -> str:
+            if not labels:
+                return ""
+            escaped_labels = ",".join(
+                f'{label}="{value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")}"'
+                for label, value in labels)
+            return "{" + escaped_labels + "}"
+
+        lines = []
+        with cls.lock:
+            counters = sorted(cls.counters.items())
+            timers = sorted(cls.timers.items())
+        for metric_name in dict.fromkeys(name for (name, _), _ in counters):
+            lines.append(f"# TYPE {METRICS_PREFIX}_{metric_name}_total counter")
+            lines += [f"{METRICS_PREFIX}_{metric_name}_total{get_labels(labels)} {value}"
+                      for (name, labels), value in counters if name == metric_name]
+        for metric_name in dict.fromkeys(name for (name, _), _ in timers):
+            lines.append(f"# TYPE {METRICS_PREFIX}_{metric_name}_seconds summary")
+            for (name, labels), timer in timers:
+                if name == metric_name:
+                    lines.append(f"{METRICS_PREFIX}_{metric_name}_seconds_count{get_labels(labels)} {timer["count"]}")
+                    lines.append(f"{METRICS_PREFIX}_{metric_name}_seconds_sum{get_labels(labels)} {timer["sum"]}")
+            lines.append(f"# TYPE {METRICS_PREFIX}_{metric_name}_seconds_max gauge")
+            lines += [f"{METRICS_PREFIX}_{metric_name}_seconds_max{get_labels(labels)} {timer["max"]}"
+                      for (name, labels), timer in timers if name == metric_name]
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def write(cls, json_output: str, prometheus_output: str) -> None:
+        """
+        Writes every metric in a JSON file and in a Prometheus textfile, each replaced at once
+        so that collectors never read a partial file.
+
+        :param json_output: str
+            Path to the JSON file.
+        :param prometheus_output: str
+            Path to the Prometheus textfile.
+        """
+        for output_file, content in ((json_output, json.dumps(cls.to_dict(), indent=2)),
+                                     (prometheus_output, cls.to_prometheus())):
+            output_folder = os.path.dirname(output_file) or "."
+            os.makedirs(output_folder, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=output_folder, suffix=".tmp", delete=False) as file:
+                file.write(content)
+            os.chmod(file.name, 0o644)
+            os.replace(file.name, output_file)
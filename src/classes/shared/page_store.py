@@ -0,0 +1,207 @@
+import ast
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import BinaryIO, Iterable
+
+from src.classes.shared.cache import Cache
+from src.settings import SCRAPED_FOLDER, PAGE_STORE_FOLDER
+
+
+class PageStore:
+    """
+    Contains all the page store methods.
+    Pages are stored once per content as raw gzip-compressed bytes named after their sha256 hash,
+    the cache links every page name (its path in SCRAPED_FOLDER) to its hash and metadata.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def get_page_key(cls, page_name: str) -> str:
+        """
+        Gets the index key of a page.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+
+        :returns: The index key of the page
+        """
+        return os.path.relpath(page_name, SCRAPED_FOLDER)
+
+    @classmethod
+    def get_blob_filename(cls, page_hash: str) -> str:
+        """
+        Gets the file containing a page content.
+
+        :param page_hash: str
+            The content hash of the page.
+
+        :returns: The compressed file path
+        """
+        return f"{PAGE_STORE_FOLDER}/{page_hash[:2]}/{page_hash}.html.gz"
+
+    @classmethod
+    def get_entry(cls, page_name: str) -> dict:
+        """
+        Gets the cache entry of a page, importing it first if it is a legacy scraped file.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+
+        :returns: The cache entry of the page, empty if the page is not stored
+        """
+        entry = Cache.get_page(cls.get_page_key(page_name))
+        if entry is None and os.path.exists(page_name):
+            cls.import_legacy_page(page_name)
+            entry = Cache.get_page(cls.get_page_key(page_name))
+        return entry or {}
+
+    @classmethod
+    def has_page(cls, page_name: str) -> bool:
+        """
+        Checks if a page is stored.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+        """
+        return cls.get_entry(page_name).get("hash") is not None
+
+    @classmethod
+    def get_page_hash(cls, page_name: str) -> str | None:
+        """
+        Gets the content hash of a stored page.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+
+        :returns: The content hash, None if the page is not stored
+        """
+        return cls.get_entry(page_name).get("hash")
+
+    @classmethod
+    def get_metadata(cls, page_name: str) -> dict:
+        """
+        Gets the metadata (validators and wiki revision id) of a stored page.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+        """
+        entry = cls.get_entry(page_name)
+        return {field: entry[field] for field in ("etag", "last_modified", "revision_id") if field in entry}
+
+    @classmethod
+    def set_metadata(cls, page_name: str, metadata: dict) -> None:
+        """
+        Sets the metadata (validators and wiki revision id) of a stored page.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+        :param metadata: dict
+            Metadata of the page.
+        """
+        Cache.set_page(cls.get_page_key(page_name), cls.get_page_hash(page_name), metadata)
+
+    @classmethod
+    def write_page(cls, page_name: str, content: Iterable[bytes], metadata: dict) -> str:
+        """
+        Streams a page content to the disk, compressed, and indexes it under its content hash.
+        A content already stored is not written twice, and nothing is left on the disk if the content stream fails.
+        The content is moved in place, indexed and its previous content removed in a single cache transaction,
+        so that no other thread or process can remove it as unused before it is indexed.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+        :param content: Iterable[bytes]
+            Raw content of the page, chunk by chunk.
+        :param metadata: dict
+            Metadata of the page.
+
+        :returns: The content hash of the page
+        """
+        os.makedirs(PAGE_STORE_FOLDER, exist_ok=True)
+        page_hash = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=PAGE_STORE_FOLDER, suffix=".tmp", delete=False) as file:
+            try:
+                with gzip.GzipFile(fileobj=file, mode="wb", mtime=0) as compressed_file:
+                    for chunk in content:
+                        page_hash.update(chunk)
+                        compressed_file.write(chunk)
+            except BaseException:
+                """A download interrupted mid-stream must not leave its partial content on the disk"""
+                file.close()
+                os.remove(file.name)
+                raise
+        page_hash = page_hash.hexdigest()
+
+        blob_filename = cls.get_blob_filename(page_hash)
+        with Cache.transaction():
+            if os.path.exists(blob_filename):
+                os.remove(file.name)
+            else:
+                os.makedirs(os.path.dirname(blob_filename), exist_ok=True)
+                os.replace(file.name, blob_filename)
+
+            previous_hash = Cache.set_page(cls.get_page_key(page_name), page_hash, metadata)
+            if previous_hash and previous_hash != page_hash:
+                cls.remove_unused_blob(previous_hash)
+        return page_hash
+
+    @classmethod
+    def remove_unused_blob(cls, page_hash: str) -> None:
+        """
+        Removes a page content from the disk if no page uses it anymore.
+        The check and the removal run in a single cache transaction, so that the content cannot be indexed in between.
+
+        :param page_hash: str
+            The content hash of the page.
+        """
+        with Cache.transaction():
+            if not Cache.is_page_hash_used(page_hash):
+                try:
+                    os.remove(cls.get_blob_filename(page_hash))
+                except FileNotFoundError:
+                    pass
+
+    @classmethod
+    def open_page(cls, page_name: str) -> BinaryIO:
+        """
+        Opens a stored page.
+
+        :param page_name: str
+            Path of the page in SCRAPED_FOLDER.
+
+        :returns: The page raw content, as a binary file
+        """
+        page_hash = cls.get_page_hash(page_name)
+        if page_hash is None:
+            raise FileNotFoundError(f"{page_name} is not stored")
+        return gzip.open(cls.get_blob_filename(page_hash), "rb")
+
+    @classmethod
+    def import_legacy_page(cls, page_name: str) -> None:
+        """
+        Imports a page saved by a previous version of the scraper (the repr of its bytes, with a .meta file next to it)
+        then removes the legacy files.
+
+        :param page_name: str
+            Path of the legacy scraped file.
+        """
+        with open(page_name, "r") as file:
+            try:
+                content = ast.literal_eval(file.read())
+            except (ValueError, SyntaxError):
+                return
+        try:
+            with open(f"{page_name}.meta", "r") as file:
+                metadata = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            metadata = {}
+        if isinstance(content, bytes):
+            cls.write_page(page_name, [content], metadata)
+        for legacy_file in (page_name, f"{page_name}.meta"):
+            if os.path.exists(legacy_file):
+                os.remove(legacy_file)
@@ -0,0 +1,209 @@
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from src.classes.shared.dataset import Dataset
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """
+    A class to represent the handler of a request to the query server.
+    GET / describes the datasets, GET /<dataset>?<filters> queries one of them:
+    <field>=<value> (repeated or comma separated for several values), min_<field>=<number>, max_<field>=<number>,
+    q=<text in the name>, sort=<field> or sort=-<field>, limit=<number> and offset=<number>.
+
+    Methods
+    -------
+    do_GET()
+        Answers a query with its matching records as JSON.
+    get_query_arguments(dataset_fields, parameters)
+        Converts the query parameters into Dataset.query arguments.
+    send_json(status, content)
+        Sends a JSON response.
+    """
+    protocol_version = "HTTP/1.1"
+    server: "QueryServer"
+
+    def do_GET(self) -> None:
+        """Answers a query with the number of matching records and the requested page of them, as JSON."""
+        url = urlsplit(self.path)
+        dataset_name = url.path.strip("/")
+        datasets = self.server.datasets
+        if not dataset_name:
+            self.send_json(200, {
+                "loaded at": self.server.loaded_at,
+                "datasets": {name: {"records": len(dataset.records),
+                                    "fields": list(self.server.datasets_fields[name][0]),
+                                    "range fields": list(self.server.datasets_fields[name][1])}
+                             for name, dataset in datasets.items()}
+            })
+            return
+        if dataset_name not in datasets:
+            self.send_json(404, {"error": f"Unknown dataset {dataset_name}, expected one of {', '.join(datasets)}"})
+            return
+        try:
+            arguments = self.get_query_arguments(self.server.datasets_fields[dataset_name], parse_qs(url.query))
+        except ValueError as error:
+            self.send_json(400, {"error": str(error)})
+            return
+        count, records = datasets[dataset_name].query(**arguments)
+        self.send_json(200, {"count": count, "results": records})
+
+    @classmethod
+    def get_query_arguments(cls, dataset_fields: tuple[dict, dict], parameters: dict) -> dict:
+        """
+        Converts the query parameters into Dataset.query arguments.
+
+        :param dataset_fields: tuple[dict, dict]
+            The equality-indexed and range-indexed fields of the dataset, by parameter name.
+        :param parameters: dict
+            The query parameters, as parsed by parse_qs.
+
+        :returns: The Dataset.query arguments
+        """
+        equality_fields, range_fields = dataset_fields
+        arguments = {"equals": {}, "ranges": {}, "search": None, "sort": None, "limit": None, "offset": 0}
+        for parameter, values in parameters.items():
+            if parameter in equality_fields:
+                arguments["equals"][equality_fields[parameter]] = [value.strip() for joined_values in values
+                                                                   for value in joined_values.split(",")]
+            elif parameter[:4] in ("min_", "max_") and parameter[4:] in range_fields:
+                field = range_fields[parameter[4:]]
+                try:
+                    bound = float(values[-1])
+                except ValueError:
+                    raise ValueError(f"{parameter} must be a number")
+                minimum, maximum = arguments["ranges"].get(field, (None, None))
+                arguments["ranges"][field] = (bound, maximum) if parameter.startswith("min_") else (minimum, bound)
+            elif parameter == "q":
+                arguments["search"] = values[-1]
+            elif parameter == "sort":
+                sort = values[-1]
+                field = sort.removeprefix("-")
+                field = equality_fields.get(field) or range_fields.get(field) or field
+                arguments["sort"] = f"-{field}" if sort.startswith("-") else field
+            elif parameter in ("limit", "offset"):
+                try:
+                    arguments[parameter] = max(int(values[-1]), 0)
+                except ValueError:
+                    raise ValueError(f"{parameter} must be an integer")
+            else:
+                expected_parameters = [*equality_fields, *(f"{bound}_{field}" for field in range_fields for bound in ("min", "max")),
+                                       "q", "sort", "limit", "offset"]
+                raise ValueError(f"Unknown parameter {parameter}, expected one of {', '.join(expected_parameters)}")
+        return arguments
+
+    def send_json(self, status: int, content: dict) -> None:
+        """
+        Sends a JSON response.
+
+        :param status: int
+            The response status code.
+        :param content: dict
+            The response content.
+        """
+        body = json.dumps(content, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    A class to represent a local read-only HTTP server answering queries over the extracted datasets,
+    held in memory and reloaded whenever a run finishes.
+
+    Attributes
+    ----------
+    datasets_inputs: dict
+        The JSON Lines file of every dataset, by dataset name.
+    datasets_fields: dict
+        The equality-indexed and range-indexed fields of every dataset, by parameter name, by dataset name.
+    reload_file: str
+        The file written at the end of every run, whose change triggers a reload.
+    datasets: dict
+        The loaded datasets, by name.
+    loaded_at: str
+        When the datasets were loaded.
+
+    Methods
+    -------
+    reload()
+        Loads every dataset again.
+    watch(interval)
+        Reloads the datasets whenever a run finishes, until the server stops.
+    get_url()
+        Gets the url of the server.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], datasets_inputs: dict, datasets_fields: dict, reload_file: str) -> None:
+        """
+        Constructs all the necessary attributes for the QueryServer object, loads the datasets and binds it to its address.
+
+        :param address: tuple[str, int]
+            The host and port to listen on (port 0 picks a free port).
+        :param datasets_inputs: dict
+            The JSON Lines file of every dataset, by dataset name.
+        :param datasets_fields: dict
+            The (equality fields, range fields) of every dataset, each by parameter name, by dataset name.
+        :param reload_file: str
+            The file written at the end of every run, whose change triggers a reload.
+        """
+        super().__init__(address, QueryRequestHandler)
+        self.datasets_inputs: dict = datasets_inputs
+        self.datasets_fields: dict = datasets_fields
+        self.reload_file: str = reload_file
+        self.datasets: dict = {}
+        self.loaded_at: str = ""
+        self.reload()
+
+    def reload(self) -> None:
+        """Loads every dataset again, then replaces the served ones at once."""
+        self.datasets = {name: Dataset.load(input_file, tuple(self.datasets_fields[name][0].values()),
+                                            tuple(self.datasets_fields[name][1].values()))
+                         for name, input_file in self.datasets_inputs.items()}
+        self.loaded_at = datetime.now().isoformat(timespec="seconds")
+        logger.info("Datasets loaded: %s", ", ".join(f"{name} ({len(dataset.records)} records)"
+                                                     for name, dataset in self.datasets.items()))
+
+    def watch(self, interval: float) -> None:
+        """
+        Reloads the datasets whenever the reload file is written again, which a run does once its outputs are complete.
+
+        :param interval: float
+            How many seconds between two checks of the reload file.
+        """
+        def get_reload_file_version() -> int | None:
+            try:
+                return os.stat(self.reload_file).st_mtime_ns
+            except FileNotFoundError:
+                return None
+
+        version = get_reload_file_version()
+        while True:
+            time.sleep(interval)
+            current_version = get_reload_file_version()
+            if current_version is not None and current_version != version:
+                try:
+                    self.reload()
+                except (OSError, ValueError) as error:
+                    logger.warning("Reloading the datasets failed (%s), keeping the previous ones", error)
+                    continue
+                version = current_version
+
+    def get_url(self) -> str:
+        """Gets the url of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
@@ -0,0 +1,203 @@
+import re
+import sys
+from typing import Iterable, Iterator
+
+NUMBER_PATTERN = re.compile(r"-?\d[\d,]*(?:\.\d+)?")
+
+
+class Record:
+    """
+    A class to represent the typed data of an item, as it is written in every output format.
+    Records are slotted, hold their numbers as numbers and share their repeated texts,
+    so that whole lists stay small in memory, and every sink reads its columns from them directly.
+    A missing value is None.
+
+    Attributes
+    ----------
+    name: str
+        Name of the item.
+    page_url: str
+        Url of the item's page.
+    image_url: str
+        Url for the image of the item.
+    columns: dict
+        The attribute of every field and typed column, by name.
+    counts_fields: dict
+        The (attribute, keys) of every field holding counts, by field name: the attribute holds the count of every key,
+        in the keys order, and every key has a typed "<key> <field>" column.
+    counts_columns: dict
+        The (attribute, position) of every count column, by column name.
+    interned_fields: tuple
+        The attributes whose texts repeat from a record to another, stored once.
+    attributes: tuple
+        Every attribute of the record.
+
+    Methods
+    -------
+    get_value(column)
+        Gets the typed value of a field or column.
+    get_typed_values(columns)
+        Gets the typed values of columns.
+    get_typed_record(columns)
+        Gets the typed values of columns, by column name.
+    get_csv_value(field)
+        Gets the value of a field, as written in the csv output.
+    get_csv_row(fieldnames)
+        Gets the values of fields, as written in the csv output.
+    get_counts(field)
+        Gets the keys of a counts field and their counts.
+    set_values(values)
+        Sets attributes from values read from the extraction cache.
+    get_number(text, number_type)
+        Reads a number from a text.
+    """
+    __slots__ = ("name", "page_url", "image_url")
+    columns: dict = {"name": "name", "page url": "page_url", "image url": "image_url"}
+    counts_fields: dict = {}
+    counts_columns: dict = {}
+    interned_fields: tuple = ()
+    attributes: tuple = __slots__
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Gathers the attributes of a record type and the count columns of its counts fields."""
+        super().__init_subclass__(**kwargs)
+        cls.attributes = tuple(attribute for record_class in reversed(cls.__mro__)
+                               for attribute in record_class.__dict__.get("__slots__", ()))
+        cls.counts_columns = {f"{key} {field}": (attribute, position)
+                              for field, (attribute, keys) in cls.counts_fields.items()
+                              for position, key in enumerate(keys)}
+
+    def __init__(self, name: str, page_url: str | None, image_url: str | None = None) -> None:
+        """
+        Constructs all the necessary attributes for the Record object.
+
+        :param name: str
+            Name of the item.
+        :param page_url: str
+            Url of the item's page, None if it has none.
+        :param image_url: str
+            Url for the image of the item.
+        """
+        self.name: str = name
+        self.page_url: str | None = page_url or None
+        self.image_url: str | None = image_url
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and all(getattr(self, attribute) == getattr(other, attribute)
+                                                 for attribute in self.attributes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(" + ", ".join(f"{attribute}={getattr(self, attribute)!r}"
+                                                     for attribute in self.attributes) + ")"
+
+    def get_value(self, column: str):
+        """
+        Gets the typed value of a field or column.
+        A count column is None if its field holds no counts, 0 if its key was not counted.
+
+        :param column: str
+            The field or column name.
+
+        :returns: The typed value, None if it is missing or the record has no such column
+        """
+        attribute = self.columns.get(column)
+        if attribute is not None:
+            return getattr(self, attribute)
+        if column in self.counts_columns:
+            attribute, position = self.counts_columns[column]
+            counts = getattr(self, attribute)
+            return counts[position] if counts else None
+        return None
+
+    def get_typed_values(self, columns: Iterable[str]) -> list:
+        """
+        Gets the typed values of columns.
+
+        :param columns: Iterable[str]
+            The column names, eg. the schema of a sink.
+
+        :returns: The typed values, in the columns order
+        """
+        return [self.get_value(column) for column in columns]
+
+    def get_typed_record(self, columns: Iterable[str]) -> dict:
+        """
+        Gets the typed values of columns, by column name, for the outputs written as objects.
+
+        :param columns: Iterable[str]
+            The column names, eg. the schema of a sink.
+
+        :returns: The typed values, by column name, in the columns order
+        """
+        return {column: self.get_value(column) for column in columns}
+
+    def get_csv_value(self, field: str):
+        """
+        Gets the value of a field, as written in the csv output.
+
+        :param field: str
+            The field name.
+
+        :returns: The value, an empty string if it is missing
+        """
+        value = self.get_value(field)
+        return "" if value is None else value
+
+    def get_csv_row(self, fieldnames: Iterable[str]) -> list:
+        """
+        Gets the values of fields, as written in the csv output.
+
+        :param fieldnames: Iterable[str]
+            The csv fieldnames.
+
+        :returns: The values, in the fieldnames order
+        """
+        return [self.get_csv_value(field) for field in fieldnames]
+
+    def get_counts(self, field: str) -> Iterator[tuple[str, int]]:
+        """
+        Gets the keys of a counts field that were counted, and their counts.
+
+        :param field: str
+            The counts field name.
+
+        :returns: The (key, count) of every counted key, in the keys order
+        """
+        attribute, keys = self.counts_fields[field]
+        for key, count in zip(keys, getattr(self, attribute) or ()):
+            if count:
+                yield key, count
+
+    def set_values(self, values: dict) -> None:
+        """
+        Sets attributes from values read from the extraction cache, where counts are stored as lists.
+
+        :param values: dict
+            The values, by attribute name.
+        """
+        for attribute, value in values.items():
+            if isinstance(value, list):
+                value = tuple(value)
+            elif isinstance(value, str) and attribute in self.interned_fields:
+                value = sys.intern(value)
+            setattr(self, attribute, value)
+
+    @classmethod
+    def get_number(cls, text: str | None, number_type: type = float) -> int | float | None:
+        """
+        Reads a number from a text, ignoring the thousands separators and anything after the first number.
+
+        :param text: str
+            The text to read.
+        :param number_type: type
+            The type of the number (int or float).
+
+        :returns: The number, None if the text is missing or holds no number
+        """
+        if not text:
+            return None
+        number = NUMBER_PATTERN.search(text)
+        if number is None:
+            return None
+        number = float(number.group().replace(",", ""))
+        return int(number) if number_type == int else number
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import tempfile
+from urllib.parse import urlsplit
+
+from src.settings import HTTP_RECORDINGS_FOLDER
+
+"""Headers describing how the recorded body was transferred, not the body itself which is recorded decoded"""
+TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+class Recordings:
+    """
+    Contains all the HTTP recordings methods.
+    Every response is recorded under the hash of its request method and url (without its scheme),
+    as a JSON file holding its url, status and headers next to a file holding its decoded body.
+    """
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def get_request_name(cls, method: str, url: str) -> str:
+        """
+        Gets the name of a request, the same for its live and replayed urls.
+
+        :param method: str
+            The request method.
+        :param url: str
+            The request url, or its host, path and query.
+
+        :returns: The request method followed by the host, path and query of the url
+        """
+        if "://" in url:
+            url = url.split("://", 1)[1]
+        parsed_url = urlsplit(f"//{url}")
+        query = f"?{parsed_url.query}" if parsed_url.query else ""
+        return f"{method.upper()} {parsed_url.netloc}{parsed_url.path or '/'}{query}"
+
+    @classmethod
+    def get_filename(cls, method: str, url: str) -> str:
+        """
+        Gets the file containing the recording of a request, without its extension.
+
+        :param method: str
+            The request method.
+        :param url: str
+            The request url.
+
+        :returns: The recording file path
+        """
+        request_hash = hashlib.sha256(cls.get_request_name(method, url).encode("utf-8")).hexdigest()
+        return f"{HTTP_RECORDINGS_FOLDER}/{request_hash[:2]}/{request_hash}"
+
+    @classmethod
+    def save(cls, method: str, url: str, status: int, headers: dict, body: bytes) -> None:
+        """
+        Records a response, replacing the previous recording of its request.
+
+        :param method: str
+            The request method.
+        :param url: str
+            The request url.
+        :param status: int
+            The response status code.
+        :param headers: dict
+            The response headers.
+        :param body: bytes
+            The response body, decoded.
+        """
+        filename = cls.get_filename(method, url)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        recording = {
+            "request": cls.get_request_name(method, url),
+            "status": status,
+            "headers": {header: value for header, value in headers.items() if header.lower() not in TRANSFER_HEADERS}
+        }
+        for extension, content in ((".body", body), (".json", json.dumps(recording, indent=2).encode("utf-8"))):
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(filename), suffix=".tmp", delete=False) as file:
+                file.write(content)
+            os.replace(file.name, filename + extension)
+
+    @classmethod
+    def load(cls, method: str, url: str) -> dict | None:
+        """
+        Loads the recording of a request.
+
+        :param method: str
+            The request method.
+        :param url: str
+            The request url, or its host, path and query.
+
+        :returns: The recorded status, headers and body, None if the request was never recorded
+        """
+        filename = cls.get_filename(method, url)
+        try:
+            with open(filename + ".json", "r") as file:
+                recording = json.load(file)
+            with open(filename + ".body", "rb") as file:
+                recording["body"] = file.read()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return recording
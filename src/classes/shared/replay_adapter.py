@@ -0,0 +1,54 @@
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    A class to represent a transport adapter sending every request to the replay server instead of its live host:
+    https://gta.fandom.com/wiki/Adder is requested as <replay server url>/gta.fandom.com/wiki/Adder.
+
+    Attributes
+    ----------
+    server_url: str
+        Url of the replay server.
+
+    Methods
+    -------
+    send(request, **kwargs)
+        Sends a request to the replay server.
+    """
+    def __init__(self, server_url: str, **kwargs) -> None:
+        """
+        Constructs all the necessary attributes for the ReplayAdapter object.
+
+        :param server_url: str
+            Url of the replay server.
+        :param kwargs:
+            The HTTPAdapter arguments (pool sizes, retries).
+        """
+        super().__init__(**kwargs)
+        self.server_url: str = server_url.rstrip("/")
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """
+        Sends a request to the replay server, the response keeping the live url of the request.
+
+        :param request: PreparedRequest
+            The request to the live host.
+        :param kwargs:
+            The HTTPAdapter.send arguments.
+
+        :returns: The replayed response
+        """
+        url = request.url
+        parsed_url = urlsplit(url)
+        query = f"?{parsed_url.query}" if parsed_url.query else ""
+        replayed_request = request.copy()
+        replayed_request.url = f"{self.server_url}/{parsed_url.netloc}{parsed_url.path or '/'}{query}"
+        replayed_request.headers.pop("Host", None)
+        response = super().send(replayed_request, **kwargs)
+        response.url = url
+        response.request = request
+        return response
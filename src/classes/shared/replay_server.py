@@ -0,0 +1,161 @@
+import gzip
+import hashlib
+import logging
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.classes.shared.recordings import Recordings
+
+logger = logging.getLogger(__name__)
+
+NOT_MODIFIED_MODES = ("validators", "always", "never")
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """
+    A class to represent the handler of a request to the replay server.
+    The requested path is the host, path and query of the live url, eg. /gta.fandom.com/wiki/Adder.
+
+    Methods
+    -------
+    do_GET()
+        Answers a GET request with its recording.
+    do_HEAD()
+        Answers a HEAD request with the headers of its GET recording.
+    is_not_modified(recording)
+        Checks if a conditional request can be answered with a 304.
+    send_body(status, headers, body)
+        Sends a response, compressed if the client accepts it.
+    """
+    protocol_version = "HTTP/1.1"
+    server: "ReplayServer"
+
+    def do_GET(self) -> None:
+        """Answers a GET request with its recording, after the server latency, unless an error is injected."""
+        self.server.wait()
+        if self.server.is_error_injected():
+            self.send_body(503, {"Retry-After": "0"}, b"Injected error")
+            return
+        recording = Recordings.load("GET", self.path.lstrip("/"))
+        if recording is None:
+            logger.warning("No recording of %s", self.path)
+            self.send_body(404, {}, f"No recording of {self.path}".encode("utf-8"))
+            return
+        headers = recording["headers"]
+        if recording["status"] == 200 and not any(header.lower() == "etag" for header in headers):
+            """Give every page a validator, so that conditional requests behave as on the live wiki"""
+            headers = headers | {"ETag": f'"{hashlib.sha256(recording["body"]).hexdigest()[:32]}"'}
+        if recording["status"] == 200 and self.is_not_modified(headers):
+            self.send_body(304, headers, b"")
+            return
+        self.send_body(recording["status"], headers, recording["body"])
+
+    def do_HEAD(self) -> None:
+        """Answers a HEAD request with the headers of its GET recording."""
+        self.do_GET()
+
+    def is_not_modified(self, headers: dict) -> bool:
+        """
+        Checks if a conditional request can be answered with a 304, following the not modified mode of the server.
+
+        :param headers: dict
+            The recorded response headers.
+
+        :returns: True if the request is conditional and, in the validators mode, its validators match the recording
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if self.server.not_modified == "never" or not (if_none_match or if_modified_since):
+            return False
+        if self.server.not_modified == "always":
+            return True
+        headers = {header.lower(): value for header, value in headers.items()}
+        if if_none_match:
+            return headers.get("etag") in (tag.strip() for tag in if_none_match.split(","))
+        return headers.get("last-modified") == if_modified_since
+
+    def send_body(self, status: int, headers: dict, body: bytes) -> None:
+        """
+        Sends a response, its body gzip-compressed if the client accepts it.
+
+        :param status: int
+            The response status code.
+        :param headers: dict
+            The response headers.
+        :param body: bytes
+            The response body.
+        """
+        if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=5, mtime=0)
+            headers = headers | {"Content-Encoding": "gzip"}
+        self.send_response(status)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    A class to represent a local HTTP server standing in for the wiki, serving the recorded responses.
+
+    Attributes
+    ----------
+    latency: float
+        How many seconds every response is delayed.
+    error_rate: float
+        The share of requests answered with a 503 error, between 0 and 1.
+    not_modified: str
+        How conditional requests are answered: validators (304 if the recorded ETag or Last-Modified match),
+        always (304 for every conditional request) or never (always the full recording).
+
+    Methods
+    -------
+    wait()
+        Waits for the latency of the server.
+    is_error_injected()
+        Draws whether a request gets an error.
+    get_url()
+        Gets the url of the server.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], latency: float = 0, error_rate: float = 0, not_modified: str = "validators") -> None:
+        """
+        Constructs all the necessary attributes for the ReplayServer object and binds it to its address.
+
+        :param address: tuple[str, int]
+            The host and port to listen on (port 0 picks a free port).
+        :param latency: float
+            How many seconds every response is delayed.
+        :param error_rate: float
+            The share of requests answered with a 503 error, between 0 and 1.
+        :param not_modified: str
+            How conditional requests are answered: validators, always or never.
+        """
+        if not_modified not in NOT_MODIFIED_MODES:
+            raise ValueError(f"Unknown not modified mode {not_modified}, expected one of {', '.join(NOT_MODIFIED_MODES)}")
+        super().__init__(address, ReplayRequestHandler)
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.not_modified: str = not_modified
+
+    def wait(self) -> None:
+        """Waits for the latency of the server."""
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def is_error_injected(self) -> bool:
+        """Draws whether a request gets an error, following the error rate of the server."""
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+    def get_url(self) -> str:
+        """Gets the url of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
 
-import bs4
+from bs4 import SoupStrainer
+
+from src.classes.shared.infobox_matcher import InfoboxMatcher
+from src.classes.shared.record import Record
+from src.functions.extract import get_normalized_filename
+from src.settings import SCRAPED_FOLDER
 
 
 class ScrapedItem(ABC):
@@ -9,52 +14,86 @@ class ScrapedItem(ABC):
 
     Attributes
     ----------
+    record: Record
+        The typed data of the item, filled in by its extractors.
     name: str
         name of the item.
     page_url: str
         Url of the page to scrape for the item.
-    image_url: str
-        url for the image of the item.
+    scraped_subfolder: str
+        Subfolder of SCRAPED_FOLDER under which the item's pages are named in the page store.
+    extracted_fields: tuple
+        Attributes of the record extracted from the item's page.
+    parse_profile: SoupStrainer
+        The elements of the item's page needed by the extractors (the whole page if None).
+    extractor_version: int
+        Version of the item's extractors, to bump whenever they extract something different.
+    infobox: InfoboxMatcher
+        The fields of the item's page infobox, extracted in a single walk of the infobox, declared by every item class.
 
     Methods
     -------
-    get_item_data(is_scraping_needed)
+    get_scraped_page_filename()
+        Gets the name of the item's scraped page in the page store.
+    get_item_data()
         Extracts the item data from the item's page.
-    get_image_url(data_wrapper)
-        Extracts the image url from the data wrapper
+    get_record()
+        Gets the data extracted from the item's page, as stored in the extraction cache.
+    set_record(record)
+        Sets the data extracted from the item's page, as stored in the extraction cache.
     """
-    def __init__(self, name: str, page_url: str) -> None:
+    __slots__ = ("record",)
+    scraped_subfolder: str = ""
+    extracted_fields: tuple = ("image_url",)
+    parse_profile: SoupStrainer | None = None
+    extractor_version: int = 1
+    infobox: InfoboxMatcher = InfoboxMatcher(())
+
+    def __init__(self, record: Record) -> None:
         """
         Constructs all the necessary attributes for the ScrapedItem object.
 
-        :param name: str
-            Name of the item
-        :param page_url: str
-            Url of the page to scrape for the item data.
+        :param record: Record
+            The typed data of the item, holding its name and the url of the page to scrape for its data.
         """
-        self.name: str = name
-        self.page_url: str = page_url
-        self.image_url: str = ""
+        self.record: Record = record
 
-    @abstractmethod
-    def get_item_data(self, is_scraping_needed: bool):
+    @property
+    def name(self) -> str:
+        """Name of the item."""
+        return self.record.name
+
+    @property
+    def page_url(self) -> str | None:
+        """Url of the page to scrape for the item data, None if it has none."""
+        return self.record.page_url
+
+    def get_scraped_page_filename(self) -> str:
         """
-        Extracts the item data from the item's page.
+        Gets the name of the item's scraped page in the page store (its path in SCRAPED_FOLDER).
 
-        :param is_scraping_needed: bool
-            Specifies if a scraping of the item's page is needed.
+        :returns: The scraped page name
         """
-        pass
+        return f"{SCRAPED_FOLDER}/{self.scraped_subfolder}/{get_normalized_filename(self.name)}.html"
 
-    @classmethod
     @abstractmethod
-    def get_image_url(cls, data_wrapper: bs4.element.Tag) -> str:
+    def get_item_data(self):
+        """Extracts the item data from the item's page, already stored in the page store (it never downloads it)."""
+        pass
+
+    def get_record(self) -> dict:
         """
-        Gets the image url from the data wrapper.
+        Gets the data extracted from the item's page, as stored in the extraction cache.
 
-        :param data_wrapper: bs4.element.Tag
-            The html data wrapper from which to extract the image url.
+        :returns: The extracted attributes values of the record, by attribute name
+        """
+        return {field: getattr(self.record, field) for field in self.extracted_fields}
+
+    def set_record(self, record: dict) -> None:
+        """
+        Sets the data extracted from the item's page, as stored in the extraction cache.
 
-        :returns: The image url
+        :param record: dict
+            The extracted attributes values of the record, by attribute name
         """
-        pass
\ No newline at end of file
+        self.record.set_values(record)
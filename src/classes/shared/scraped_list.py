@@ -1,4 +1,18 @@
+import logging
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+import requests
+from bs4 import SoupStrainer
+
+from src.classes.shared.cache import Cache
+from src.classes.shared.metrics import Metrics
+from src.classes.shared.page_store import PageStore
+from src.classes.shared.record import Record
+from src.classes.shared.scraped_item import ScrapedItem
+from src.functions.revisions import get_latest_revisions_ids
+
+logger = logging.getLogger(__name__)
 
 
 class ScrapedList(ABC):
@@ -13,14 +27,58 @@ class ScrapedList(ABC):
         Path to the local file containing the scraped page.
     list: dict
         A list of items
+    items_to_scrape: set
+        Names of the items that are new or whose page url changed since the last extraction.
+    entries: dict
+        The page url of every item of the list, by item name, stored in the cache once their pages are fetched.
+    failed_items: set
+        Names of the items whose page download failed.
+    revisions_ids: dict
+        Latest wiki revision id of the items pages, by url.
+    parse_profile: SoupStrainer
+        The elements of the list page needed to extract the list (the whole page if None).
+    list_name: str
+        Name of the list, in the logs and metrics.
+    list_page_url: str
+        Url of the list page on the wiki.
+    list_page_output: str
+        Path to the local file containing the scraped list page.
+    output_name: str
+        Path of the output files of the list, without their extension.
+    fieldnames: tuple
+        The fields of the list records, in the order they are written.
+    schema: dict
+        The type of every typed column of the list records.
+    check_timestamp_name: str
+        The cache timestamp of the last check of the items pages.
+    cache_expiration_in_hours: int
+        How many hours before checking back the items pages.
 
     Methods
     -------
     extract_list()
         Extracts the list of items from the url.
-    extract_data()
-        Extracts individual data for every item in the list that has its own url.
+    get_items()
+        Creates an item for every entry of the list.
+    iter_records()
+        Extracts individual data for every item in the list that has its own url, yielding every finished record.
+    get_pages_to_scrape(items, refresh)
+        Gets the pages of the items that need to be scraped.
+    get_revised_pages(pages)
+        Keeps only the pages that were revised on the wiki since they were scraped.
+    save_entries()
+        Stores the list entries in the cache, once the pages of its items are fetched.
     """
+    parse_profile: SoupStrainer | None = None
+    list_name: str = ""
+    list_page_url: str = ""
+    list_page_output: str = ""
+    output_name: str = ""
+    fieldnames: tuple = ()
+    schema: dict = {}
+    check_timestamp_name: str = ""
+    cache_expiration_in_hours: int = 0
+
     def __init__(self, page_url: str, output_file: str) -> None:
         """
         Constructs all the necessary attributes for the ScrapedList object.
@@ -33,6 +91,10 @@ class ScrapedList(ABC):
         self.page_url: str = page_url
         self.output_file: str = output_file
         self.list: dict = {}
+        self.items_to_scrape: set = set()
+        self.entries: dict = {}
+        self.failed_items: set = set()
+        self.revisions_ids: dict = {}
 
     @abstractmethod
     def extract_list(self) -> None:
@@ -40,6 +102,80 @@ class ScrapedList(ABC):
         pass
 
     @abstractmethod
-    def extract_data(self) -> None:
-        """Extracts individual data for every item in the list that has its own url, then updates the list with the data obtained."""
-        pass
\ No newline at end of file
+    def get_items(self) -> Iterator[ScrapedItem]:
+        """Creates an item for every entry of the list, one at a time."""
+        pass
+
+    @abstractmethod
+    def iter_records(self) -> Iterator[Record]:
+        """Extracts individual data for every item in the list that has its own url, yielding every record as soon as it is finished, in the list order."""
+        pass
+
+    def get_pages_to_scrape(self, items: Iterable[ScrapedItem], refresh: bool) -> list[tuple[str, str]]:
+        """
+        Gets the pages of the items that need to be scraped: the pages of new or modified items, the ones never scraped
+        and, if a refresh is needed, the ones revised on the wiki since they were scraped.
+
+        :param items: Iterable[ScrapedItem]
+            Items of the list.
+        :param refresh: bool
+            Specifies if a refresh of every item page is needed.
+
+        :returns: The (url, local file) of every page to scrape
+        """
+        pages = []
+        modified_pages = []
+        items_pages = 0
+        for item in items:
+            if not item.page_url:
+                continue
+            items_pages += 1
+            scraped_page = (item.page_url, item.get_scraped_page_filename())
+            if item.name in self.items_to_scrape:
+                modified_pages.append(scraped_page)
+            if refresh or item.name in self.items_to_scrape or not PageStore.has_page(scraped_page[1]):
+                pages.append(scraped_page)
+        if pages:
+            revised_pages = self.get_revised_pages(pages)
+            pages = [page for page in pages if page in revised_pages or page in modified_pages]
+        Metrics.increment("pages", items_pages - len(pages), source="cache")
+        return pages
+
+    def get_revised_pages(self, pages: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+        Checks the latest revision of every page on the wiki and keeps only the ones whose revision differs
+        from the one they were scraped at, or that were never scraped.
+        If the wiki API can't be reached, every page is kept.
+
+        :param pages: list[tuple[str, str]]
+            The (url, local file) of the pages to check.
+
+        :returns: The (url, local file) of every page to scrape
+        """
+        try:
+            self.revisions_ids = get_latest_revisions_ids([url for url, _ in pages])
+        except (requests.RequestException, ValueError) as error:
+            Metrics.increment("revisions_check_failures")
+            logger.warning("Revisions check failed (%s), every page will be scraped", error)
+            return pages
+        revised_pages = [(url, output_file) for url, output_file in pages
+                         if url not in self.revisions_ids
+                         or not PageStore.has_page(output_file)
+                         or PageStore.get_metadata(output_file).get("revision_id") != self.revisions_ids[url]]
+        logger.info("%s out of %s pages were revised since their last scraping", len(revised_pages), len(pages))
+        return revised_pages
+
+    def save_entries(self) -> None:
+        """
+        Stores the list entries in the cache, once the pages of its items are fetched:
+        a run interrupted before would otherwise leave the new or modified items with their previous page.
+        A new or modified item whose page download failed keeps its previous entry, to be fetched again next run.
+        """
+        entries = self.entries
+        failed_changed_items = self.failed_items & self.items_to_scrape
+        if failed_changed_items:
+            cached_entries = Cache.get_list_entries(self.list_name)
+            entries = {name: cached_entries[name] if name in failed_changed_items else page_url
+                       for name, page_url in entries.items()
+                       if name not in failed_changed_items or name in cached_entries}
+        Cache.set_list_entries(self.list_name, entries)
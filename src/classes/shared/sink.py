@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+
+from src.classes.shared.record import Record
+
+
+class Sink(ABC):
+    """
+    A class to represent an output file in which the extracted records are written, one record at a time.
+    Every sink reads the values it writes from the records themselves.
+
+    Attributes
+    ----------
+    output_file: str
+        Path to the output file.
+    fieldnames: tuple
+        The fields of the records, in the order they are written.
+    schema: dict
+        The type of every typed column, by column name (nested counts are flattened into one column per key).
+    output_format: str
+        The name of the output format, as used in OUTPUT_FORMATS.
+    extension: str
+        The extension of the output files.
+
+    Methods
+    -------
+    is_available()
+        Checks if the dependencies of the output format are installed.
+    write(record)
+        Writes a record in the output file.
+    close()
+        Finishes writing the output file.
+    """
+    output_format: str = ""
+    extension: str = ""
+
+    def __init__(self, output_file: str, fieldnames: tuple, schema: dict) -> None:
+        """
+        Constructs all the necessary attributes for the Sink object.
+
+        :param output_file: str
+            Path to the output file.
+        :param fieldnames: tuple
+            The fields of the records, in the order they are written.
+        :param schema: dict
+            The type of every typed column, by column name.
+        """
+        self.output_file: str = output_file
+        self.fieldnames: tuple = fieldnames
+        self.schema: dict = schema
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Checks if the dependencies of the output format are installed."""
+        return True
+
+    @abstractmethod
+    def write(self, record: Record) -> None:
+        """
+        Writes a record in the output file.
+
+        :param record: Record
+            The record to write.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finishes writing the output file."""
+        pass
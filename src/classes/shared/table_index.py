@@ -0,0 +1,97 @@
+import re
+
+import bs4
+
+
+class TableIndex:
+    """
+    A class to represent the index of every table header cell of a page, built in a single pass over the page.
+
+    Attributes
+    ----------
+    headers: list
+        (normalized text, normalized string, cell) of every header cell, in the page order.
+    columns: dict
+        (header row, column index, data row) of the header cells already looked up, by cell id.
+
+    Methods
+    -------
+    find_header(pattern, string_only)
+        Gets the first header cell matching a pattern.
+    find_column(pattern)
+        Gets the header row, column index and data row of the first header cell matching a pattern.
+    find_value(pattern)
+        Gets the text of the data cell under the first header cell matching a pattern.
+    """
+    def __init__(self, soup: bs4.element.Tag) -> None:
+        """
+        Constructs all the necessary attributes for the TableIndex object.
+
+        :param soup: bs4.element.Tag
+            The soup of the page to index.
+        """
+        self.headers: list = [(
+            cell.get_text(separator=" ", strip=True).lower(),
+            cell.string.lower() if isinstance(cell.string, str) else None,
+            cell
+        ) for cell in soup.find_all("th")]
+        self.columns: dict = {}
+
+    def find_header(self, pattern: str, string_only: bool = False) -> bs4.element.Tag | None:
+        """
+        Gets the first header cell matching a pattern.
+
+        :param pattern: str
+            The regular expression to search for in the lowercase header text.
+        :param string_only: bool
+            Only match header cells containing a single string, searching in that string.
+
+        :returns: The header cell, None if no header matches
+        """
+        compiled_pattern = re.compile(pattern)
+        for text, string, cell in self.headers:
+            searched_text = string if string_only else text
+            if searched_text is not None and compiled_pattern.search(searched_text):
+                return cell
+        return None
+
+    def find_column(self, pattern: str) -> tuple[bs4.element.Tag, int, bs4.element.Tag | None] | None:
+        """
+        Gets the header row, column index and data row (the first following row with data cells)
+        of the first header cell matching a pattern.
+
+        :param pattern: str
+            The regular expression to search for in the lowercase header text.
+
+        :returns: The (header row, column index, data row), None if no header matches
+        """
+        header_cell = self.find_header(pattern)
+        if header_cell is None:
+            return None
+        if id(header_cell) not in self.columns:
+            header_row = header_cell.find_parent("tr")
+            column = header_row.find_all("th").index(header_cell)
+            data_row = header_row.find_next_sibling("tr")
+            while data_row and not data_row.find("td"):
+                data_row = data_row.find_next_sibling("tr")
+            self.columns[id(header_cell)] = (header_row, column, data_row)
+        return self.columns[id(header_cell)]
+
+    def find_value(self, pattern: str) -> str | None:
+        """
+        Gets the text of the data cell under the first header cell matching a pattern.
+        If the data row starts with header cells, the column index is diminished by 1 in data cells to compensate.
+
+        :param pattern: str
+            The regular expression to search for in the lowercase header text.
+
+        :returns: The stripped data cell text, None if no header matches
+        """
+        column = self.find_column(pattern)
+        if column is None or column[2] is None:
+            return None
+        _, column_index, data_row = column
+        data_cells = data_row.find_all("td")
+        if data_row.find_all("th"):
+            column_index -= 1
+        return data_cells[column_index].text.strip()
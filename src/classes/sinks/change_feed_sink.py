@@ -0,0 +1,119 @@
+import json
+import logging
+import os
+import tempfile
+
+from src.classes.shared.cache import Cache
+from src.classes.shared.record import Record
+from src.classes.shared.sink import Sink
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeedSink(Sink):
+    """
+    A class to represent a change feed output file, in which only the differences with the previous run are written,
+    as JSON Lines: the added and removed records, and the changed fields of the other ones.
+    Records are identified by their name and page url, the previous run records being kept in the cache.
+
+    Attributes
+    ----------
+    list_name: str
+        Name of the list in the cache (the output file name).
+    previous_records: dict
+        The typed records written by the previous run, by (name, page url).
+    records: dict
+        The typed records written by the current run, by (name, page url).
+    changes: dict
+        The number of added, changed and removed records.
+    output: TextIO
+        The opened temporary output file, which replaces the change feed once complete.
+
+    Methods
+    -------
+    write(record)
+        Writes the change of a record, if any, in the change feed.
+    write_change(change, record_key, data)
+        Writes a change line in the change feed.
+    close()
+        Writes the removed records, then replaces the change feed and stores the current records for the next run.
+    abort()
+        Drops the change feed, leaving the previous run records in the cache.
+    """
+    output_format = "changes"
+    extension = "changes.jsonl"
+
+    def __init__(self, output_file: str, fieldnames: tuple, schema: dict) -> None:
+        """
+        Constructs all the necessary attributes for the ChangeFeedSink object.
+
+        :param output_file: str
+            Path to the change feed file.
+        :param fieldnames: tuple
+            The fields of the records.
+        :param schema: dict
+            The type of every column, by column name.
+        """
+        super().__init__(output_file, fieldnames, schema)
+        self.list_name: str = os.path.basename(output_file).removesuffix(f".{self.extension}")
+        self.previous_records: dict = Cache.get_records(self.list_name)
+        self.records: dict = {}
+        self.changes: dict = {"added": 0, "changed": 0, "removed": 0}
+        output_folder = os.path.dirname(output_file) or "."
+        self.output = tempfile.NamedTemporaryFile("w", dir=output_folder, suffix=".tmp", encoding='utf-8', delete=False)
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Completes the change feed, unless the run was interrupted: the missing records would be seen as removed."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record: Record) -> None:
+        """
+        Writes the change of a record, if any, in the change feed.
+
+        :param record: Record
+            The record to compare with the previous run.
+        """
+        typed_record = record.get_typed_record(self.schema)
+        record_key = (typed_record["name"], typed_record["page url"] or "")
+        self.records[record_key] = typed_record
+        previous_record = self.previous_records.get(record_key)
+        if previous_record is None:
+            self.write_change("added", record_key, {"record": typed_record})
+        else:
+            changed_fields = {field: {"previous": previous_record.get(field), "current": value}
+                              for field, value in typed_record.items() if previous_record.get(field) != value}
+            if changed_fields:
+                self.write_change("changed", record_key, {"fields": changed_fields})
+
+    def write_change(self, change: str, record_key: tuple, data: dict) -> None:
+        """
+        Writes a change line in the change feed.
+
+        :param change: str
+            The kind of change (added, changed or removed).
+        :param record_key: tuple
+            The name and page url of the changed record.
+        :param data: dict
+            The details of the change.
+        """
+        self.changes[change] += 1
+        line = {"change": change, "name": record_key[0], "page url": record_key[1] or None, **data}
+        self.output.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Writes the removed records, then replaces the change feed and stores the current records for the next run."""
+        for record_key in self.previous_records.keys() - self.records.keys():
+            self.write_change("removed", record_key, {"record": self.previous_records[record_key]})
+        self.output.close()
+        os.replace(self.output.name, self.output_file)
+        Cache.set_records(self.list_name, self.records)
+        logger.info("Change feed created : %s (%s added, %s changed, %s removed)",
+                    self.output_file, self.changes["added"], self.changes["changed"], self.changes["removed"])
+
+    def abort(self) -> None:
+        """Drops the change feed, leaving the previous run records in the cache."""
+        self.output.close()
+        os.remove(self.output.name)
@@ -0,0 +1,86 @@
+import csv
+import logging
+
+from src.classes.shared.record import Record
+from src.classes.shared.sink import Sink
+from src.settings import GENERATE_EXCEL_READY_CSV, EXCEL_HYPERLINK_FORMAT
+
+logger = logging.getLogger(__name__)
+
+
+class CsvSink(Sink):
+    """
+    A class to represent a csv output file, in which the records are written as they are, counts as a dict.
+    If asked to generate an excel-compatible csv, the links are written as hyperlink formulas.
+
+    Attributes
+    ----------
+    output: TextIO
+        The opened output file.
+    writer: csv.writer
+        The csv writer of the output file.
+    hyperlinks_positions: list
+        The positions of the links columns written as hyperlink formulas, if any.
+
+    Methods
+    -------
+    write(record)
+        Writes a record in the csv file.
+    get_hyperlink(url, name)
+        Gets the excel hyperlink formula of a link.
+    close()
+        Closes the csv file.
+    """
+    output_format = "csv"
+    extension = "csv"
+    hyperlinks_fields = ("page url", "image url")
+
+    def __init__(self, output_file: str, fieldnames: tuple, schema: dict) -> None:
+        """
+        Constructs all the necessary attributes for the CsvSink object, then writes the csv header.
+
+        :param output_file: str
+            Path to the csv file.
+        :param fieldnames: tuple
+            The csv fieldnames.
+        :param schema: dict
+            The type of every typed column, by column name (unused, csv values are written as they are).
+        """
+        super().__init__(output_file, fieldnames, schema)
+        self.output = open(output_file, "w", newline='', encoding='utf-8')
+        self.writer = csv.writer(self.output, delimiter = ",")
+        self.writer.writerow(fieldnames)
+        self.hyperlinks_positions: list = [position for position, field in enumerate(fieldnames)
+                                           if field in self.hyperlinks_fields] if GENERATE_EXCEL_READY_CSV else []
+
+    def write(self, record: Record) -> None:
+        """
+        Writes a record in the csv file, flushing it so the file is readable as it grows.
+
+        :param record: Record
+            The record to write.
+        """
+        row = record.get_csv_row(self.fieldnames)
+        for position in self.hyperlinks_positions:
+            row[position] = self.get_hyperlink(row[position], record.name)
+        self.writer.writerow(row)
+        self.output.flush()
+
+    @classmethod
+    def get_hyperlink(cls, url: str, name: str) -> str:
+        """
+        Gets the excel hyperlink formula of a link, with a string to mass delete once imported.
+
+        :param url: str
+            The link url.
+        :param name: str
+            The link text.
+
+        :returns: The hyperlink formula
+        """
+        return "=[BATCH_DELETE_THIS]" + EXCEL_HYPERLINK_FORMAT + "(\"" + url + "\";\"" + name + "\")"
+
+    def close(self) -> None:
+        """Closes the csv file."""
+        self.output.close()
+        logger.info("CSV file created : %s", self.output_file)
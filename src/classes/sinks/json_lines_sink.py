@@ -0,0 +1,56 @@
+import json
+import logging
+
+from src.classes.shared.record import Record
+from src.classes.shared.sink import Sink
+
+logger = logging.getLogger(__name__)
+
+
+class JsonLinesSink(Sink):
+    """
+    A class to represent a JSON Lines output file, in which every record is written as a typed JSON object on its own line.
+
+    Attributes
+    ----------
+    output: TextIO
+        The opened output file.
+
+    Methods
+    -------
+    write(record)
+        Writes a typed record in the JSON Lines file.
+    close()
+        Closes the JSON Lines file.
+    """
+    output_format = "jsonl"
+    extension = "jsonl"
+
+    def __init__(self, output_file: str, fieldnames: tuple, schema: dict) -> None:
+        """
+        Constructs all the necessary attributes for the JsonLinesSink object.
+
+        :param output_file: str
+            Path to the JSON Lines file.
+        :param fieldnames: tuple
+            The fields of the records.
+        :param schema: dict
+            The type of every column, by column name.
+        """
+        super().__init__(output_file, fieldnames, schema)
+        self.output = open(output_file, "w", encoding='utf-8')
+
+    def write(self, record: Record) -> None:
+        """
+        Writes a typed record in the JSON Lines file, flushing it so the file is readable as it grows.
+
+        :param record: Record
+            The record to write.
+        """
+        self.output.write(json.dumps(record.get_typed_record(self.schema), ensure_ascii=False) + "\n")
+        self.output.flush()
+
+    def close(self) -> None:
+        """Closes the JSON Lines file."""
+        self.output.close()
+        logger.info("JSON Lines file created : %s", self.output_file)
@@ -0,0 +1,96 @@
+import logging
+
+from src.classes.shared.record import Record
+from src.classes.shared.sink import Sink
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetSink(Sink):
+    """
+    A class to represent a Parquet output file, in which the typed records are written by row groups,
+    their values being gathered column by column.
+    Needs pyarrow to be installed.
+
+    Attributes
+    ----------
+    arrow_schema: pyarrow.Schema
+        The Parquet columns types, built from the schema.
+    columns: dict
+        The typed values waiting to be written in the next row group, by column name.
+    rows: int
+        How many records are waiting to be written in the next row group.
+    writer: pyarrow.parquet.ParquetWriter
+        The Parquet writer of the output file.
+    row_group_size: int
+        How many records are written in every row group.
+
+    Methods
+    -------
+    is_available()
+        Checks if pyarrow is installed.
+    write(record)
+        Writes a typed record in the Parquet file.
+    write_row_group()
+        Writes the waiting records in a row group.
+    close()
+        Writes the last row group then closes the Parquet file.
+    """
+    output_format = "parquet"
+    extension = "parquet"
+    row_group_size: int = 10000
+
+    def __init__(self, output_file: str, fieldnames: tuple, schema: dict) -> None:
+        """
+        Constructs all the necessary attributes for the ParquetSink object.
+
+        :param output_file: str
+            Path to the Parquet file.
+        :param fieldnames: tuple
+            The fields of the records.
+        :param schema: dict
+            The type of every column, by column name.
+        """
+        super().__init__(output_file, fieldnames, schema)
+        arrow_types = {str: pyarrow.string(), int: pyarrow.int64(), float: pyarrow.float64()}
+        self.arrow_schema = pyarrow.schema([(column, arrow_types[column_type]) for column, column_type in schema.items()])
+        self.writer = pyarrow.parquet.ParquetWriter(output_file, self.arrow_schema)
+        self.columns: dict = {column: [] for column in schema}
+        self.rows: int = 0
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Checks if pyarrow is installed."""
+        return pyarrow is not None
+
+    def write(self, record: Record) -> None:
+        """
+        Writes a typed record in the Parquet file, once enough records are waiting to fill a row group.
+
+        :param record: Record
+            The record to write.
+        """
+        for values, value in zip(self.columns.values(), record.get_typed_values(self.schema)):
+            values.append(value)
+        self.rows += 1
+        if self.rows >= self.row_group_size:
+            self.write_row_group()
+
+    def write_row_group(self) -> None:
+        """Writes the waiting records in a row group."""
+        if self.rows:
+            self.writer.write_table(pyarrow.Table.from_pydict(self.columns, schema=self.arrow_schema))
+            self.columns = {column: [] for column in self.schema}
+            self.rows = 0
+
+    def close(self) -> None:
+        """Writes the last row group then closes the Parquet file."""
+        self.write_row_group()
+        self.writer.close()
+        logger.info("Parquet file created : %s", self.output_file)
@@ -0,0 +1,172 @@
+import logging
+import os
+import sqlite3
+
+from src.classes.shared.record import Record
+from src.classes.shared.sink import Sink
+from src.settings import DATASET_DATABASE, DATASET_INDEXES, DATASET_DETAIL_TABLES
+
+logger = logging.getLogger(__name__)
+
+SQLITE_TYPES = {str: "TEXT", int: "INTEGER", float: "REAL"}
+
+
+class SqliteSink(Sink):
+    """
+    A class to represent a list table of the SQLite dataset, shared by every list (DATASET_DATABASE).
+    The typed records are written in a new table by bulk transactions, then replace the previous table at once,
+    with its indexes, so that readers never see a partial list.
+    The counts of DATASET_DETAIL_TABLES get a table of their own, eg. vehicle_modifications, with a row per item and key.
+
+    Attributes
+    ----------
+    list_name: str
+        Name of the list table (the output file name).
+    details: dict
+        The keys of every nested count field moved to a table of its own, by field.
+    columns: list
+        The columns of the list table.
+    detail_tables: dict
+        The name of the table of every nested count field, by field.
+    connection: sqlite3.Connection
+        The connection to the dataset database.
+    rows: list
+        The list rows waiting to be inserted.
+    detail_rows: dict
+        The count rows waiting to be inserted, by field.
+    items: int
+        How many records were written.
+    batch_size: int
+        How many rows are inserted by transaction.
+
+    Methods
+    -------
+    write(record)
+        Writes a typed record in the list table, and its counts in their tables.
+    insert_rows()
+        Inserts the waiting rows in a transaction.
+    close()
+        Inserts the last rows, then replaces the previous tables by the new ones and indexes them.
+    abort()
+        Drops the new tables, leaving the previous ones.
+    quote(identifier)
+        Quotes an SQL identifier.
+    """
+    output_format = "sqlite"
+    extension = "sqlite"
+    batch_size: int = 5000
+
+    def __init__(self, output_file: str, fieldnames: tuple, schema: dict) -> None:
+        """
+        Constructs all the necessary attributes for the SqliteSink object and creates the new tables.
+
+        :param output_file: str
+            Path the list would have as a file of its own, naming its table.
+        :param fieldnames: tuple
+            The fields of the records.
+        :param schema: dict
+            The type of every column, by column name.
+        """
+        super().__init__(output_file, fieldnames, schema)
+        self.list_name: str = os.path.basename(output_file).removesuffix(f".{self.extension}")
+        details = DATASET_DETAIL_TABLES.get(self.list_name, {})
+        detail_columns = {f"{key} {field}" for field, keys in details.items() for key in keys}
+        self.details: dict = details
+        self.columns: list = [column for column in schema if column not in detail_columns]
+        self.detail_tables: dict = {field: f"{self.list_name.removesuffix('s')}_{field}" for field in details}
+        self.rows: list = []
+        self.detail_rows: dict = {field: [] for field in details}
+        self.items: int = 0
+
+        os.makedirs(os.path.dirname(DATASET_DATABASE) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(DATASET_DATABASE, timeout=60, isolation_level=None)
+        item_id = f"{self.list_name.removesuffix('s')}_id"
+        with self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.execute(f"DROP TABLE IF EXISTS {self.quote(self.list_name + '_new')}")
+            self.connection.execute(
+                f"CREATE TABLE {self.quote(self.list_name + '_new')} (id INTEGER PRIMARY KEY, "
+                + ", ".join(f"{self.quote(column)} {SQLITE_TYPES[schema[column]]}" for column in self.columns) + ")")
+            for field, table in self.detail_tables.items():
+                self.connection.execute(f"DROP TABLE IF EXISTS {self.quote(table + '_new')}")
+                self.connection.execute(
+                    f"CREATE TABLE {self.quote(table + '_new')} ({self.quote(item_id)} INTEGER NOT NULL "
+                    f"REFERENCES {self.quote(self.list_name)} (id), {self.quote(field.removesuffix('s'))} TEXT NOT NULL, "
+                    f"count INTEGER NOT NULL)")
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Replaces the previous tables, unless the run was interrupted: the list would be incomplete."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record: Record) -> None:
+        """
+        Writes a typed record in the list table, and every counted key of its counts in their tables.
+
+        :param record: Record
+            The record to write.
+        """
+        self.items += 1
+        self.rows.append((self.items, *record.get_typed_values(self.columns)))
+        for field, keys in self.details.items():
+            for key, count in record.get_counts(field):
+                if key in keys:
+                    self.detail_rows[field].append((self.items, key, count))
+        if len(self.rows) >= self.batch_size:
+            self.insert_rows()
+
+    def insert_rows(self) -> None:
+        """Inserts the waiting rows of every new table in a single transaction."""
+        with self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.executemany(
+                f"INSERT INTO {self.quote(self.list_name + '_new')} VALUES ({', '.join('?' * (len(self.columns) + 1))})",
+                self.rows)
+            for field, table in self.detail_tables.items():
+                self.connection.executemany(f"INSERT INTO {self.quote(table + '_new')} VALUES (?, ?, ?)", self.detail_rows[field])
+        self.rows = []
+        self.detail_rows = {field: [] for field in self.details}
+
+    def close(self) -> None:
+        """Inserts the last rows, then replaces the previous tables by the new ones and indexes them, in a single transaction."""
+        self.insert_rows()
+        item_id = f"{self.list_name.removesuffix('s')}_id"
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            for table in (self.list_name, *self.detail_tables.values()):
+                self.connection.execute(f"DROP TABLE IF EXISTS {self.quote(table)}")
+                self.connection.execute(f"ALTER TABLE {self.quote(table + '_new')} RENAME TO {self.quote(table)}")
+            for column in DATASET_INDEXES.get(self.list_name, ()):
+                if column in self.columns:
+                    self.connection.execute(f"CREATE INDEX {self.quote(f'{self.list_name} {column}')} "
+                                            f"ON {self.quote(self.list_name)} ({self.quote(column)})")
+            for field, table in self.detail_tables.items():
+                key = field.removesuffix("s")
+                self.connection.execute(f"CREATE INDEX {self.quote(f'{table} {item_id}')} ON {self.quote(table)} ({self.quote(item_id)})")
+                self.connection.execute(f"CREATE INDEX {self.quote(f'{table} {key}')} ON {self.quote(table)} ({self.quote(key)}, count)")
+        self.connection.execute("ANALYZE")
+        self.connection.close()
+        logger.info("SQLite tables created : %s in %s (%s rows)",
+                    ", ".join((self.list_name, *self.detail_tables.values())), DATASET_DATABASE, self.items)
+
+    def abort(self) -> None:
+        """Drops the new tables, leaving the previous ones."""
+        with self.connection:
+            self.connection.execute("BEGIN")
+            for table in (self.list_name, *self.detail_tables.values()):
+                self.connection.execute(f"DROP TABLE IF EXISTS {self.quote(table + '_new')}")
+        self.connection.close()
+
+    @classmethod
+    def quote(cls, identifier: str) -> str:
+        """
+        Quotes an SQL identifier, column names having spaces and parentheses.
+
+        :param identifier: str
+            The table, column or index name.
+
+        :returns: The quoted identifier
+        """
+        return '"' + identifier.replace('"', '""') + '"'
@@ -0,0 +1,111 @@
+import re
+
+import bs4
+
+
+class ModificationsMatcher:
+    """
+    A class to represent a modifications list compiled once to be searched in a single walk of a modifications table.
+
+    An item of the list is either a modification name or a list of names whose first term is potentially encompassing:
+    if it exists in the table, the other terms are its subclasses and are not counted in the total.
+    A name ending with /strict/ has to match a whole cell text, other names only have to start it.
+
+    Attributes
+    ----------
+    modifications_list: tuple
+        The modifications list, as defined in the settings.
+    patterns: dict
+        The compiled regular expression of every modification name of the list, by name.
+
+    Methods
+    -------
+    get_modifications_counts(modifications_table)
+        Gets the count of every modification of the list found in a modifications table, and their total.
+    find_modifications(modifications_table)
+        Gets the count of every modification of the list in a modifications table, in a single walk of the table.
+    """
+    def __init__(self, modifications_list: tuple) -> None:
+        """
+        Constructs all the necessary attributes for the ModificationsMatcher object.
+
+        :param modifications_list: tuple
+            The modifications list, as defined in the settings.
+        """
+        self.modifications_list: tuple = modifications_list
+        self.patterns: dict = {}
+        for modification_item in modifications_list:
+            for modification in modification_item if type(modification_item) == list else [modification_item]:
+                if "/strict/" in modification:
+                    self.patterns[modification] = re.compile(
+                        r"^\s*" + re.escape(modification.replace("/strict/", "")) + r"\s*$", re.IGNORECASE)
+                else:
+                    self.patterns[modification] = re.compile(fr"^\s*{modification}", re.I)
+
+    def get_modifications_counts(self, modifications_table: bs4.element.Tag) -> tuple[dict, int]:
+        """
+        Gets the count of every modification of the list found in a modifications table, and their total.
+
+        :param modifications_table: bs4.element.Tag
+            The table from which to extract the modifications counts.
+
+        :returns: The count of every modification found, by name, and the total of the counted modifications
+        """
+        found_modifications = self.find_modifications(modifications_table)
+        modifications = {}
+        modifications_count = 0
+        for modification_item in self.modifications_list:
+            if type(modification_item) == list:
+                """
+                if modification_item is a list, check for the first term of the list (which is potentially encompassing)
+                if it exists, treat the other terms as subclasses and don't count them in the total
+                if it doesn't exist, treat the other terms as independent
+                """
+                is_subclass = False
+                for index, modification in enumerate(modification_item):
+                    modification_count = found_modifications.get(modification, 0)
+                    if modification_count > 0:
+                        modifications[modification.replace("/strict/", "")] = modification_count
+                        if not is_subclass:
+                            modifications_count += modification_count
+                        if index == 0:
+                            is_subclass = True
+            else:
+                modification_count = found_modifications.get(modification_item, 0)
+                if modification_count > 0:
+                    modifications[modification_item.replace("/strict/", "")] = modification_count
+                    modifications_count += modification_count
+        return modifications, modifications_count
+
+    def find_modifications(self, modifications_table: bs4.element.Tag) -> dict:
+        """
+        Gets the count of every modification of the list in a modifications table, in a single walk of the table.
+        Every modification is matched against the first table string it fits; its count is the rowspan
+        of the cell that string starts (or 1 without rowspan), 0 if the string does not start its cell.
+        Strings outside of a td cell (eg. headers) are not modifications and are skipped.
+
+        :param modifications_table: bs4.element.Tag
+            The table from which to extract the modifications counts.
+
+        :returns: The count of every modification name found in the table, by name
+        """
+        remaining_patterns = dict(self.patterns)
+        found_modifications = {}
+        for modification_content in modifications_table.find_all(string=True):
+            if not remaining_patterns:
+                break
+            for modification, pattern in list(remaining_patterns.items()):
+                if not pattern.search(modification_content):
+                    continue
+                modification_cell = modification_content.find_parent("td")
+                if modification_cell is None:
+                    break
+                del remaining_patterns[modification]
+                modification_count = 0
+                if modification_content.find_previous_sibling() is None:
+                    if "rowspan" in modification_cell.attrs:
+                        modification_count = int(modification_cell.attrs['rowspan'])
+                    else:
+                        modification_count = 1
+                found_modifications[modification] = modification_count
+        return found_modifications
@@ -0,0 +1,100 @@
+from src.classes.shared.record import Record
+from src.settings import VEHICLES_MODIFICATIONS_COLUMNS
+
+
+class VehicleRecord(Record):
+    """
+    A class to represent the typed data of a vehicle.
+
+    Attributes
+    ----------
+    category: str
+        Category of the vehicle.
+    type: str
+        Type of the vehicle.
+    body_style: str
+        Body style of the vehicle.
+    capacity: int
+        How many passengers the vehicle can carry.
+    speed_km: float
+        Speed (in km/h) of the vehicle.
+    speed_miles: float
+        Speed (in mph) of the vehicle.
+    drivetrain: str
+        Drivetrain of the vehicle.
+    total_modifications: int
+        How many modifications of VEHICLES_MODIFICATIONS_LIST are available for the vehicle.
+    theoretical_total_modifications: int
+        How many rows the modifications table of the vehicle has.
+    modifications: tuple
+        The count of every modification of VEHICLES_MODIFICATIONS_COLUMNS, in its order,
+        empty if the vehicle has no page and None if its page has no modifications table.
+    speeds_fields: tuple
+        The speeds fields, written with two decimals in the csv output.
+
+    Methods
+    -------
+    get_csv_value(field)
+        Gets the value of a field, as written in the csv output.
+    """
+    __slots__ = ("category", "type", "body_style", "capacity", "speed_km", "speed_miles", "drivetrain",
+                 "total_modifications", "theoretical_total_modifications", "modifications")
+    columns = {
+        **Record.columns,
+        "category": "category",
+        "type": "type",
+        "body style": "body_style",
+        "capacity": "capacity",
+        "speed (km/h)": "speed_km",
+        "speed (mph)": "speed_miles",
+        "drivetrain": "drivetrain",
+        "total modifications": "total_modifications",
+        "theoretical total modifications": "theoretical_total_modifications"
+    }
+    counts_fields = {"modifications": ("modifications", VEHICLES_MODIFICATIONS_COLUMNS)}
+    interned_fields = ("category", "type", "body_style", "drivetrain")
+    speeds_fields = ("speed (km/h)", "speed (mph)")
+
+    def __init__(self, name: str, page_url: str | None) -> None:
+        """
+        Constructs all the necessary attributes for the VehicleRecord object, every extracted value missing.
+
+        :param name: str
+            Name of the vehicle.
+        :param page_url: str
+            Url of the vehicle's page, None if it has none.
+        """
+        super().__init__(name, page_url)
+        self.category: str | None = None
+        self.type: str | None = None
+        self.body_style: str | None = None
+        self.capacity: int | None = None
+        self.speed_km: float | None = None
+        self.speed_miles: float | None = None
+        self.drivetrain: str | None = None
+        self.total_modifications: int | None = None
+        self.theoretical_total_modifications: int | None = None
+        self.modifications: tuple | None = ()
+
+    def get_csv_value(self, field: str):
+        """
+        Gets the value of a field, as written in the csv output.
+        The speeds are written with two decimals, as on the wiki pages,
+        and the modifications as a dict of the totals and of every counted modification.
+
+        :param field: str
+            The field name.
+
+        :returns: The value, an empty string if it is missing
+        """
+        if field in self.speeds_fields:
+            speed = self.get_value(field)
+            return "" if speed is None else f"{speed:.2f}"
+        if field != "modifications":
+            return super().get_csv_value(field)
+        if self.modifications is None:
+            return ""
+        if not self.modifications:
+            return str({})
+        return str({"total": self.total_modifications, "theoretical total": self.theoretical_total_modifications,
+                    **dict(self.get_counts("modifications"))})
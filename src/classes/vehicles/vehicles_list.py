@@ -1,11 +1,20 @@
+import logging
+import re
 from itertools import islice
+from typing import Iterator
+
+from bs4 import SoupStrainer
 
 from src.functions.extract import get_soup
+from src.functions.pipeline import iter_extracted_items
 from src.classes.shared.cache import Cache
 from src.classes.shared.scraped_list import ScrapedList
-from src.settings import LOG_LEVEL, GENERATE_EXCEL_READY_CSV, EXCEL_HYPERLINK_FORMAT, \
-    VEHICLES_PAGE_OUTPUT, VEHICLES_ITERATION_START, VEHICLES_ITERATION_STOP, VEHICLES_CACHE_EXPIRATION_IN_HOURS
+from src.settings import VEHICLES_PAGE_URL, VEHICLES_PAGE_OUTPUT, VEHICLES_OUTPUT, VEHICLES_FIELDNAMES, VEHICLES_SCHEMA, \
+    VEHICLES_ITERATION_START, VEHICLES_ITERATION_STOP, VEHICLES_CACHE_EXPIRATION_IN_HOURS
 from src.classes.vehicles.vehicle import Vehicle
+from src.classes.vehicles.vehicle_record import VehicleRecord
+
+logger = logging.getLogger(__name__)
 
 
 class VehiclesList(ScrapedList):
@@ -25,9 +34,22 @@ class VehiclesList(ScrapedList):
     -------
     extract_list()
         Extracts the list of vehicles from the url.
-    extract_data()
-        Extracts individual data for every vehicle in the list that has its own url.
+    get_items()
+        Creates a vehicle for every entry of the list.
+    iter_records()
+        Extracts individual data for every vehicle in the list that has its own url, yielding every finished record.
     """
+    """Classes are matched as a whole string while parsing: match wikitable among the other table classes"""
+    parse_profile = SoupStrainer("table", class_=re.compile(r"\bwikitable\b"))
+    list_name = "vehicles"
+    list_page_url = VEHICLES_PAGE_URL
+    list_page_output = VEHICLES_PAGE_OUTPUT
+    output_name = VEHICLES_OUTPUT
+    fieldnames = VEHICLES_FIELDNAMES
+    schema = VEHICLES_SCHEMA
+    check_timestamp_name = "vehicles_check_timestamp"
+    cache_expiration_in_hours = VEHICLES_CACHE_EXPIRATION_IN_HOURS
+
     def __init__(self, page_url: str, output_file: str) -> None:
         """
         Constructs all the necessary attributes for the VehiclesList object.
@@ -47,7 +69,7 @@ class VehiclesList(ScrapedList):
         }
 
         """Extract the vehicles list from the soup"""
-        soup = get_soup(VEHICLES_PAGE_OUTPUT)
+        soup = get_soup(self.output_file, self.parse_profile)
         vehicles_list = soup.find_all("table", class_="wikitable")[-1].find_all("li")
 
         """Some vehicles have no link, detect them and scrape them accordingly"""
@@ -63,48 +85,36 @@ class VehiclesList(ScrapedList):
             vehicles["vehicles"].append({"name": vehicle_name, "page url": vehicle_page_url})
         vehicles["items"] = items
         self.list = vehicles
-        Cache.check_for_differences("vehicles", self.list['items'])
+        self.entries = {vehicle["name"]: vehicle["page url"] for vehicle in self.list["vehicles"]}
+        self.items_to_scrape = Cache.check_for_differences("vehicles", self.entries)
         Cache.set_list_items("vehicles", self.list['items'])
 
 
-    def extract_data(self) -> None:
-        """Extracts individual data for every vehicle in the list."""
-        if Cache.is_refresh_needed("vehicles_check_timestamp", VEHICLES_CACHE_EXPIRATION_IN_HOURS):
-            print("Vehicles cache is outdated, let's go scraping...")
+    def get_items(self) -> Iterator[Vehicle]:
+        """Creates a vehicle for every entry of the list, one at a time."""
+        return (Vehicle(item["name"], item["page url"])
+                for item in islice(self.list["vehicles"], VEHICLES_ITERATION_START, VEHICLES_ITERATION_STOP))
+
+    def iter_records(self) -> Iterator[VehicleRecord]:
+        """Extracts individual data for every vehicle in the list, yielding every record as soon as it is finished."""
+        if Cache.is_refresh_needed(self.check_timestamp_name, self.cache_expiration_in_hours):
+            logger.info("Vehicles cache is outdated, let's go scraping...")
             refresh = True
         else:
-            print("Vehicles cache is still up to date, working with it...")
+            logger.info("Vehicles cache is still up to date, working with it...")
             refresh = False
 
-        """For each vehicle in the list that has a page, extract and store the full data"""
-        for index, item in enumerate(islice(self.list["vehicles"], VEHICLES_ITERATION_START, VEHICLES_ITERATION_STOP)):
-            print(f"Processing {index}: {item['name']}...")
-            if LOG_LEVEL == "info": print(f"Page: {item["link"]}")
+        """Check which vehicle pages need scraping"""
+        pages = self.get_pages_to_scrape(self.get_items(), refresh)
 
-            vehicle = Vehicle(item["name"], item["page url"])
-            if item["page url"]:
-                vehicle.get_item_data(refresh)
+        """Download and extract the full data of every vehicle in the list that has a page, batch by batch"""
+        for index, vehicle in enumerate(iter_extracted_items(self.get_items(), pages, self.revisions_ids, self.failed_items)):
+            logger.info("Processing %s: %s...", index, vehicle.name)
+            logger.debug("Page: %s", vehicle.page_url)
+            record = vehicle.record
 
-            """If asked to generate an excel-compatible csv, modify the links"""
-            if GENERATE_EXCEL_READY_CSV:
-                page_url = "=[BATCH_DELETE_THIS]" + EXCEL_HYPERLINK_FORMAT + "(\"" + vehicle.page_url + "\";\"" + vehicle.name + "\")"
-                image_url = "=[BATCH_DELETE_THIS]" + EXCEL_HYPERLINK_FORMAT + "(\"" + vehicle.image + "\";\"" + vehicle.name + "\")"
-            else:
-                page_url = vehicle.page_url
-                image_url = vehicle.image_url
-
-            self.list["vehicles"][index] = {
-                "name": vehicle.name,
-                "page url": page_url,
-                "image url": image_url,
-                "category": vehicle.category,
-                "type": vehicle.type,
-                "body style": vehicle.body_style,
-                "capacity": vehicle.capacity,
-                "speed (km/h)": vehicle.speed_km,
-                "speed (mph)": vehicle.speed_miles,
-                "drivetrain": vehicle.drivetrain,
-                "modifications": vehicle.modifications
-            }
-        print("All vehicles data extracted!")
-        Cache.set_checked_timestamp("vehicles_check_timestamp", force_refresh=False)
\ No newline at end of file
+            logger.debug("Record: %s", record)
+            yield record
+        logger.info("All vehicles data extracted!")
+        self.save_entries()
+        Cache.set_checked_timestamp(self.check_timestamp_name, force_refresh=False)
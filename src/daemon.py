@@ -0,0 +1,30 @@
+import signal
+import sys
+from pathlib import Path
+
+from src.settings import SCRAPED_FOLDER, PAGE_STORE_FOLDER, OUTPUT_FOLDER
+from src.functions.logs import configure_logging
+from src.functions.pipeline import shutdown_parsing_executor
+from src.classes.shared.daemon import Daemon
+from src.main import get_scraped_lists
+
+
+def main() -> None:
+    """Keeps scraping every list when its cache expires, until interrupted or stopped."""
+    configure_logging()
+    Path(SCRAPED_FOLDER).mkdir(parents=True, exist_ok=True)
+    Path(OUTPUT_FOLDER).mkdir(parents=True, exist_ok=True)
+    Path(PAGE_STORE_FOLDER).mkdir(parents=True, exist_ok=True)
+
+    """Stop cleanly when the container is stopped"""
+    signal.signal(signal.SIGTERM, lambda signal_number, frame: sys.exit(0))
+    try:
+        Daemon(get_scraped_lists()).run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_parsing_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,101 @@
+import logging
 import re
+import threading
 
 import bs4
 import unicodedata
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
+from src.classes.shared.metrics import Metrics
+from src.classes.shared.page_store import PageStore
+from src.classes.shared.replay_adapter import ReplayAdapter
+from src.functions.replay import record_response, start_replay_server
+from src.settings import HTTP_USER_AGENT, HTTP_TIMEOUT_IN_SECONDS, HTTP_MAX_RETRIES, HTTP_POOL_SIZE, HTTP_MODE, \
+    REPLAY_SERVER_URL
 
-def scrape_page(url:str, output_file:str) -> None:
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+logger = logging.getLogger(__name__)
+
+http_session: requests.Session | None = None
+http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
     """
-    Scrapes a page url and saves it locally.
+    Get the HTTP session shared by every download, creating it on first use.
+    It keeps connections alive between requests and asks for compressed (gzip, and brotli when available) responses.
+    In record mode every response is recorded, in replay mode every request is sent to the replay server
+    (the one of REPLAY_SERVER_URL, or one started on first use).
+
+    :return: shared HTTP session
+    """
+    global http_session
+    with http_session_lock:
+        if http_session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+            retries = Retry(total=HTTP_MAX_RETRIES, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504))
+            adapter_arguments = {"pool_connections": HTTP_POOL_SIZE, "pool_maxsize": HTTP_POOL_SIZE, "max_retries": retries}
+            if HTTP_MODE == "replay":
+                adapter = ReplayAdapter(REPLAY_SERVER_URL or start_replay_server().get_url(), **adapter_arguments)
+            else:
+                adapter = HTTPAdapter(**adapter_arguments)
+            if HTTP_MODE == "record":
+                session.hooks["response"].append(record_response)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            http_session = session
+        return http_session
+
+def scrape_page(url:str, output_file:str, revision_id: int | None = None) -> bool:
+    """
+    Scrapes a page url and streams it to the page store.
+    If the page was already scraped, the download is conditional: an unchanged page is not downloaded nor written again.
 
     :param url: url of the page to scrape.
-    :param output_file: str: filename for the local file to save.
+    :param output_file: str: name of the page in the page store (its path in SCRAPED_FOLDER).
+    :param revision_id: int: wiki revision id of the page, if known, to store with it.
+
+    :return: True if the page was written, False if it was still up to date
     """
-    print(f"Scraping {url}...")
-    page = requests.get(url)
-    f = open(output_file, "w")
-    f.write(str(page.content))
-    f.close()
-    print(f"Scraping done!")
+    logger.info("Scraping %s...", url)
+    headers = {}
+    metadata = {}
+    if PageStore.has_page(output_file):
+        metadata = PageStore.get_metadata(output_file)
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+    with Metrics.timer("page_fetch"), \
+            get_http_session().get(url, headers=headers, timeout=HTTP_TIMEOUT_IN_SECONDS, stream=True) as page:
+        if page.status_code == 304:
+            if revision_id is not None and metadata.get("revision_id") != revision_id:
+                PageStore.set_metadata(output_file, metadata | {"revision_id": revision_id})
+            Metrics.increment("pages", source="not_modified")
+            logger.info("%s is still up to date!", url)
+            return False
+        page.raise_for_status()
+        PageStore.write_page(output_file, page.iter_content(chunk_size=65536), {
+            "etag": page.headers.get("ETag"),
+            "last_modified": page.headers.get("Last-Modified"),
+            "revision_id": revision_id
+        })
+        """Count the bytes read from the connection, before decompression"""
+        Metrics.increment("bytes_downloaded", page.raw.tell())
+    Metrics.increment("pages", source="downloaded")
+    logger.info("Scraping %s done!", url)
+    return True
 
 def get_normalized_filename(name: str) -> str:
     """
@@ -33,13 +109,14 @@ def get_normalized_filename(name: str) -> str:
     filename = re.sub(r'[^\w\s-]', '', filename.lower())
     return re.sub(r'[-\s]+', '-', filename).strip('-_')
 
-def get_soup(local_file: str) -> bs4.element.Tag:
+def get_soup(local_file: str, parse_profile: SoupStrainer | None = None) -> bs4.element.Tag:
     """
-    Get soup from a local scraped file
+    Get soup from a page of the page store, using lxml when it is installed
 
-    :param local_file: local scraped file from which to extract soup
+    :param local_file: name of the scraped page from which to extract soup
+    :param parse_profile: the elements to build, with their content (the whole page if None)
 
     :return: soup
     """
-    with open(local_file, "r") as file:
-        return BeautifulSoup(file, 'html.parser')
\ No newline at end of file
+    with PageStore.open_page(local_file) as file:
+        return BeautifulSoup(file, HTML_PARSER, parse_only=parse_profile)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import requests
+
+from src.classes.shared.metrics import Metrics
+from src.functions.extract import scrape_page
+from src.settings import FETCH_MAX_WORKERS, FETCH_MAX_WORKERS_PER_HOST
+
+logger = logging.getLogger(__name__)
+
+hosts_semaphores: dict[str, threading.BoundedSemaphore] = {}
+hosts_semaphores_lock = threading.Lock()
+fetch_executor: ThreadPoolExecutor | None = None
+fetch_executor_lock = threading.Lock()
+
+
+def get_host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """
+    Get the semaphore limiting the number of simultaneous downloads from the url's host
+
+    :param url: url of the page to download
+
+    :return: semaphore of the url's host
+    """
+    host = urlparse(url).netloc
+    with hosts_semaphores_lock:
+        if host not in hosts_semaphores:
+            hosts_semaphores[host] = threading.BoundedSemaphore(FETCH_MAX_WORKERS_PER_HOST)
+        return hosts_semaphores[host]
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """
+    Get the download threads shared by every list, creating them on first use,
+    so that FETCH_MAX_WORKERS bounds the downloads of every list running at the same time
+
+    :return: shared download threads
+    """
+    global fetch_executor
+    with fetch_executor_lock:
+        if fetch_executor is None:
+            fetch_executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="fetch")
+        return fetch_executor
+
+def fetch_page(url: str, output_file: str, revision_id: int | None = None) -> None:
+    """
+    Scrapes a page url and saves it locally, waiting for its host to have a free slot.
+
+    :param url: url of the page to scrape.
+    :param output_file: filename for the local file to save.
+    :param revision_id: wiki revision id of the page, if known.
+    """
+    with get_host_semaphore(url):
+        scrape_page(url, output_file, revision_id)
+
+def fetch_pages(pages: list[tuple[str, str]], revisions_ids: dict[str, int] | None = None) -> list[tuple[str, str]]:
+    """
+    Scrapes several pages concurrently, on the shared download threads, and saves them locally.
+    Returns only once every download is done, a failed download is reported and leaves the local file untouched.
+
+    :param pages: list of (url, output_file) to scrape.
+    :param revisions_ids: wiki revision id of the pages, by url, if known.
+
+    :return: the (url, output_file) of the failed downloads
+    """
+    revisions_ids = revisions_ids or {}
+    executor = get_fetch_executor()
+    futures = {executor.submit(fetch_page, url, output_file, revisions_ids.get(url)): (url, output_file)
+               for url, output_file in pages}
+    failed_pages = []
+    for future in as_completed(futures):
+        try:
+            future.result()
+        except (requests.RequestException, OSError) as error:
+            Metrics.increment("fetch_failures")
+            logger.warning("Scraping %s failed: %s", futures[future][0], error)
+            failed_pages.append(futures[future])
+    return failed_pages
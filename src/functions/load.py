@@ -1,16 +1,56 @@
-import csv
+import logging
+from contextlib import ExitStack
+from typing import Iterable
 
-def load_data_to_csv(data_list: dict, csv_output: str, fieldnames: tuple) -> None:
+from src.classes.shared.record import Record
+from src.classes.shared.sink import Sink
+from src.classes.sinks.change_feed_sink import ChangeFeedSink
+from src.classes.sinks.csv_sink import CsvSink
+from src.classes.sinks.json_lines_sink import JsonLinesSink
+from src.classes.sinks.parquet_sink import ParquetSink
+from src.classes.sinks.sqlite_sink import SqliteSink
+from src.settings import OUTPUT_FORMATS
+
+logger = logging.getLogger(__name__)
+
+SINKS = {sink_class.output_format: sink_class for sink_class in (CsvSink, JsonLinesSink, ParquetSink, SqliteSink, ChangeFeedSink)}
+
+
+def get_sinks(output_name: str, fieldnames: tuple, schema: dict, output_formats: Iterable[str] = OUTPUT_FORMATS) -> list[Sink]:
+    """
+    Opens a sink for every output format, skipping the unknown ones and the ones whose dependencies are missing
+
+    :param output_name: output file name, without extension
+    :param fieldnames: fields of the data
+    :param schema: type of every typed column, by column name
+    :param output_formats: output formats to write (OUTPUT_FORMATS by default)
+
+    :return: the opened sinks
+    """
+    sinks = []
+    for output_format in output_formats:
+        sink_class = SINKS.get(output_format)
+        if sink_class is None:
+            logger.warning("Unknown output format %s, expected one of %s", output_format, ", ".join(SINKS))
+        elif not sink_class.is_available():
+            logger.warning("Missing dependencies for the %s output format, skipping it", output_format)
+        else:
+            sinks.append(sink_class(f"{output_name}.{sink_class.extension}", fieldnames, schema))
+    return sinks
+
+def load_data(data_list: Iterable[Record], output_name: str, fieldnames: tuple, schema: dict,
+              output_formats: Iterable[str] = OUTPUT_FORMATS) -> None:
     """
-    Saves the data in a csv file
+    Saves the data in a file per output format, row by row as the data comes
 
-    :param data_list: data to save
-    :param csv_output: output csv file name
-    :param fieldnames: csv fieldnames
+    :param data_list: records to save
+    :param output_name: output file name, without extension
+    :param fieldnames: fields of the data
+    :param schema: type of every typed column, by column name
+    :param output_formats: output formats to write (OUTPUT_FORMATS by default)
     """
-    with open(csv_output, "w", newline='', encoding='utf-8') as output:
-        writer = csv.DictWriter(output, fieldnames = fieldnames, delimiter = ",")
-        writer.writeheader()
+    with ExitStack() as stack:
+        sinks = [stack.enter_context(sink) for sink in get_sinks(output_name, fieldnames, schema, output_formats)]
         for data in data_list:
-            writer.writerow(data)
-    print(f"CSV file created : {csv_output}")
\ No newline at end of file
+            for sink in sinks:
+                sink.write(data)
@@ -0,0 +1,22 @@
+import logging
+import sys
+
+from src.classes.shared.json_formatter import JsonFormatter
+from src.settings import LOG_LEVEL, LOG_FORMAT
+
+LOG_LEVELS = {"debug": logging.DEBUG, "info": logging.INFO, "warn": logging.WARNING, "warning": logging.WARNING,
+              "error": logging.ERROR}
+
+
+def configure_logging() -> None:
+    """
+    Configures the logs of the scraper modules: LOG_LEVEL and up are written to the standard output,
+    as plain messages or as JSON lines if LOG_FORMAT is json.
+    Can be called again, in a worker process for instance, without duplicating the logs.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter("%(message)s"))
+    logger = logging.getLogger("src")
+    logger.handlers = [handler]
+    logger.setLevel(LOG_LEVELS.get((LOG_LEVEL or "").lower(), logging.INFO))
+    logger.propagate = False
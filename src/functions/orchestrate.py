@@ -0,0 +1,72 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
+
+from src.classes.shared.cache import Cache
+from src.classes.shared.metrics import Metrics
+from src.classes.shared.scraped_list import ScrapedList
+from src.functions.fetch import fetch_pages
+from src.functions.load import load_data
+from src.functions.pipeline import shutdown_parsing_executor
+from src.settings import GLOBAL_CACHE_EXPIRATION_IN_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+def run_list(scraped_list_class: type[ScrapedList]) -> None:
+    """
+    Analyzes a list page, then extracts the data of its items and saves it in every output format as it comes
+
+    :param scraped_list_class: ScrapedList subclass of the list
+    """
+    with Metrics.timer("list_run", list=scraped_list_class.list_name):
+        scraped_list = scraped_list_class(scraped_list_class.list_page_url, scraped_list_class.list_page_output)
+        scraped_list.extract_list()
+        load_data(scraped_list.iter_records(), scraped_list_class.output_name, scraped_list_class.fieldnames,
+                  scraped_list_class.schema)
+
+def refresh_list_pages(scraped_lists: tuple[type[ScrapedList], ...]) -> None:
+    """
+    Downloads every list page together if the global cache is outdated
+
+    :param scraped_lists: ScrapedList subclasses of the lists
+    """
+    if Cache.is_refresh_needed("global_check_timestamp", GLOBAL_CACHE_EXPIRATION_IN_HOURS):
+        logger.info("Global cache outdated, let's go scraping...")
+        if not fetch_pages([(scraped_list.list_page_url, scraped_list.list_page_output) for scraped_list in scraped_lists]):
+            Cache.set_checked_timestamp("global_check_timestamp", False)
+    else:
+        logger.info("Global cache still up to date, let's work with it")
+
+def run_each_list(run: Callable[[type[ScrapedList]], None], scraped_lists: tuple[type[ScrapedList], ...]) -> None:
+    """
+    Runs a function for every list at the same time, their downloads sharing the fetch threads and per-host limits
+    and their parsing sharing the parsing processes.
+    A failed list does not stop the other ones, its error is raised once they are all done.
+
+    :param run: function running a list
+    :param scraped_lists: ScrapedList subclasses of the lists to run
+    """
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(len(scraped_lists), 1), thread_name_prefix="list") as executor:
+        futures = {executor.submit(run, scraped_list): scraped_list for scraped_list in scraped_lists}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                logger.exception("The %s list failed", futures[future].list_name)
+                errors.append(error)
+    if errors:
+        raise errors[0]
+
+def run_lists(scraped_lists: tuple[type[ScrapedList], ...]) -> None:
+    """
+    Refreshes the list pages, then runs every list of the registry at the same time
+
+    :param scraped_lists: ScrapedList subclasses of the lists to run
+    """
+    refresh_list_pages(scraped_lists)
+    try:
+        run_each_list(run_list, scraped_lists)
+    finally:
+        shutdown_parsing_executor()
@@ -0,0 +1,73 @@
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.classes.shared.extraction_cache import ExtractionCache
+from src.classes.shared.metrics import Metrics
+from src.classes.shared.page_store import PageStore
+from src.classes.shared.scraped_item import ScrapedItem
+
+logger = logging.getLogger(__name__)
+
+
+def parse_item(item: ScrapedItem) -> tuple[dict, float]:
+    """
+    Extracts an item data from its scraped page
+
+    :param item: item to extract
+
+    :return: data extracted from the item's page, and the time it took in seconds
+    """
+    start = time.perf_counter()
+    item.get_item_data()
+    return item.get_record(), time.perf_counter() - start
+
+def parse_items(items: list[ScrapedItem], executor: ProcessPoolExecutor | None = None) -> set:
+    """
+    Extracts the data of every item that has a page from its scraped page, spreading the parsing over the executor processes.
+    Pages already extracted with the same extractors are not parsed again: the extraction cache is only read here,
+    never in the parsing processes, and new records are kept in memory until the list is saved.
+    The items are updated in place, in their original order.
+
+    :param items: items to extract
+    :param executor: process pool in which to parse the pages (they are parsed one by one if None)
+
+    :return: content hashes of the items pages
+    """
+    items_with_page = [item for item in items if item.page_url]
+    if not items_with_page:
+        return set()
+    item_class = type(items_with_page[0])
+    item_type = item_class.scraped_subfolder
+    pages_hashes = {id(item): PageStore.get_page_hash(item.get_scraped_page_filename()) for item in items_with_page}
+
+    """Set the records of the pages already extracted, parse the other ones"""
+    items_to_parse = []
+    for item in items_with_page:
+        cached_record = ExtractionCache.get_record(item_class, pages_hashes[id(item)])
+        if cached_record is not None:
+            item.set_record(cached_record)
+        else:
+            items_to_parse.append(item)
+    Metrics.increment("records", len(items_with_page) - len(items_to_parse), item_type=item_type, source="cache")
+    if not items_to_parse:
+        return set(pages_hashes.values())
+
+    if executor is not None and len(items_to_parse) > 1:
+        results = list(executor.map(parse_item, items_to_parse))
+    else:
+        results = [parse_item(item) for item in items_to_parse]
+    for item, (record, parse_time) in zip(items_to_parse, results):
+        item.set_record(record)
+        ExtractionCache.set_record(item_class, pages_hashes[id(item)], record)
+
+        """Measure the parsing, and count the fields the extractors could not find"""
+        Metrics.observe("page_parse", parse_time, item_type=item_type)
+        missing_fields = [field for field, value in record.items() if value is None or value == ""]
+        for field in missing_fields:
+            Metrics.increment("extractor_misses", item_type=item_type, field=field)
+        if missing_fields:
+            logger.warning("%s: unknown %s", item.name, ", ".join(missing_fields),
+                           extra={"item": item.name, "missing_fields": missing_fields})
+    Metrics.increment("records", len(items_to_parse), item_type=item_type, source="parsed")
+    return set(pages_hashes.values())
@@ -0,0 +1,125 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+
+from src.classes.shared.extraction_cache import ExtractionCache
+from src.classes.shared.metrics import Metrics
+from src.classes.shared.page_store import PageStore
+from src.classes.shared.scraped_item import ScrapedItem
+from src.functions.fetch import fetch_pages
+from src.functions.logs import configure_logging
+from src.functions.parse import parse_items
+from src.settings import PARSING_PROCESSES, PIPELINE_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+parsing_executor: ProcessPoolExecutor | None = None
+parsing_executor_lock = threading.Lock()
+
+
+def get_parsing_executor() -> ProcessPoolExecutor | None:
+    """
+    Get the parsing processes shared by every list, creating them on first use,
+    so that PARSING_PROCESSES bounds the parsing of every list running at the same time.
+    They are started from a fork server: forking the scraper while its other threads hold locks could deadlock them.
+
+    :return: shared parsing processes, None if PARSING_PROCESSES is 1
+    """
+    global parsing_executor
+    if PARSING_PROCESSES <= 1:
+        return None
+    with parsing_executor_lock:
+        if parsing_executor is None:
+            parsing_executor = ProcessPoolExecutor(max_workers=PARSING_PROCESSES, initializer=configure_logging,
+                                                   mp_context=multiprocessing.get_context("forkserver"))
+        return parsing_executor
+
+def shutdown_parsing_executor() -> None:
+    """Stops the shared parsing processes, if they were started"""
+    global parsing_executor
+    with parsing_executor_lock:
+        if parsing_executor is not None:
+            parsing_executor.shutdown()
+            parsing_executor = None
+
+def iter_batches(items: Iterable[ScrapedItem]) -> Iterator[list[ScrapedItem]]:
+    """
+    Splits items in batches of PIPELINE_BATCH_SIZE items
+
+    :param items: items to split
+
+    :return: batches of items, in their original order
+    """
+    items = iter(items)
+    while batch := list(islice(items, PIPELINE_BATCH_SIZE)):
+        yield batch
+
+def get_unavailable_items(batch: list[ScrapedItem], failed_pages: list[tuple[str, str]], failed_items: set) -> set:
+    """
+    Gets the items of a batch whose page download failed and that have no previously stored page to extract instead
+
+    :param batch: items of the batch
+    :param failed_pages: (url, output_file) of the failed downloads of the batch
+    :param failed_items: names of the items whose page download failed, updated with the ones of the batch
+
+    :return: ids of the items that can't be extracted
+    """
+    failed_pages = set(failed_pages)
+    unavailable_items = set()
+    for item in batch:
+        scraped_page_filename = item.get_scraped_page_filename() if item.page_url else None
+        if (item.page_url, scraped_page_filename) not in failed_pages:
+            continue
+        failed_items.add(item.name)
+        if not PageStore.has_page(scraped_page_filename):
+            logger.warning("%s: page unavailable, only the list data is kept", item.name, extra={"item": item.name})
+            unavailable_items.add(id(item))
+    if unavailable_items:
+        Metrics.increment("records", len(unavailable_items), item_type=batch[0].scraped_subfolder, source="list")
+    return unavailable_items
+
+def iter_extracted_items(items: Iterable[ScrapedItem], pages: list[tuple[str, str]], revisions_ids: dict,
+                         failed_items: set | None = None) -> Iterator[ScrapedItem]:
+    """
+    Downloads and extracts items batch by batch, downloading the next batch pages while the current batch is parsed.
+    Only one batch is held in memory at once, and items are yielded in their original order as soon as their batch is done.
+    An item whose page download failed is extracted from its previously stored page, if any,
+    otherwise it is yielded with its list data only.
+
+    :param items: items to extract
+    :param pages: (url, output_file) of the pages that need to be scraped
+    :param revisions_ids: wiki revision id of the pages, by url
+    :param failed_items: names of the items whose page download failed, filled in batch by batch
+
+    :return: extracted items
+    """
+    pages_to_scrape = set(pages)
+    failed_items = failed_items if failed_items is not None else set()
+
+    def fetch_batch(batch: list[ScrapedItem]) -> list[tuple[str, str]]:
+        return fetch_pages([page for page in ((item.page_url, item.get_scraped_page_filename()) for item in batch)
+                            if page in pages_to_scrape], revisions_ids)
+
+    item_class = None
+    pages_hashes = set()
+    executor = get_parsing_executor()
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        batches = iter_batches(items)
+        batch = next(batches, None)
+        batch_fetch = prefetcher.submit(fetch_batch, batch) if batch else None
+        while batch:
+            unavailable_items = get_unavailable_items(batch, batch_fetch.result(), failed_items)
+            next_batch = next(batches, None)
+            if next_batch:
+                batch_fetch = prefetcher.submit(fetch_batch, next_batch)
+            pages_hashes |= parse_items([item for item in batch if id(item) not in unavailable_items], executor)
+            item_class = type(batch[0])
+            yield from batch
+            batch = next_batch
+
+    """Once every item is extracted, save the records once, dropping the ones of the pages that left the list"""
+    if item_class is not None:
+        ExtractionCache.save(item_class, pages_hashes)
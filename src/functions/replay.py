@@ -0,0 +1,41 @@
+import logging
+import threading
+
+import requests
+
+from src.classes.shared.recordings import Recordings
+from src.classes.shared.replay_server import ReplayServer
+from src.settings import REPLAY_LATENCY_IN_MS, REPLAY_ERROR_RATE, REPLAY_NOT_MODIFIED
+
+logger = logging.getLogger(__name__)
+
+
+def record_response(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """
+    Records a response received by the HTTP session, as a response hook.
+    Its body is read at once (and still readable by the caller), a 304 keeps the previous recording of its request.
+
+    :param response: response to record
+
+    :return: the response, unchanged
+    """
+    if response.status_code != 304:
+        Recordings.save(response.request.method, response.request.url, response.status_code,
+                        dict(response.headers), response.content)
+        logger.debug("Recorded %s %s", response.request.method, response.request.url)
+    return response
+
+def start_replay_server(host: str = "127.0.0.1", port: int = 0) -> ReplayServer:
+    """
+    Starts a replay server serving the recordings in a background thread,
+    with the latency, error rate and not modified mode of the settings
+
+    :param host: host to listen on
+    :param port: port to listen on, 0 picks a free port
+
+    :return: the running replay server
+    """
+    server = ReplayServer((host, port), REPLAY_LATENCY_IN_MS / 1000, REPLAY_ERROR_RATE, REPLAY_NOT_MODIFIED)
+    threading.Thread(target=server.serve_forever, name="replay-server", daemon=True).start()
+    logger.info("Replay server listening on %s", server.get_url())
+    return server
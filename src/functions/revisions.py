@@ -0,0 +1,57 @@
+from urllib.parse import urlparse, unquote
+
+from src.functions.extract import get_http_session
+from src.settings import WIKI_API_URL, WIKI_API_BATCH_SIZE, HTTP_TIMEOUT_IN_SECONDS
+
+
+def get_page_title(page_url: str) -> str:
+    """
+    Get the wiki page title from a page url
+
+    :param page_url: url of the wiki page
+
+    :return: title of the page
+    """
+    return unquote(urlparse(page_url).path.removeprefix("/wiki/")).replace("_", " ")
+
+def get_latest_revisions_ids(page_urls: list[str]) -> dict[str, int]:
+    """
+    Get the latest revision id of several wiki pages, using batched MediaWiki API calls
+
+    :param page_urls: urls of the wiki pages
+
+    :return: latest revision id by page url, pages missing from the wiki are left out
+    """
+    titles = {}
+    for page_url in page_urls:
+        titles.setdefault(get_page_title(page_url), []).append(page_url)
+
+    revisions_ids = {}
+    batch = list(titles)
+    for start in range(0, len(batch), WIKI_API_BATCH_SIZE):
+        response = get_http_session().get(WIKI_API_URL, params={
+            "action": "query",
+            "prop": "revisions",
+            "rvprop": "ids",
+            "redirects": 1,
+            "titles": "|".join(batch[start:start + WIKI_API_BATCH_SIZE]),
+            "format": "json",
+            "formatversion": 2,
+        }, timeout=HTTP_TIMEOUT_IN_SECONDS)
+        response.raise_for_status()
+        query = response.json().get("query", {})
+
+        """Follow the title normalizations and redirects back to the requested titles"""
+        requested_titles = {}
+        for title in batch[start:start + WIKI_API_BATCH_SIZE]:
+            requested_titles.setdefault(title, []).append(title)
+        for conversion in query.get("normalized", []) + query.get("redirects", []):
+            requested_titles.setdefault(conversion["to"], []).extend(requested_titles.pop(conversion["from"], []))
+
+        for page in query.get("pages", []):
+            if page.get("missing") or not page.get("revisions"):
+                continue
+            for title in requested_titles.get(page["title"], []):
+                for page_url in titles[title]:
+                    revisions_ids[page_url] = page["revisions"][0]["revid"]
+    return revisions_ids
@@ -1,49 +1,55 @@
+import logging
 from pathlib import Path
 
-from src.settings import SCRAPED_FOLDER, OUTPUT_FOLDER, \
-    VEHICLES_PAGE_URL, VEHICLES_PAGE_OUTPUT, VEHICLES_CSV_OUTPUT, VEHICLES_FIELDNAMES, \
-    APARTMENTS_PAGE_URL, APARTMENTS_PAGE_OUTPUT, APARTMENTS_CSV_OUTPUT, APARTMENTS_FIELDNAMES, \
-    GLOBAL_CACHE_EXPIRATION_IN_HOURS, LOG_LEVEL
-from src.functions.load import load_data_to_csv
-from src.functions.extract import scrape_page
-from src.classes.vehicles.vehicles_list import VehiclesList
-from src.classes.apartments.apartments_list import ApartmentsList
-from src.classes.shared.cache import Cache
+from src.settings import SCRAPED_FOLDER, PAGE_STORE_FOLDER, OUTPUT_FOLDER, METRICS_JSON_OUTPUT, METRICS_PROMETHEUS_OUTPUT
+from src.functions.logs import configure_logging
+from src.classes.shared.fingerprint import Fingerprint
+from src.classes.shared.metrics import Metrics
 
+logger = logging.getLogger("src.main")
+
+
+def get_scraped_lists() -> tuple:
+    """
+    Gets every list scraped by a run, all of them at the same time.
+    They are imported on demand: they load bs4 and requests, which a run with up to date outputs never needs.
+
+    :return: ScrapedList subclasses of the lists
+    """
+    from src.classes.vehicles.vehicles_list import VehiclesList
+    from src.classes.apartments.apartments_list import ApartmentsList
+    return VehiclesList, ApartmentsList
 
 def main() -> None:
+    """Time the whole run, skipped if the outputs are up to date, then write its metrics even if it failed"""
+    configure_logging()
+    try:
+        with Metrics.timer("run"):
+            if Fingerprint.is_current():
+                Metrics.increment("skipped_runs")
+                logger.info("Outputs are up to date, nothing to do")
+            else:
+                run()
+    finally:
+        Metrics.write(METRICS_JSON_OUTPUT, METRICS_PROMETHEUS_OUTPUT)
+        logger.info("Metrics written : %s, %s", METRICS_JSON_OUTPUT, METRICS_PROMETHEUS_OUTPUT)
+
+def run() -> None:
+    """Scrapes every list and their items, then saves their data and the fingerprint of its inputs."""
+    from src.functions.orchestrate import run_lists
+
     """Check and create paths"""
     Path(SCRAPED_FOLDER).mkdir(parents=True, exist_ok=True)
     Path(OUTPUT_FOLDER).mkdir(parents=True, exist_ok=True)
-    Path(SCRAPED_FOLDER + "/vehicles").mkdir(parents=True, exist_ok=True)
+    Path(PAGE_STORE_FOLDER).mkdir(parents=True, exist_ok=True)
     Path(OUTPUT_FOLDER + "/vehicles").mkdir(parents=True, exist_ok=True)
-    Path(SCRAPED_FOLDER + "/apartments").mkdir(parents=True, exist_ok=True)
     Path(OUTPUT_FOLDER + "/apartments").mkdir(parents=True, exist_ok=True)
 
-    """If outdated, get content of the main vehicles page on GTA Wiki"""
-    if Cache.is_refresh_needed("global_check_timestamp", GLOBAL_CACHE_EXPIRATION_IN_HOURS):
-        print("Global cache outdated, let's go scraping...")
-        scrape_page(VEHICLES_PAGE_URL, VEHICLES_PAGE_OUTPUT)
-        scrape_page(APARTMENTS_PAGE_URL, APARTMENTS_PAGE_OUTPUT)
-        Cache.set_checked_timestamp("global_check_timestamp", False)
-    else:
-        print("Global cache still up to date, let's work with it")
-
-    """Analyze the page and extract the vehicles data"""
-    vehicles = VehiclesList(VEHICLES_PAGE_URL, VEHICLES_PAGE_OUTPUT)
-    vehicles.extract_list()
-    vehicles.extract_data()
-
-    """Analyze the page and extract the apartments data"""
-    apartments_list = ApartmentsList(APARTMENTS_PAGE_URL, APARTMENTS_PAGE_OUTPUT)
-    apartments_list.extract_list()
-    apartments_list.extract_data()
-
-    """Save data in csv files"""
-    if LOG_LEVEL == "debug": print(vehicles.list)
-    if LOG_LEVEL == "debug": print(apartments_list.list)
-    load_data_to_csv(vehicles.list["vehicles"], VEHICLES_CSV_OUTPUT, VEHICLES_FIELDNAMES)
-    load_data_to_csv(apartments_list.list["apartments"], APARTMENTS_CSV_OUTPUT, APARTMENTS_FIELDNAMES)
+    """Scrape every list page, then extract the data of their items and save it in every output format as it comes"""
+    scraped_lists = get_scraped_lists()
+    Fingerprint.clear()
+    run_lists(scraped_lists)
+    Fingerprint.save(scraped_lists)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,40 @@
+import logging
+import threading
+
+from src.classes.shared.query_server import QueryServer
+from src.functions.logs import configure_logging
+from src.settings import VEHICLES_OUTPUT, APARTMENTS_OUTPUT, FINGERPRINT_FILE, QUERY_SERVER_PORT, \
+    QUERY_RELOAD_INTERVAL_IN_SECONDS
+
+logger = logging.getLogger("src.query")
+
+"""The (equality fields, range fields) of every dataset, each by query parameter name"""
+DATASETS_FIELDS = {
+    "vehicles": (
+        {"category": "category", "type": "type", "body_style": "body style", "drivetrain": "drivetrain"},
+        {"speed": "speed (km/h)", "speed_mph": "speed (mph)", "capacity": "capacity"}
+    ),
+    "apartments": (
+        {"category": "category", "style": "style", "garage_capacity": "garage capacity"},
+        {"price": "price", "garage_capacity": "garage capacity"}
+    )
+}
+
+
+def main() -> None:
+    """Serves queries over the extracted datasets on QUERY_SERVER_PORT until interrupted, reloading them after every run."""
+    configure_logging()
+    server = QueryServer(("0.0.0.0", QUERY_SERVER_PORT),
+                         {"vehicles": f"{VEHICLES_OUTPUT}.jsonl", "apartments": f"{APARTMENTS_OUTPUT}.jsonl"},
+                         DATASETS_FIELDS, FINGERPRINT_FILE)
+    threading.Thread(target=server.watch, args=(QUERY_RELOAD_INTERVAL_IN_SECONDS,), name="query-reload", daemon=True).start()
+    logger.info("Query service listening on %s", server.get_url())
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import logging
+
+from src.classes.shared.replay_server import ReplayServer
+from src.functions.logs import configure_logging
+from src.settings import HTTP_RECORDINGS_FOLDER, REPLAY_SERVER_PORT, REPLAY_LATENCY_IN_MS, REPLAY_ERROR_RATE, \
+    REPLAY_NOT_MODIFIED
+
+logger = logging.getLogger("src.replay")
+
+
+def main() -> None:
+    """Serves the recorded responses on REPLAY_SERVER_PORT until interrupted, standing in for the wiki."""
+    configure_logging()
+    server = ReplayServer(("0.0.0.0", REPLAY_SERVER_PORT), REPLAY_LATENCY_IN_MS / 1000, REPLAY_ERROR_RATE, REPLAY_NOT_MODIFIED)
+    logger.info("Replaying %s on %s (latency %sms, error rate %s, 304 %s)", HTTP_RECORDINGS_FOLDER, server.get_url(),
+                REPLAY_LATENCY_IN_MS, REPLAY_ERROR_RATE, REPLAY_NOT_MODIFIED)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
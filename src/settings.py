@@ -4,30 +4,62 @@ from dotenv import load_dotenv
 
 load_dotenv()
 SCRAPED_FOLDER = os.getenv('SCRAPED_FOLDER')
+PAGE_STORE_FOLDER = f"{SCRAPED_FOLDER}/pages"
+EXTRACTION_CACHE_FOLDER = f"{SCRAPED_FOLDER}/extracted"
+CACHE_DATABASE = os.getenv('CACHE_DATABASE', f"{SCRAPED_FOLDER}/cache.sqlite")
+LEGACY_CACHE_FILE = "cache"
 OUTPUT_FOLDER = os.getenv('OUTPUT_FOLDER')
-LOG_LEVEL = os.getenv('LOG_LEVEL')
+LOG_LEVEL = os.getenv('LOG_LEVEL', "info")
+LOG_FORMAT = os.getenv('LOG_FORMAT', "text")
 GLOBAL_CACHE_EXPIRATION_IN_HOURS = int(os.getenv('GLOBAL_CACHE_EXPIRATION_IN_HOURS'))
 APARTMENTS_CACHE_EXPIRATION_IN_HOURS = int(os.getenv('APARTMENTS_CACHE_EXPIRATION_IN_HOURS'))
 VEHICLES_CACHE_EXPIRATION_IN_HOURS = int(os.getenv('VEHICLES_CACHE_EXPIRATION_IN_HOURS'))
 GENERATE_EXCEL_READY_CSV = True if os.getenv('GENERATE_EXCEL_READY_CSV') == "True" else False
 EXCEL_HYPERLINK_FORMAT = os.getenv('EXCEL_HYPERLINK_FORMAT')
 APARTMENTS_CACHE_EXPIRATION_IN_HOURS = int(os.getenv('APARTMENTS_CACHE_EXPIRATION_IN_HOURS'))
+FETCH_MAX_WORKERS = int(os.getenv('FETCH_MAX_WORKERS', 8))
+FETCH_MAX_WORKERS_PER_HOST = int(os.getenv('FETCH_MAX_WORKERS_PER_HOST', 4))
+HTTP_USER_AGENT = os.getenv('HTTP_USER_AGENT', "gta-wiki-scraper (+https://github.com/CpHeat/gta_wiki_scraper)")
+HTTP_TIMEOUT_IN_SECONDS = float(os.getenv('HTTP_TIMEOUT_IN_SECONDS', 30))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 3))
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', FETCH_MAX_WORKERS))
+PARSING_PROCESSES = int(os.getenv('PARSING_PROCESSES', os.cpu_count() or 1))
+PIPELINE_BATCH_SIZE = int(os.getenv('PIPELINE_BATCH_SIZE', 50))
+HTTP_MODE = os.getenv('HTTP_MODE', "live").lower()
+HTTP_RECORDINGS_FOLDER = os.getenv('HTTP_RECORDINGS_FOLDER', f"{SCRAPED_FOLDER}/recordings")
+REPLAY_SERVER_URL = os.getenv('REPLAY_SERVER_URL', "")
+REPLAY_SERVER_PORT = int(os.getenv('REPLAY_SERVER_PORT', 8080))
+REPLAY_LATENCY_IN_MS = float(os.getenv('REPLAY_LATENCY_IN_MS', 0))
+REPLAY_ERROR_RATE = float(os.getenv('REPLAY_ERROR_RATE', 0))
+REPLAY_NOT_MODIFIED = os.getenv('REPLAY_NOT_MODIFIED', "validators").lower()
+WIKI_API_URL = os.getenv('WIKI_API_URL', "https://gta.fandom.com/api.php")
+WIKI_API_BATCH_SIZE = int(os.getenv('WIKI_API_BATCH_SIZE', 50))
+DAEMON_MAX_SLEEP_IN_MINUTES = float(os.getenv('DAEMON_MAX_SLEEP_IN_MINUTES', 60))
+FINGERPRINT_FILE = os.getenv('FINGERPRINT_FILE', f"{OUTPUT_FOLDER}/fingerprint.json")
+QUERY_SERVER_PORT = int(os.getenv('QUERY_SERVER_PORT', 8081))
+QUERY_RELOAD_INTERVAL_IN_SECONDS = float(os.getenv('QUERY_RELOAD_INTERVAL_IN_SECONDS', 5))
+METRICS_JSON_OUTPUT = os.getenv('METRICS_JSON_OUTPUT', f"{OUTPUT_FOLDER}/metrics.json")
+METRICS_PROMETHEUS_OUTPUT = os.getenv('METRICS_PROMETHEUS_OUTPUT', f"{OUTPUT_FOLDER}/metrics.prom")
+DATASET_DATABASE = os.getenv('DATASET_DATABASE', f"{OUTPUT_FOLDER}/dataset.sqlite")
+OUTPUT_FORMATS = tuple(output_format.strip() for output_format in os.getenv('OUTPUT_FORMATS', "csv,jsonl,parquet,sqlite,changes").split(",") if output_format.strip())
 
 VEHICLES_PAGE_URL = "https://gta.fandom.com/wiki/Vehicles_in_GTA_Online"
 VEHICLES_PAGE_OUTPUT = f"{SCRAPED_FOLDER}/vehicles.html"
-VEHICLES_CSV_OUTPUT = f"{OUTPUT_FOLDER}/vehicles.csv"
+VEHICLES_OUTPUT = f"{OUTPUT_FOLDER}/vehicles"
+"""Version of the vehicle extractors, to bump whenever they extract something different"""
+VEHICLES_EXTRACTOR_VERSION = 2
 VEHICLES_FIELDNAMES = ("name", "page url", "image url", "category", "type", "body style", "capacity", "speed (km/h)", "speed (mph)", "drivetrain", "modifications")
 VEHICLES_MODIFICATIONS_LIST = (
-        "armor\\n/strict/",
+        "armor/strict/",
         ["bodywork", "armor plating", "blades", "rear wheel cover", "roll cage", "spikes"],
         "boost",
         "brakes",
-        ["bumpers\\n/strict/", "front bumpers", "rear bumpers"],
+        ["bumpers/strict/", "front bumpers", "rear bumpers"],
         "cam cover",
         "canards",
         "chassis",
         "drift tuning",
-        "engine\\n/strict/",
+        "engine/strict/",
         "engine block",
         "engine covers",
         "exhaust",
@@ -63,21 +95,65 @@ VEHICLES_MODIFICATIONS_LIST = (
         "sunstrip",
         "suspension",
         "transmission",
-        "trim\\n/strict/",
+        "trim/strict/",
         "trunks",
         "turbo",
         "upgrade",
         "vertical jump",
         ["weapons", "mine"],
-        "wheels\\n/strict/",
+        "wheels/strict/",
         "wind deflectors",
         "windows"
     )
+"""Typed columns of the JSON Lines and Parquet outputs: the modifications are flattened into one count per modification"""
+VEHICLES_MODIFICATIONS_COLUMNS = tuple(dict.fromkeys(
+    modification.replace("/strict/", "")
+    for modification_item in VEHICLES_MODIFICATIONS_LIST
+    for modification in (modification_item if type(modification_item) == list else [modification_item])))
+VEHICLES_SCHEMA = {
+    "name": str,
+    "page url": str,
+    "image url": str,
+    "category": str,
+    "type": str,
+    "body style": str,
+    "capacity": int,
+    "speed (km/h)": float,
+    "speed (mph)": float,
+    "drivetrain": str,
+    "total modifications": int,
+    "theoretical total modifications": int,
+    **{f"{modification} modifications": int for modification in VEHICLES_MODIFICATIONS_COLUMNS}
+}
 
 APARTMENTS_PAGE_URL = "https://gta.fandom.com/wiki/Apartments"
 APARTMENTS_PAGE_OUTPUT = f"{SCRAPED_FOLDER}/apartments.html"
-APARTMENTS_CSV_OUTPUT = f"{OUTPUT_FOLDER}/apartments.csv"
+APARTMENTS_OUTPUT = f"{OUTPUT_FOLDER}/apartments"
+"""Version of the apartment extractors, to bump whenever they extract something different"""
+APARTMENTS_EXTRACTOR_VERSION = 2
 APARTMENTS_FIELDNAMES = ("name", "page url", "image url", "category", "style", "garage capacity", "price", "notes")
+APARTMENTS_SCHEMA = {
+    "name": str,
+    "page url": str,
+    "image url": str,
+    "category": str,
+    "style": str,
+    "garage capacity": int,
+    "price": int,
+    "notes": str
+}
+
+"""
+Tables of the SQLite dataset: the indexed columns of every list table,
+and the counts moved to a table of their own (one row per item and key, the other keys like the totals staying in the list table)
+"""
+DATASET_INDEXES = {
+    "vehicles": ("category", "type", "body style", "drivetrain", "speed (km/h)", "total modifications"),
+    "apartments": ("category", "style", "garage capacity", "price")
+}
+DATASET_DETAIL_TABLES = {
+    "vehicles": {"modifications": VEHICLES_MODIFICATIONS_COLUMNS}
+}
 
 """DEBUG VALUES"""
 VEHICLES_ITERATION_START = 0
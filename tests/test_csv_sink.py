@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.classes.apartments.apartment import Apartment
+from src.classes.shared.page_store import PageStore
+from src.classes.sinks import csv_sink
+from src.classes.sinks.csv_sink import CsvSink
+from src.classes.vehicles.vehicle import Vehicle
+from src.classes.vehicles.vehicle_record import VehicleRecord
+from src.settings import VEHICLES_FIELDNAMES, VEHICLES_SCHEMA, APARTMENTS_FIELDNAMES, APARTMENTS_SCHEMA
+
+TESTS_FOLDER = os.path.dirname(__file__)
+CORPUS_FOLDER = os.path.join(TESTS_FOLDER, "..", "benchmarks", "corpus")
+
+"""The corpus pages written in the baseline csv files, by the previous csv output, and their list data"""
+VEHICLES = ("Adder", "Buzzard_Attack_Chopper", "Deluxo", "Dinghy", "Insurgent_Pick-Up_Custom", "Kuruma_(Armored)",
+            "Oppressor_Mk_II", "T20", "Zentorno")
+APARTMENTS = (("4_Integrity_Way", "High End Apartments", 80000, ""),
+              ("Del_Perro_Heights", "High End Apartments", 200000, "Beach view"),
+              ("Dream_Tower", "Low End Apartments", 126000, "Cheap"),
+              ("Eclipse_Towers", "High End Apartments", 400000, "Penthouse"),
+              ("Weazel_Plaza", "Medium End Apartments", 315000, ""))
+
+
+class TestCsvSink(unittest.TestCase):
+    def setUp(self) -> None:
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.output_file = os.path.join(folder.name, "vehicles.csv")
+
+    def write(self, *records, fieldnames: tuple = VEHICLES_FIELDNAMES, schema: dict = VEHICLES_SCHEMA) -> list[str]:
+        with CsvSink(self.output_file, fieldnames, schema) as sink:
+            for record in records:
+                sink.write(record)
+        with open(self.output_file, "r", newline="", encoding="utf-8") as file:
+            return file.read().splitlines(keepends=True)
+
+    def assert_baseline(self, lines: list[str], baseline_name: str) -> None:
+        """Checks that csv lines are byte for byte the ones of a baseline csv file."""
+        with open(os.path.join(TESTS_FOLDER, "data", baseline_name), "r", newline="", encoding="utf-8") as file:
+            self.assertEqual(lines, file.read().splitlines(keepends=True))
+
+    @classmethod
+    def extract(cls, item, page_name: str):
+        """Extracts an item from its corpus page."""
+        with mock.patch.object(type(item), "get_scraped_page_filename", return_value=f"{CORPUS_FOLDER}/{page_name}.html"), \
+                mock.patch.object(PageStore, "open_page", side_effect=lambda page: open(page, "rb")):
+            item.get_item_data()
+        return item.record
+
+    def test_vehicles_match_the_baseline_csv(self) -> None:
+        records = [self.extract(Vehicle(page_name.replace("_", " "), f"https://gta.fandom.com/wiki/{page_name}"), page_name)
+                   for page_name in VEHICLES]
+        self.assert_baseline(self.write(*records, Vehicle("Ghost Car", "").record), "vehicles.csv")
+
+    def test_apartments_match_the_baseline_csv(self) -> None:
+        records = [self.extract(Apartment(f"{page_name.replace('_', ' ')}, Apt 7", f"https://gta.fandom.com/wiki/{page_name}",
+                                          category, price, notes), page_name)
+                   for page_name, category, price, notes in APARTMENTS]
+        records.append(Apartment("Alta Street, Apt 7", "", "Medium End Apartments", 110000, "No page").record)
+        self.assert_baseline(self.write(*records, fieldnames=APARTMENTS_FIELDNAMES, schema=APARTMENTS_SCHEMA),
+                             "apartments.csv")
+
+    def test_excel_hyperlinks_leave_records_untouched(self) -> None:
+        record = VehicleRecord("Adder", "https://gta.fandom.com/wiki/Adder")
+        record.image_url = "https://static.example/adder.png"
+        with mock.patch.object(csv_sink, "GENERATE_EXCEL_READY_CSV", True), \
+                mock.patch.object(csv_sink, "EXCEL_HYPERLINK_FORMAT", "HYPERLINK"):
+            lines = self.write(record)
+        self.assertTrue(lines[1].startswith(
+            'Adder,"=[BATCH_DELETE_THIS]HYPERLINK(""https://gta.fandom.com/wiki/Adder"";""Adder"")",'
+            '"=[BATCH_DELETE_THIS]HYPERLINK(""https://static.example/adder.png"";""Adder"")",'))
+        self.assertEqual(record.page_url, "https://gta.fandom.com/wiki/Adder")
+        self.assertEqual(record.image_url, "https://static.example/adder.png")
+
+
+if __name__ == "__main__":
+    unittest.main()
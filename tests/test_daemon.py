@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+from src.classes.shared import daemon
+from src.classes.shared.daemon import Daemon
+from src.classes.vehicles.vehicle_record import VehicleRecord
+
+
+class StubList:
+    """A list whose records never change."""
+    list_name = "vehicles"
+    list_page_url = ""
+    list_page_output = ""
+    output_name = "output/vehicles"
+    fieldnames = ("name",)
+    schema = {"name": str}
+
+    def __init__(self, page_url: str, output_file: str) -> None:
+        self.items_to_scrape = set()
+
+    def extract_list(self) -> None:
+        pass
+
+    def iter_records(self):
+        return iter([VehicleRecord("Adder", "https://gta.fandom.com/wiki/Adder")])
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self) -> None:
+        patches = (mock.patch.object(daemon.PageStore, "get_page_hash", return_value="hash"),
+                   mock.patch.object(daemon, "OUTPUT_FORMATS", ("csv", "jsonl", "changes")))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_unchanged_list_writes_an_empty_change_feed(self) -> None:
+        scraper = Daemon((StubList,))
+        with mock.patch.object(daemon, "load_data") as load_data:
+            scraper.run_list(StubList)
+            scraper.run_list(StubList)
+        self.assertEqual(load_data.call_count, 2)
+        self.assertEqual(len(load_data.call_args_list[0].args), 4)
+        self.assertEqual(load_data.call_args_list[1].args[4], ("changes",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from src.classes.vehicles.modifications_matcher import ModificationsMatcher
+
+MODIFICATIONS_TABLE = """
+<table><tbody>
+<tr><th>Modification</th><th>Armor</th></tr>
+<tr><td rowspan="3">Armor</td><td>20%</td></tr>
+<tr><td>40%</td></tr>
+<tr><td>60%</td></tr>
+<tr><td>Engine</td><td>EMS Upgrade</td></tr>
+</tbody></table>
+"""
+
+
+class TestModificationsMatcher(unittest.TestCase):
+    def test_header_strings_are_skipped(self) -> None:
+        modifications_table = BeautifulSoup(MODIFICATIONS_TABLE, "html.parser").find("tbody")
+        matcher = ModificationsMatcher(("Armor", "Engine", "Turbo"))
+        self.assertEqual(matcher.find_modifications(modifications_table), {"Armor": 3, "Engine": 1})
+        self.assertEqual(matcher.get_modifications_counts(modifications_table), ({"Armor": 3, "Engine": 1}, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.classes.shared import cache, page_store
+from src.classes.shared.cache import Cache
+from src.classes.shared.page_store import PageStore
+
+
+class TestPageStore(unittest.TestCase):
+    def setUp(self) -> None:
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        pages_folder = f"{folder.name}/pages"
+        patches = (mock.patch.object(cache, "CACHE_DATABASE", f"{folder.name}/cache.sqlite"),
+                   mock.patch.object(cache, "LEGACY_CACHE_FILE", f"{folder.name}/cache"),
+                   mock.patch.object(cache, "PAGE_STORE_FOLDER", pages_folder),
+                   mock.patch.object(page_store, "SCRAPED_FOLDER", folder.name),
+                   mock.patch.object(page_store, "PAGE_STORE_FOLDER", pages_folder),
+                   mock.patch.object(Cache, "connection", None))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.folder = folder.name
+
+    def tearDown(self) -> None:
+        if Cache.connection is not None:
+            Cache.connection.close()
+
+    def test_shared_content_survives_concurrent_rewrites(self) -> None:
+        """A page moving away from a content must not remove it while another page is being stored with it."""
+        first_page, second_page = f"{self.folder}/vehicles/adder.html", f"{self.folder}/vehicles/t20.html"
+        contents = (b"<html>first</html>", b"<html>second</html>")
+        set_page = Cache.set_page
+
+        def slow_set_page(*args):
+            """Widens the window between the storing of a content and its indexing."""
+            time.sleep(0.001)
+            return set_page(*args)
+
+        def rewrite(page_name: str, offset: int) -> None:
+            for iteration in range(100):
+                PageStore.write_page(page_name, [contents[(iteration + offset) % 2]], {})
+
+        threads = [threading.Thread(target=rewrite, args=(first_page, 0)),
+                   threading.Thread(target=rewrite, args=(second_page, 1))]
+        with mock.patch.object(Cache, "set_page", slow_set_page):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for page_hash in Cache.get_pages_hashes().values():
+            self.assertTrue(os.path.exists(PageStore.get_blob_filename(page_hash)))
+        for page_name in (first_page, second_page):
+            with PageStore.open_page(page_name) as file:
+                self.assertIn(file.read(), contents)
+
+    def test_interrupted_content_leaves_no_temporary_file(self) -> None:
+        """A stream failing partway through must not leave its partial content in the page store folder."""
+        def content():
+            yield b"<html>first chunk"
+            raise ConnectionError("connection dropped")
+
+        page_name = f"{self.folder}/vehicles/adder.html"
+        with self.assertRaises(ConnectionError):
+            PageStore.write_page(page_name, content(), {})
+        self.assertEqual([file_name for _, _, file_names in os.walk(page_store.PAGE_STORE_FOLDER)
+                          for file_name in file_names if file_name.endswith(".tmp")], [])
+        self.assertFalse(PageStore.has_page(page_name))
+
+
+if __name__ == "__main__":
+    unittest.main()
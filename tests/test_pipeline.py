@@ -0,0 +1,43 @@
+import unittest
+from unittest import mock
+
+from src.classes.vehicles.vehicle import Vehicle
+from src.functions import pipeline
+from src.functions.pipeline import iter_extracted_items
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.items = [Vehicle("Adder", "https://gta.fandom.com/wiki/Adder"),
+                      Vehicle("T20", "https://gta.fandom.com/wiki/T20"),
+                      Vehicle("Zentorno", "https://gta.fandom.com/wiki/Zentorno"),
+                      Vehicle("Pegassi Oppressor", "")]
+        self.pages = [(item.page_url, item.get_scraped_page_filename()) for item in self.items[:3]]
+        self.parsed_items = []
+        stored_pages = {self.pages[0][1], self.pages[2][1]}
+        patches = (mock.patch.object(pipeline, "get_parsing_executor", return_value=None),
+                   mock.patch.object(pipeline, "fetch_pages", return_value=self.pages[1:]),
+                   mock.patch.object(pipeline.PageStore, "has_page", side_effect=lambda page: page in stored_pages),
+                   mock.patch.object(pipeline, "parse_items", side_effect=self.parse_items),
+                   mock.patch.object(pipeline.ExtractionCache, "save"))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def parse_items(self, items: list, executor) -> set:
+        self.parsed_items.extend(item.name for item in items)
+        return set()
+
+    def test_failed_pages_without_stored_page_are_not_parsed(self) -> None:
+        failed_items = set()
+        with self.assertLogs("src.functions.pipeline", "WARNING") as logs:
+            extracted_items = list(iter_extracted_items(self.items, self.pages, {}, failed_items))
+        self.assertEqual(extracted_items, self.items)
+        self.assertEqual(self.parsed_items, ["Adder", "Zentorno", "Pegassi Oppressor"])
+        self.assertEqual(failed_items, {"T20", "Zentorno"})
+        self.assertEqual(len(logs.records), 1)
+        self.assertIsNone(extracted_items[1].record.speed_km)
+
+
+if __name__ == "__main__":
+    unittest.main()
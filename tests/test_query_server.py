@@ -0,0 +1,19 @@
+import unittest
+
+from src.classes.shared.query_server import QueryRequestHandler
+
+DATASET_FIELDS = ({"category": "category"}, {"speed": "speed (km/h)", "capacity": "capacity"})
+
+
+class TestQueryServer(unittest.TestCase):
+    def test_range_bounds_need_a_prefix(self) -> None:
+        arguments = QueryRequestHandler.get_query_arguments(
+            DATASET_FIELDS, {"min_speed": ["150"], "max_speed": ["250"], "max_capacity": ["2"]})
+        self.assertEqual(arguments["ranges"], {"speed (km/h)": (150.0, 250.0), "capacity": (None, 2.0)})
+        for parameter in ("speed", "min_max_speed", "maxspeed"):
+            with self.assertRaisesRegex(ValueError, f"Unknown parameter {parameter},"):
+                QueryRequestHandler.get_query_arguments(DATASET_FIELDS, {parameter: ["200"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
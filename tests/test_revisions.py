@@ -0,0 +1,99 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+from src.classes.shared.scraped_list import ScrapedList
+from src.functions import revisions
+from src.functions.revisions import get_latest_revisions_ids
+
+"""The wiki pages of the stand-in API: title normalizations, redirects, and the latest revision of every page"""
+NORMALIZED = {"adder": "Adder"}
+REDIRECTS = {"Zentorno (car)": "Zentorno"}
+REVISIONS = {"Adder": 101, "Zentorno": 202, "T20": 303, "Comet": 404}
+
+
+class WikiApiHandler(BaseHTTPRequestHandler):
+    """A stand-in of the MediaWiki query API, answering revisions queries like the wiki does (formatversion 2)."""
+    def do_GET(self) -> None:
+        parameters = parse_qs(urlsplit(self.path).query)
+        if self.server.failing:
+            self.send_error(404)
+            return
+        titles = parameters["titles"][0].split("|")
+        self.server.batches.append(titles)
+        query = {"normalized": [], "redirects": [], "pages": []}
+        for title in titles:
+            if title in NORMALIZED:
+                query["normalized"].append({"from": title, "to": NORMALIZED[title]})
+                title = NORMALIZED[title]
+            if title in REDIRECTS:
+                query["redirects"].append({"from": title, "to": REDIRECTS[title]})
+                title = REDIRECTS[title]
+            if title in REVISIONS:
+                query["pages"].append({"title": title, "revisions": [{"revid": REVISIONS[title]}]})
+            else:
+                query["pages"].append({"title": title, "missing": True})
+        body = json.dumps({"batchcomplete": True, "query": query}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StubList(ScrapedList):
+    """A list without items, to check its pages revisions."""
+    def extract_list(self) -> None:
+        pass
+
+    def get_items(self):
+        return iter(())
+
+    def iter_records(self):
+        return iter(())
+
+
+class TestRevisions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), WikiApiHandler)
+        self.server.batches = []
+        self.server.failing = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address[:2]
+        patches = (mock.patch.object(revisions, "WIKI_API_URL", f"http://{host}:{port}/api.php"),
+                   mock.patch.object(revisions, "WIKI_API_BATCH_SIZE", 2))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_titles_are_batched(self) -> None:
+        urls = [f"https://gta.fandom.com/wiki/{title}" for title in ("Adder", "T20", "Comet", "Zentorno", "Comet")]
+        revisions_ids = get_latest_revisions_ids(urls)
+        self.assertEqual(self.server.batches, [["Adder", "T20"], ["Comet", "Zentorno"]])
+        self.assertEqual(revisions_ids, {urls[0]: 101, urls[1]: 303, urls[2]: 404, urls[3]: 202})
+
+    def test_normalized_and_redirected_titles_map_back_to_their_urls(self) -> None:
+        urls = ["https://gta.fandom.com/wiki/adder", "https://gta.fandom.com/wiki/Zentorno_(car)",
+                "https://gta.fandom.com/wiki/Missing_Page"]
+        self.assertEqual(get_latest_revisions_ids(urls), {urls[0]: 101, urls[1]: 202})
+
+    def test_unreachable_api_keeps_every_page(self) -> None:
+        self.server.failing = True
+        pages = [("https://gta.fandom.com/wiki/Adder", "vehicles/adder.html"),
+                 ("https://gta.fandom.com/wiki/T20", "vehicles/t20.html")]
+        with self.assertLogs("src.classes.shared.scraped_list", "WARNING"):
+            self.assertEqual(StubList("", "").get_revised_pages(pages), pages)
+
+
+if __name__ == "__main__":
+    unittest.main()